@@ -21,14 +21,18 @@ __author__ = "Gabriel Barbosa Soares"
 
 # Expose main API functions
 from mann_kendall.core.mann_kendall import MKTestResult, mk_test
-from mann_kendall.core.processor import generate_mann_kendall
-from mann_kendall.data.loader import load_excel_data
+from mann_kendall.core.processor import generate_mann_kendall, generate_result_set
+from mann_kendall.core.result_set import MKResultSet
+from mann_kendall.data.loader import load_data, load_excel_data
 
 __all__ = [
     "mk_test",
     "MKTestResult",
     "generate_mann_kendall",
+    "generate_result_set",
+    "MKResultSet",
     "load_excel_data",
+    "load_data",
     "__version__",
     "__author__",
 ]
\ No newline at end of file
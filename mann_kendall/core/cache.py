@@ -2,14 +2,18 @@
 Caching utilities for Mann-Kendall calculations.
 
 This module provides caching functionality to avoid redundant calculations
-when processing identical datasets multiple times.
+when processing identical datasets multiple times. The cache is a thread-safe
+LRU whose capacity can be grown at runtime, so long-lived callers such as the
+folder watcher can size it to their workload without dropping cached results.
 """
 
-from functools import lru_cache
-from typing import Tuple
+import threading
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Tuple
 
 import numpy as np
 
+from mann_kendall.core.constants import MK_CACHE_MAX_SIZE
 from mann_kendall.core.mann_kendall import MKTestResult, mk_test
 from mann_kendall.utils.logging_config import get_logger
 
@@ -29,7 +33,63 @@ def _array_to_tuple(x: np.ndarray) -> Tuple[float, ...]:
     return tuple(x.tolist())
 
 
-@lru_cache(maxsize=256)
+class CacheInfo(NamedTuple):
+    """Cache statistics, with the same fields as functools.lru_cache's cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _ResultCache:
+    """Thread-safe LRU mapping of test arguments to results with an adjustable capacity."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, MKTestResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable):
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: Hashable, result: MKTestResult) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+_cache = _ResultCache(MK_CACHE_MAX_SIZE)
+
+
 def _mk_test_cached(
     data_tuple: Tuple[float, ...],
     alpha: float,
@@ -41,8 +101,8 @@ def _mk_test_cached(
     Cached version of Mann-Kendall test.
 
     This function converts the tuple back to numpy array and calls mk_test.
-    Results are cached using LRU cache to speed up repeated calculations
-    on identical datasets.
+    Results are kept in the LRU cache to speed up repeated calculations
+    on identical datasets. The test itself runs outside the cache lock.
 
     Args:
         data_tuple: Time series data as tuple (for hashability)
@@ -54,8 +114,12 @@ def _mk_test_cached(
     Returns:
         MKTestResult with trend analysis results
     """
-    data_array = np.array(data_tuple)
-    return mk_test(data_array, alpha, seasonal, period, calculate_slope)
+    key = (data_tuple, alpha, seasonal, period, calculate_slope)
+    result = _cache.get(key)
+    if result is None:
+        result = mk_test(np.array(data_tuple), alpha, seasonal, period, calculate_slope)
+        _cache.put(key, result)
+    return result
 
 
 def mk_test_with_cache(
@@ -107,11 +171,29 @@ def clear_cache():
     Examples:
         >>> clear_cache()  # Clear all cached results
     """
-    _mk_test_cached.cache_clear()
+    _cache.clear()
     logger.info("Mann-Kendall cache cleared")
 
 
-def get_cache_info():
+def reserve_cache_capacity(size: int) -> None:
+    """
+    Grow the cache so it can hold at least size results.
+
+    Growing never drops cached results, and the capacity never shrinks below
+    its current value, so callers can reserve room for their own workload.
+
+    Args:
+        size: Number of results the cache should be able to hold
+
+    Examples:
+        >>> reserve_cache_capacity(1500 * 40)  # 1,500 wells with 40 components
+    """
+    if size > _cache.maxsize:
+        _cache.resize(size)
+        logger.info("Mann-Kendall cache capacity raised to %d results", size)
+
+
+def get_cache_info() -> CacheInfo:
     """
     Get information about the cache performance.
 
@@ -122,4 +204,4 @@ def get_cache_info():
         >>> info = get_cache_info()
         >>> print(f"Cache hits: {info.hits}, misses: {info.misses}")
     """
-    return _mk_test_cached.cache_info()
+    return _cache.info()
@@ -26,7 +26,44 @@ DEFAULT_PERIOD = 12  # Default number of seasons (monthly data)
 
 # File Processing
 MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB maximum file size for uploads
-SUPPORTED_FILE_EXTENSIONS = ('.xlsx', '.xls')  # Supported Excel file formats
+EXCEL_FILE_EXTENSIONS = ('.xlsx', '.xls')  # Supported Excel file formats
+CSV_FILE_EXTENSIONS = ('.csv',)  # Supported delimited text formats
+PARQUET_FILE_EXTENSIONS = ('.parquet', '.pq')  # Supported Parquet formats
+FEATHER_FILE_EXTENSIONS = ('.feather', '.arrow', '.ipc')  # Supported Feather/Arrow IPC formats
+SUPPORTED_FILE_EXTENSIONS = (
+    EXCEL_FILE_EXTENSIONS + CSV_FILE_EXTENSIONS + PARQUET_FILE_EXTENSIONS + FEATHER_FILE_EXTENSIONS
+)  # All supported input formats
+CSV_CHUNK_SIZE = 10_000  # Rows parsed per chunk when reading CSV files
+PROBE_ROWS = 5  # Rows read by the fast-fail header probe before a full parse
+SUPPORTED_OUTPUT_FORMATS = ('xlsx', 'csv', 'json', 'ndjson', 'parquet', 'feather', 'sqlite')  # Result file formats
+SUPPORTED_COMPRESSIONS = ('gzip', 'zstd')  # Compressions for streamed csv/ndjson output
+EXCEL_CHUNK_ROWS = 5_000  # Rows converted per chunk by the streaming Excel writer
+RESULTS_FILE_SUFFIX = '_mann_kendall_results'  # Appended to the input name for default output files
+
+# Batch Pipeline
+PIPELINE_QUEUE_SIZE = 4  # Items buffered between asyncio pipeline stages
+RESULT_STREAM_QUEUE_SIZE = 64  # Result chunks buffered ahead of the streaming writer thread
+
+# Folder Watching
+WATCH_POLL_INTERVAL = 2.0  # Seconds between directory scans
+WATCH_QUEUE_SIZE = 100  # Maximum files waiting for a worker
+MK_CACHE_MAX_SIZE = 8192  # Minimum series results kept by the Mann-Kendall LRU cache
+WATCH_CACHE_HEADROOM = 2  # Cache room per watched series: the current and one superseded version
+
+# Streamlit Caching
+UPLOAD_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Memory budget for cached uploads and analyses
+ANALYSIS_POLL_INTERVAL = 0.5  # Seconds between progress refreshes of a background analysis
+ANALYSIS_PREVIEW_ROWS = 50  # Most recent results shown while a background analysis runs
+RESULTS_PAGE_SIZE = 100  # Rows sent to the browser per page of the results table
+WELL_SEARCH_LIMIT = 200  # Matching wells offered by the searchable well selector
+PLOT_MAX_POINTS_PER_SERIES = 1_000  # Longer plotted series are downsampled (LTTB) to this many points
+PLOT_WEBGL_THRESHOLD = 5_000  # Plots with more points than this are drawn with WebGL traces
+
+# Feedback Submission
+FEEDBACK_QUEUE_SIZE = 100  # Feedback messages waiting for the background sender
+FEEDBACK_MAX_ATTEMPTS = 4  # Attempts to send a message before it is dropped
+FEEDBACK_RETRY_BACKOFF = 2.0  # Seconds before the first retry, doubled for each further retry
+FEEDBACK_REQUEST_TIMEOUT = 10  # Seconds before a feedback request times out
 
 # Output Formatting
 DECIMAL_PLACES_STATISTIC = 4  # Decimal places for Mann-Kendall statistic
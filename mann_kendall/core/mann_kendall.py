@@ -1,8 +1,7 @@
 from enum import Enum
-from typing import NamedTuple
+from typing import NamedTuple, Tuple
 
 import numpy as np
-from scipy.stats import norm
 
 from mann_kendall.core.constants import (
     CONFIDENCE_THRESHOLD_HIGH,
@@ -27,7 +26,7 @@ from mann_kendall.core.constants import (
     TREND_PROB_INCREASING,
     ZERO_THRESHOLD,
 )
-from mann_kendall.core.sens_slope import sens_slope
+from mann_kendall.core.sens_slope import seasonal_sens_slope, sens_intercept, sens_slope
 
 
 class TrendType(str, Enum):
@@ -55,10 +54,31 @@ class MKTestResult(NamedTuple):
     coefficient_of_variation: float
     confidence_factor: float
     slope: float = 0.0
+    intercept: float = 0.0
+
+
+def _sens_line(x: np.ndarray, period: int = 1) -> Tuple[float, float]:
+    """
+    Sen's slope and intercept of a series, rounded for the results.
+
+    Args:
+        x (np.ndarray): Time series data
+        period (int): Number of seasons; the Seasonal Kendall slope is used if above 1
+
+    Returns:
+        Tuple[float, float]: (slope, intercept), (0.0, 0.0) if they cannot be calculated
+    """
+    try:
+        slope = seasonal_sens_slope(x, period) if period > 1 else sens_slope(x)
+        intercept = sens_intercept(x, slope)
+    except Exception:
+        # If slope calculation fails, we'll still return results with slope=0
+        return 0.0, 0.0
+    return round(float(slope), DECIMAL_PLACES_SLOPE), round(intercept, DECIMAL_PLACES_SLOPE)
 
 
 def _seasonal_mk_test(
-    x: np.ndarray, alpha: float = DEFAULT_ALPHA, period: int = DEFAULT_PERIOD
+    x: np.ndarray, alpha: float = DEFAULT_ALPHA, period: int = DEFAULT_PERIOD, calculate_slope: bool = True
 ) -> MKTestResult:
     """
     Performs the seasonal Mann-Kendall test for trend detection in seasonal time series data.
@@ -70,6 +90,7 @@ def _seasonal_mk_test(
         x (np.ndarray): Time series data arranged sequentially
         alpha (float): Significance level
         period (int): Number of seasons (e.g., 12 for monthly data)
+        calculate_slope (bool): Whether to calculate the Seasonal Kendall slope
 
     Returns:
         MKTestResult: Results of the seasonal Mann-Kendall test
@@ -80,7 +101,7 @@ def _seasonal_mk_test(
     # Not enough complete seasons
     if season_length < 2:
         # Fall back to regular Mann-Kendall if we don't have enough data
-        return mk_test(x, alpha, seasonal=False)
+        return mk_test(x, alpha, seasonal=False, calculate_slope=calculate_slope)
 
     total_s = 0
     total_var_s = 0
@@ -115,6 +136,8 @@ def _seasonal_mk_test(
         z = 0
 
     # Calculate p-value
+    from scipy.stats import norm
+
     p = 1 - norm.cdf(abs(z))
 
     # Coefficient of variation remains the same as non-seasonal
@@ -140,11 +163,14 @@ def _seasonal_mk_test(
             else:
                 trend = SEASONAL_TREND_DECREASING
 
+    slope, intercept = _sens_line(x, period) if calculate_slope else (0.0, 0.0)
     return MKTestResult(
         trend=trend,
         statistic=round(total_s, DECIMAL_PLACES_STATISTIC),
         coefficient_of_variation=round(cv, DECIMAL_PLACES_CV),
         confidence_factor=round(cf, DECIMAL_PLACES_CF),
+        slope=slope,
+        intercept=intercept,
     )
 
 
@@ -205,6 +231,7 @@ def mk_test(
 
     # Handle cases with very few data points
     if len(x) < 4:
+        slope, intercept = _sens_line(x) if calculate_slope else (0.0, 0.0)
         # For fewer than 4 points, we can still calculate but results are less reliable
         # Return a simple trend based on first and last values
         if len(x) == 2:
@@ -221,6 +248,8 @@ def mk_test(
                     np.std(x, ddof=1) / np.mean(x) if np.mean(x) != 0 else 0.0
                 ),
                 confidence_factor=LOW_CONFIDENCE_2_POINTS,
+                slope=slope,
+                intercept=intercept,
             )
         elif len(x) == 3:
             # Simple comparison for 3 points
@@ -238,6 +267,8 @@ def mk_test(
                     np.std(x, ddof=1) / np.mean(x) if np.mean(x) != 0 else 0.0
                 ),
                 confidence_factor=LOW_CONFIDENCE_3_POINTS,
+                slope=slope,
+                intercept=intercept,
             )
 
     # Check if input contains NaN values
@@ -246,8 +277,14 @@ def mk_test(
 
     # Check if all values are identical
     if np.all(x == x[0]):
+        # A flat line at the constant value
         return MKTestResult(
-            trend=TREND_NO_TREND, statistic=0.0, coefficient_of_variation=0.0, confidence_factor=0.0
+            trend=TREND_NO_TREND,
+            statistic=0.0,
+            coefficient_of_variation=0.0,
+            confidence_factor=0.0,
+            slope=0.0,
+            intercept=round(float(np.median(x)), DECIMAL_PLACES_SLOPE) if calculate_slope else 0.0,
         )
 
     n = len(x)
@@ -258,7 +295,7 @@ def mk_test(
             raise ValueError(f"Seasonal Mann-Kendall requires at least {period * 2} data points")
 
         # Perform seasonal Mann-Kendall test
-        return _seasonal_mk_test(x, alpha, period)
+        return _seasonal_mk_test(x, alpha, period, calculate_slope)
 
     # Calculate S more efficiently using vectorized operations
     # This is faster for large arrays compared to the nested loop approach
@@ -308,7 +345,9 @@ def mk_test(
     else:
         cv = np.std(x, ddof=1) / mean_value
 
-    # Calculate the p-value (one-tailed test)
+    # Calculate the p-value (one-tailed test); scipy.stats is imported on first use as it is slow to load
+    from scipy.stats import norm
+
     p = 1 - norm.cdf(abs(z))
 
     # We don't use this result directly, but keep the calculation for reference
@@ -334,13 +373,7 @@ def mk_test(
                 trend = TREND_DECREASING  # Strong decreasing trend
 
     # Calculate Sen's slope if requested
-    slope = 0.0
-    if calculate_slope:
-        try:
-            slope = sens_slope(x)
-        except Exception:
-            # If slope calculation fails, we'll still return results with slope=0
-            pass
+    slope, intercept = _sens_line(x) if calculate_slope else (0.0, 0.0)
 
     # Return a named tuple for better readability and type hinting
     return MKTestResult(
@@ -348,6 +381,7 @@ def mk_test(
         statistic=round(s, DECIMAL_PLACES_STATISTIC),
         coefficient_of_variation=round(cv, DECIMAL_PLACES_CV),
         confidence_factor=round(cf, DECIMAL_PLACES_CF),
-        slope=round(slope, DECIMAL_PLACES_SLOPE),
+        slope=slope,
+        intercept=intercept,
     )
 
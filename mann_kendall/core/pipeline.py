@@ -0,0 +1,182 @@
+"""
+Asyncio pipeline for batch processing many input files.
+
+Reading, analysis (parsing plus trend computation) and writing run as separate
+stages connected by bounded queues, so file I/O for one input overlaps with
+computation on another. Analysis runs in a process pool as one task per file that
+takes the raw bytes and returns only the results, so the parsed input never has to
+be pickled between processes; reading and writing run in the event loop's default
+thread pool.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from mann_kendall.core.constants import MAX_FILE_SIZE_BYTES, PIPELINE_QUEUE_SIZE
+from mann_kendall.core.processor import generate_mann_kendall
+from mann_kendall.data.loader import get_file_format, load_data
+from mann_kendall.data.writer import batch_output_files, save_results
+from mann_kendall.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+PipelineRecord = Dict[str, Any]
+
+IO_CONSUMERS = 2  # Concurrent reads and writes in the thread pool
+
+
+def _analyze(data: bytes, file_format: str, max_size: int) -> pd.DataFrame:
+    """Parse raw file bytes and run the analysis in a worker process, returning only the results frame."""
+    df = load_data(data, file_format=file_format, max_size=max_size)
+    results, _ = generate_mann_kendall(df, show_progress=False)
+    return results
+
+
+async def _stage(
+    inbox: asyncio.Queue,
+    outbox: Optional[asyncio.Queue],
+    work: Callable[[PipelineRecord], Awaitable[None]],
+    consumers: int,
+    downstream_consumers: int,
+    done: Optional[Callable[[PipelineRecord], None]] = None,
+) -> None:
+    """
+    Consume records from inbox with several concurrent consumers and forward them.
+
+    Records that already failed upstream are forwarded untouched. Each consumer stops
+    on a None sentinel; once all have stopped, one sentinel per downstream consumer
+    is sent on. Records leaving the last stage are passed to ``done``.
+    """
+
+    async def consume() -> None:
+        while True:
+            record = await inbox.get()
+            if record is None:
+                return
+            if record["error"] is None:
+                start = time.perf_counter()
+                try:
+                    await work(record)
+                except Exception as e:
+                    logger.error("Failed to process %s: %s", record["file"], e)
+                    record["error"] = str(e)
+                record["seconds"] += time.perf_counter() - start
+            if outbox is not None:
+                await outbox.put(record)
+            elif done is not None:
+                done(record)
+
+    await asyncio.gather(*(consume() for _ in range(consumers)))
+    if outbox is not None:
+        for _ in range(downstream_consumers):
+            await outbox.put(None)
+
+
+async def _run_pipeline(
+    input_files: List[str],
+    output_format: str,
+    output_dir: Optional[str],
+    max_size: int,
+    jobs: int,
+    queue_size: int,
+    on_complete: Optional[Callable[[PipelineRecord], None]],
+    run_id: Optional[str],
+    compression: Optional[str],
+) -> List[PipelineRecord]:
+    loop = asyncio.get_running_loop()
+    read_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    analyze_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    records = []
+    output_files = batch_output_files(input_files, output_format, output_dir, compression) if output_dir is not None else {}
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+
+        async def read(record: PipelineRecord) -> None:
+            path = Path(record["file"])
+            file_size = path.stat().st_size
+            if file_size > max_size:
+                # Reject before buffering the whole file in memory
+                raise ValueError(f"File too large: {file_size:,} bytes (max: {max_size:,} bytes)")
+            record["data"] = await loop.run_in_executor(None, path.read_bytes)
+
+        async def analyze(record: PipelineRecord) -> None:
+            data = record.pop("data")
+            record["results"] = await loop.run_in_executor(pool, _analyze, data, get_file_format(record["file"]), max_size)
+
+        async def write(record: PipelineRecord) -> None:
+            if output_dir is not None:
+                record["output"] = await loop.run_in_executor(
+                    None, save_results, record["results"], output_files[record["file"]], output_format, run_id, compression
+                )
+
+        def done(record: PipelineRecord) -> None:
+            # Drop intermediates left behind by a failed stage
+            record.pop("data", None)
+            if on_complete is not None:
+                on_complete(record)
+
+        async def produce() -> None:
+            for input_file in input_files:
+                record = {"file": input_file, "results": None, "output": None, "seconds": 0.0, "error": None}
+                records.append(record)
+                await read_queue.put(record)
+            for _ in range(IO_CONSUMERS):
+                await read_queue.put(None)
+
+        await asyncio.gather(
+            produce(),
+            _stage(read_queue, analyze_queue, read, IO_CONSUMERS, jobs),
+            _stage(analyze_queue, write_queue, analyze, jobs, IO_CONSUMERS),
+            _stage(write_queue, None, write, IO_CONSUMERS, 0, done),
+        )
+
+    return records
+
+
+def run_pipeline(
+    input_files: List[str],
+    output_format: str = "xlsx",
+    output_dir: Optional[str] = "",
+    max_size: int = MAX_FILE_SIZE_BYTES,
+    jobs: Optional[int] = None,
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+    on_complete: Optional[Callable[[PipelineRecord], None]] = None,
+    run_id: Optional[str] = None,
+    compression: Optional[str] = None,
+) -> List[PipelineRecord]:
+    """
+    Processes many input files through overlapping read, analyze and write stages.
+
+    Stages hand files to each other through bounded queues, so while some files are
+    being parsed and analyzed others are already being read, and finished ones are
+    being written. Up to ``jobs`` files are parsed and analyzed at once.
+
+    Args:
+        input_files: Paths of the input files
+        output_format: Output format for per-file results (default: xlsx)
+        output_dir: Directory for per-file outputs ("" for the current directory),
+            or None to keep results in memory only
+        max_size: Maximum input file size in bytes (default: 10MB)
+        jobs: Size of the process pool used for parsing and computation (default: number of CPUs)
+        queue_size: Maximum number of files buffered between stages (default: 4)
+        on_complete: Optional callback invoked with each finished record
+        run_id: Run identifier for sqlite output (default: a new run id per file)
+        compression: Optional compression for csv/ndjson output ("gzip" or "zstd")
+
+    Returns:
+        List of records (file, results, output, seconds, error) in input order
+
+    Examples:
+        >>> records = run_pipeline(["a.xlsx", "b.csv"], output_format="csv", jobs=4)
+    """
+    jobs = jobs or os.cpu_count() or 1
+    return asyncio.run(
+        _run_pipeline(input_files, output_format, output_dir, max_size, jobs, queue_size, on_complete, run_id, compression)
+    )
@@ -1,8 +1,12 @@
-from typing import Tuple
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from typing import Callable, Dict, Iterator, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from mann_kendall.core.cache import mk_test_with_cache
 from mann_kendall.core.constants import (
     MIN_SAMPLES_FOR_ANALYSIS,
     MIN_SAMPLES_PER_COMPONENT,
@@ -10,12 +14,31 @@ from mann_kendall.core.constants import (
     NOT_DETECTED_VALUE,
 )
 from mann_kendall.core.mann_kendall import mk_test
+from mann_kendall.core.result_set import MKResultSet
 from mann_kendall.data.cleaner import get_columns_with_incorrect_values, string_to_float
 from mann_kendall.utils.logging_config import get_logger
 from mann_kendall.utils.progress import print_progress_bar
 
 logger = get_logger(__name__)
 
+RESULT_COLUMNS = [
+    "Well",
+    "Analise",
+    "Trend",
+    "Mann-Kendall Statistic (S)",
+    "Coefficient of Variation",
+    "Confidence Factor",
+    "Sen's Slope",
+    "Sen's Intercept",
+]
+
+# Called after each well with (wells done, total wells, results of that well)
+ProgressCallback = Callable[[int, int, pd.DataFrame], None]
+
+
+class AnalysisCancelled(Exception):
+    """Raised when an analysis is cancelled through its cancel event."""
+
 
 def transpose_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -63,7 +86,9 @@ def transpose_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     return df_transposto
 
 
-def process_well_data(well_name: str, df_transposto: pd.DataFrame, columns: list) -> pd.DataFrame:
+def process_well_data(
+    well_name: str, df_transposto: pd.DataFrame, columns: list, use_cache: bool = False
+) -> pd.DataFrame:
     """
     Process data for a specific well and runs Mann-Kendall test for each component.
 
@@ -71,6 +96,7 @@ def process_well_data(well_name: str, df_transposto: pd.DataFrame, columns: list
         well_name (str): Name of the well to process
         df_transposto (pd.DataFrame): Transposed data containing all wells
         columns (list): List of columns (components) to analyze
+        use_cache (bool): Reuse cached results for series with identical values. Defaults to False.
 
     Returns:
         pd.DataFrame: Results of Mann-Kendall tests for this well
@@ -95,9 +121,10 @@ def process_well_data(well_name: str, df_transposto: pd.DataFrame, columns: list
                 if np.mean(values) == 0:
                     continue
                     
-                result = mk_test(values)
+                result = mk_test_with_cache(values) if use_cache else mk_test(values)
                 array = [well_name, column, result.trend, result.statistic, 
-                         result.coefficient_of_variation, result.confidence_factor]
+                         result.coefficient_of_variation, result.confidence_factor,
+                         result.slope, result.intercept]
                 results = pd.concat([results, pd.DataFrame([array])], ignore_index=True)
             # else: silently skip components with insufficient data
         except TypeError as e:
@@ -117,16 +144,17 @@ def process_well_data(well_name: str, df_transposto: pd.DataFrame, columns: list
     return results
 
 
-def generate_mann_kendall(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """
-    Processes input data and generates Mann-Kendall test results for all wells.
+def _label_results(results: pd.DataFrame) -> pd.DataFrame:
+    """Return a copy of raw per-well results with the standard result column names."""
+    if results.empty:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    labeled = results.copy()
+    labeled.columns = RESULT_COLUMNS
+    return labeled
 
-    Args:
-        df (pd.DataFrame): Input DataFrame with time series data
 
-    Returns:
-        Tuple[pd.DataFrame, pd.DataFrame]: Results DataFrame and the transposed DataFrame
-    """
+def _prepare_analysis(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series, pd.Index]:
+    """Transpose and validate input data, returning it with the wells and components to analyze."""
     df_transposto = transpose_dataframe(df)
 
     if get_columns_with_incorrect_values(df_transposto):
@@ -155,26 +183,155 @@ def generate_mann_kendall(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]
         )
 
     columns = df_transposto.columns[2:]
+    return df_transposto, wells, columns
 
-    results = pd.DataFrame()
+
+def iter_mann_kendall(
+    df: pd.DataFrame, show_progress: bool = False, use_cache: bool = False
+) -> Iterator[pd.DataFrame]:
+    """
+    Runs the Mann-Kendall analysis well by well, yielding each well's results as it completes.
+
+    Unlike generate_mann_kendall, results are not accumulated, so consumers such as
+    streaming writers can handle them in constant memory.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame with time series data
+        show_progress (bool): Whether to print a terminal progress bar. Defaults to False.
+        use_cache (bool): Reuse cached results for series with identical values. Defaults to False.
+
+    Yields:
+        pd.DataFrame: Results of one well, with the standard result columns
+    """
+    df_transposto, wells, columns = _prepare_analysis(df)
     logger.info("Starting analysis of %d wells with %d components", len(wells), len(columns))
-    print_progress_bar(0, len(wells), prefix="Processing wells:", suffix="Complete", length=50)
 
     for i, well in enumerate(wells):
-        print_progress_bar(
-            i + 1, len(wells), prefix="Processing wells:", suffix="Complete", length=50
-        )
+        if show_progress:
+            print_progress_bar(i + 1, len(wells), prefix="Processing wells:", suffix="Complete", length=50)
+        well_results = process_well_data(well, df_transposto, columns, use_cache=use_cache)
+        if not well_results.empty:
+            yield _label_results(well_results)
+
+
+def generate_mann_kendall(
+    df: pd.DataFrame,
+    show_progress: bool = True,
+    use_cache: bool = False,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Processes input data and generates Mann-Kendall test results for all wells.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame with time series data
+        show_progress (bool): Whether to print a terminal progress bar. Defaults to True.
+        use_cache (bool): Reuse cached results for (well, component) series whose values
+            are unchanged since an earlier call in this process. Defaults to False.
+        progress_callback (Optional[ProgressCallback]): Called after each well with the
+            number of wells done, the total, and the results of that well (an empty
+            frame for the initial call and for wells without results).
+        cancel_event (Optional[threading.Event]): When set, the analysis stops before
+            the next well.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: Results DataFrame and the transposed DataFrame
+
+    Raises:
+        AnalysisCancelled: If cancel_event was set before the analysis finished
+    """
+    df_transposto, wells, columns = _prepare_analysis(df)
+
+    # Per-well results are concatenated once at the end rather than after every well
+    well_frames = []
+    logger.info("Starting analysis of %d wells with %d components", len(wells), len(columns))
+    if show_progress:
+        print_progress_bar(0, len(wells), prefix="Processing wells:", suffix="Complete", length=50)
+
+    if progress_callback is not None:
+        progress_callback(0, len(wells), _label_results(pd.DataFrame()))
+
+    for i, well in enumerate(wells):
+        if cancel_event is not None and cancel_event.is_set():
+            logger.info("Analysis cancelled after %d of %d wells", i, len(wells))
+            raise AnalysisCancelled(f"Analysis cancelled after {i} of {len(wells)} wells")
+        if show_progress:
+            print_progress_bar(
+                i + 1, len(wells), prefix="Processing wells:", suffix="Complete", length=50
+            )
         logger.debug("Processing well: %s (%d/%d)", well, i + 1, len(wells))
-        well_results = process_well_data(well, df_transposto, columns)
-        results = pd.concat([results, well_results], ignore_index=True)
-
-    results.columns = [
-        "Well",
-        "Analise",
-        "Trend",
-        "Mann-Kendall Statistic (S)",
-        "Coefficient of Variation",
-        "Confidence Factor",
-    ]
+        well_results = _label_results(process_well_data(well, df_transposto, columns, use_cache=use_cache))
+        if not well_results.empty:
+            well_frames.append(well_results)
+        if progress_callback is not None:
+            progress_callback(i + 1, len(wells), well_results)
+
+    results = pd.concat(well_frames, ignore_index=True) if well_frames else _label_results(pd.DataFrame())
 
     return results, df_transposto
+
+
+def generate_result_set(df: pd.DataFrame, **kwargs) -> Tuple[MKResultSet, pd.DataFrame]:
+    """
+    Runs generate_mann_kendall and returns the results as an indexed MKResultSet.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame with time series data
+        **kwargs: Passed to generate_mann_kendall
+
+    Returns:
+        Tuple[MKResultSet, pd.DataFrame]: Result set (convert with to_frame) and the transposed DataFrame
+    """
+    results, df_transposto = generate_mann_kendall(df, **kwargs)
+    return MKResultSet.from_frame(results), df_transposto
+
+
+def generate_mann_kendall_by_sheet(
+    sheets: Dict[str, pd.DataFrame], max_workers: Optional[int] = None, show_progress: bool = True
+) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Runs generate_mann_kendall on several sheets concurrently in a process pool.
+
+    Each sheet is an independent analysis, so sheets are distributed across worker
+    processes and the per-sheet results are combined in the original sheet order.
+
+    Args:
+        sheets (Dict[str, pd.DataFrame]): Sheet name to input DataFrame, as returned by
+            load_excel_sheets
+        max_workers (Optional[int]): Size of the worker pool. Defaults to the number of CPUs.
+            A value of 1 (or a single sheet) runs in the current process.
+        show_progress (bool): Whether to print terminal progress. Defaults to True. Sheets run in
+            the current process show a progress bar per sheet; with a worker pool the parent
+            shows one bar of finished sheets instead, as bars from several workers would interleave.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]: Combined results with a leading
+        "Sheet" column, and the transposed DataFrame of each sheet
+    """
+    names = list(sheets)
+    logger.info("Analyzing %d sheets: %s", len(names), ", ".join(map(str, names)))
+
+    if len(names) <= 1 or max_workers == 1:
+        outputs = [generate_mann_kendall(sheets[name], show_progress=show_progress) for name in names]
+    else:
+        analyze = partial(generate_mann_kendall, show_progress=False)
+        by_name = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(analyze, sheets[name]): name for name in names}
+            if show_progress:
+                print_progress_bar(0, len(names), prefix="Processing sheets:", suffix="Complete", length=50)
+            for done, future in enumerate(as_completed(futures), start=1):
+                by_name[futures[future]] = future.result()
+                if show_progress:
+                    print_progress_bar(done, len(names), prefix="Processing sheets:", suffix="Complete", length=50)
+        outputs = [by_name[name] for name in names]
+
+    tagged = []
+    for name, (sheet_results, _) in zip(names, outputs):
+        sheet_results = sheet_results.copy()
+        sheet_results.insert(0, "Sheet", name)
+        tagged.append(sheet_results)
+
+    results = pd.concat(tagged, ignore_index=True) if tagged else pd.DataFrame()
+    return results, {name: transposed for name, (_, transposed) in zip(names, outputs)}
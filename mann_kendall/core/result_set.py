@@ -0,0 +1,239 @@
+"""
+Columnar storage of Mann-Kendall results.
+
+MKResultSet keeps the well, component and trend columns as integer codes into
+sorted category labels and the remaining columns as numpy arrays. Row positions
+per well and per component are indexed once, so filtering, sorting and top-k
+selection work on small integer arrays and only the rows being shown are
+converted back to a DataFrame.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from mann_kendall.core.constants import TREND_NO_TREND
+
+CATEGORICAL_COLUMNS = ("Well", "Analise", "Trend")
+
+
+def _group_rows(codes: np.ndarray, n_groups: int) -> List[np.ndarray]:
+    """Split row positions by code, each group in ascending row order."""
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(1, n_groups))
+    return np.split(order, bounds)
+
+
+class MKResultSet:
+    """
+    Mann-Kendall results with categorical codes and per-well/per-component indexes.
+
+    Row selections are numpy arrays of row positions, so filters, sorts and top-k
+    can be chained before materializing the rows with to_frame.
+
+    Examples:
+        >>> result_set = MKResultSet.from_frame(results)
+        >>> rows = result_set.filter(wells=["MW-01"], significant_only=True)
+        >>> rows = result_set.sort("Confidence Factor", ascending=False, rows=rows)
+        >>> result_set.to_frame(rows)
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], categories: Dict[str, pd.Index]):
+        """
+        Args:
+            columns: Column name to values, in column order; categorical columns hold codes
+            categories: Categorical column name to its sorted labels
+        """
+        self.columns = columns
+        self.categories = categories
+        self._length = len(next(iter(columns.values()))) if columns else 0
+        self._rows_by = {
+            name: _group_rows(columns[name], len(categories[name])) for name in ("Well", "Analise")
+        }
+
+    @classmethod
+    def from_frame(cls, results: pd.DataFrame) -> "MKResultSet":
+        """
+        Build a result set from a results DataFrame.
+
+        Args:
+            results: Mann-Kendall results as returned by generate_mann_kendall
+
+        Returns:
+            MKResultSet
+        """
+        columns, categories = {}, {}
+        for name in results.columns:
+            if name in CATEGORICAL_COLUMNS:
+                codes, labels = pd.factorize(results[name], sort=True)
+                columns[name] = codes.astype(np.int32)
+                categories[name] = labels
+            else:
+                columns[name] = results[name].to_numpy()
+        return cls(columns, categories)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns and indexes."""
+        arrays = sum(values.nbytes for values in self.columns.values())
+        indexes = sum(rows.nbytes for groups in self._rows_by.values() for rows in groups)
+        labels = sum(int(labels.memory_usage(deep=True)) for labels in self.categories.values())
+        return arrays + indexes + labels
+
+    @property
+    def wells(self) -> pd.Index:
+        """Sorted well names."""
+        return self.categories["Well"]
+
+    @property
+    def components(self) -> pd.Index:
+        """Sorted component names."""
+        return self.categories["Analise"]
+
+    @property
+    def trends(self) -> pd.Index:
+        """Sorted trend labels."""
+        return self.categories["Trend"]
+
+    def _codes(self, name: str, labels: Iterable[str]) -> np.ndarray:
+        codes = self.categories[name].get_indexer(list(labels))
+        return codes[codes >= 0]
+
+    def _indexed_mask(self, name: str, labels: Iterable[str]) -> np.ndarray:
+        mask = np.zeros(len(self), dtype=bool)
+        groups = self._rows_by[name]
+        for code in self._codes(name, labels):
+            mask[groups[code]] = True
+        return mask
+
+    def rows_for_well(self, well: str) -> np.ndarray:
+        """Row positions of one well."""
+        codes = self._codes("Well", [well])
+        return self._rows_by["Well"][codes[0]] if len(codes) else np.array([], dtype=np.intp)
+
+    def rows_for_component(self, component: str) -> np.ndarray:
+        """Row positions of one component."""
+        codes = self._codes("Analise", [component])
+        return self._rows_by["Analise"][codes[0]] if len(codes) else np.array([], dtype=np.intp)
+
+    def filter(
+        self,
+        wells: Optional[Iterable[str]] = None,
+        components: Optional[Iterable[str]] = None,
+        trends: Optional[Iterable[str]] = None,
+        min_confidence: Optional[float] = None,
+        significant_only: bool = False,
+    ) -> np.ndarray:
+        """
+        Select rows matching every given criterion.
+
+        Empty or None criteria are ignored.
+
+        Args:
+            wells: Wells to keep
+            components: Components to keep
+            trends: Trends to keep
+            min_confidence: Minimum confidence factor
+            significant_only: Drop rows with "no trend"
+
+        Returns:
+            Row positions in ascending order
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if wells:
+            mask &= self._indexed_mask("Well", wells)
+        if components:
+            mask &= self._indexed_mask("Analise", components)
+        if trends:
+            mask &= np.isin(self.columns["Trend"], self._codes("Trend", trends))
+        if significant_only:
+            mask &= self.columns["Trend"] != self.trends.get_indexer([TREND_NO_TREND])[0]
+        if min_confidence is not None:
+            mask &= self.columns["Confidence Factor"] >= min_confidence
+        return np.flatnonzero(mask)
+
+    def _sort_key(self, by: str, rows: np.ndarray) -> np.ndarray:
+        # Category labels are sorted, so codes order like their labels
+        values = self.columns[by][rows]
+        if values.dtype.kind not in "biuf":
+            codes = pd.factorize(values, sort=True)[0]
+            return np.where(codes >= 0, codes, np.nan)
+        return values.astype(float)
+
+    def sort(self, by: str, ascending: bool = True, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Order rows by one column, keeping ties in row order and missing values last.
+
+        Args:
+            by: Column to sort by
+            ascending: Sort direction
+            rows: Row positions to sort (all rows if None)
+
+        Returns:
+            Sorted row positions
+        """
+        rows = np.arange(len(self)) if rows is None else rows
+        key = self._sort_key(by, rows)
+        order = np.argsort(key if ascending else -key, kind="stable")
+        return rows[order]
+
+    def top_k(self, by: str, k: int, ascending: bool = False, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Select the k rows with the largest (or smallest) values of a column.
+
+        Args:
+            by: Column to rank by
+            k: Number of rows to return
+            ascending: Return the smallest values instead of the largest
+            rows: Row positions to rank (all rows if None)
+
+        Returns:
+            Row positions of the top k, in sorted order
+        """
+        rows = np.arange(len(self)) if rows is None else rows
+        if k <= 0:
+            return rows[:0]
+        if k < len(rows):
+            key = self._sort_key(by, rows)
+            key = np.nan_to_num(key if ascending else -key, nan=np.inf)
+            rows = rows[np.sort(np.argpartition(key, k - 1)[:k])]
+        return self.sort(by, ascending=ascending, rows=rows)
+
+    def trend_counts(self, rows: Optional[np.ndarray] = None) -> pd.Series:
+        """
+        Number of rows per trend, most frequent first.
+
+        Args:
+            rows: Row positions to count (all rows if None)
+
+        Returns:
+            pd.Series indexed by trend
+        """
+        codes = self.columns["Trend"] if rows is None else self.columns["Trend"][rows]
+        counts = pd.Series(np.bincount(codes, minlength=len(self.trends)), index=self.trends, name="count")
+        return counts[counts > 0].sort_values(ascending=False, kind="stable")
+
+    def nunique(self, name: str, rows: Optional[np.ndarray] = None) -> int:
+        """Number of distinct values of a categorical column among the rows."""
+        codes = self.columns[name] if rows is None else self.columns[name][rows]
+        return int(np.count_nonzero(np.bincount(codes, minlength=len(self.categories[name]))))
+
+    def to_frame(self, rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Materialize rows as a results DataFrame with the original columns.
+
+        Args:
+            rows: Row positions to include, in output order (all rows if None)
+
+        Returns:
+            pd.DataFrame with a fresh RangeIndex
+        """
+        data = {}
+        for name, values in self.columns.items():
+            values = values if rows is None else values[rows]
+            data[name] = self.categories[name].take(values).to_numpy() if name in self.categories else values
+        return pd.DataFrame(data)
@@ -38,3 +38,45 @@ def sens_slope(x: np.ndarray) -> float:
     
     # Return the median slope
     return np.median(slopes)
+
+
+def sens_intercept(x: np.ndarray, slope: float) -> float:
+    """
+    Calculate the intercept of Sen's trend line (Conover's estimator).
+
+    The intercept is the median of the residuals x[i] - slope * i, so the fitted
+    line is intercept + slope * i for the i-th sample.
+
+    Args:
+        x (np.ndarray): A vector of time series data.
+        slope (float): Sen's slope of x, as returned by sens_slope.
+
+    Returns:
+        float: The intercept of the trend line at the first sample.
+    """
+    return float(np.median(x - slope * np.arange(len(x))))
+
+
+def seasonal_sens_slope(x: np.ndarray, period: int) -> float:
+    """
+    Calculate the Seasonal Kendall slope estimator (Hirsch, Slack and Smith, 1982).
+
+    Only pairs of samples from the same season are compared, so seasonal swings do
+    not distort the slope. The result is per sample, like sens_slope.
+
+    Args:
+        x (np.ndarray): Time series data arranged sequentially.
+        period (int): Number of seasons.
+
+    Returns:
+        float: The median of the within-season pairwise slopes.
+    """
+    slopes = []
+    for season in range(period):
+        positions = np.arange(season, len(x), period)
+        i, j = np.triu_indices(len(positions), k=1)
+        slopes.append((x[positions[j]] - x[positions[i]]) / (positions[j] - positions[i]))
+    slopes = np.concatenate(slopes)
+    if len(slopes) == 0:
+        raise ValueError("Input array must contain at least 2 samples of one season for slope calculation")
+    return float(np.median(slopes))
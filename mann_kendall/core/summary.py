@@ -0,0 +1,130 @@
+"""
+Aggregated summary of Mann-Kendall results.
+
+The summary is a small cube of the results grouped by well, component and
+trend, holding the number of tests and the min/max/mean of the Mann-Kendall
+statistic and confidence factor of each cell. It is computed once per analysis;
+summary panels, reports and exports read from it instead of re-scanning the
+full results on every call.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from mann_kendall.core.constants import TREND_NO_TREND
+
+CUBE_KEYS = ["Well", "Analise", "Trend"]
+STATISTIC_COLUMN = "Mann-Kendall Statistic (S)"
+CONFIDENCE_COLUMN = "Confidence Factor"
+CUBE_COLUMNS = ["count", "s_min", "s_max", "s_mean", "cf_min", "cf_max", "cf_mean"]
+
+
+class ResultsSummary:
+    """
+    Counts and statistic ranges of Mann-Kendall results by well, component and trend.
+
+    Examples:
+        >>> summary = ResultsSummary.from_results(results)
+        >>> summary.trend_distribution()
+        no trend      120
+        increasing     14
+        Name: count, dtype: int64
+        >>> summary.trend_table("Well")  # One row per well, one column per trend
+    """
+
+    def __init__(self, cube: pd.DataFrame):
+        """
+        Args:
+            cube: One row per (Well, Analise, Trend) with count, s_min, s_max, s_mean,
+                cf_min, cf_max and cf_mean columns, as built by from_results
+        """
+        self.cube = cube
+        self.total = int(cube["count"].sum())
+        self._tables: Dict[str, pd.DataFrame] = {}
+
+    @classmethod
+    def from_results(cls, results: pd.DataFrame) -> "ResultsSummary":
+        """
+        Build the summary in a single grouped pass over the results.
+
+        Args:
+            results: Mann-Kendall results as returned by generate_mann_kendall
+
+        Returns:
+            ResultsSummary
+        """
+        aggregations = {"count": ("Trend", "size")}
+        for prefix, column in (("s", STATISTIC_COLUMN), ("cf", CONFIDENCE_COLUMN)):
+            if column in results.columns:
+                for stat in ("min", "max", "mean"):
+                    aggregations[f"{prefix}_{stat}"] = (column, stat)
+
+        cube = results.groupby(CUBE_KEYS, observed=True).agg(**aggregations).reset_index()
+        # Results without statistic columns still get a complete cube
+        return cls(cube.reindex(columns=CUBE_KEYS + CUBE_COLUMNS))
+
+    @property
+    def wells(self) -> list:
+        """Sorted well names."""
+        return sorted(self.cube["Well"].unique())
+
+    @property
+    def components(self) -> list:
+        """Sorted component names."""
+        return sorted(self.cube["Analise"].unique())
+
+    def _select(self, wells: Optional[Iterable[str]]) -> pd.DataFrame:
+        return self.cube if wells is None else self.cube[self.cube["Well"].isin(list(wells))]
+
+    def trend_distribution(self, wells: Optional[Iterable[str]] = None) -> pd.Series:
+        """
+        Number of tests per trend, most frequent first.
+
+        Args:
+            wells: Optional subset of wells to count
+
+        Returns:
+            pd.Series indexed by trend
+        """
+        cube = self._select(wells)
+        counts = cube.groupby("Trend", observed=True)["count"].sum()
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def significant_count(self) -> int:
+        """Number of tests with a trend other than "no trend"."""
+        return int(self.cube.loc[self.cube["Trend"] != TREND_NO_TREND, "count"].sum())
+
+    def significant_wells(self) -> list:
+        """Sorted wells with at least one trend other than "no trend"."""
+        return sorted(self.cube.loc[self.cube["Trend"] != TREND_NO_TREND, "Well"].unique())
+
+    def trend_table(self, by: str) -> pd.DataFrame:
+        """
+        Trend counts with one row per well or component and one column per trend.
+
+        Args:
+            by: "Well" or "Analise"
+
+        Returns:
+            pd.DataFrame of counts (computed once and reused)
+        """
+        if by not in self._tables:
+            self._tables[by] = self.cube.pivot_table(
+                index=by, columns="Trend", values="count", aggfunc="sum", fill_value=0
+            )
+        return self._tables[by]
+
+    def statistic_range(self) -> Tuple[float, float]:
+        """Minimum and maximum Mann-Kendall statistic."""
+        return float(self.cube["s_min"].min()), float(self.cube["s_max"].max())
+
+    def confidence_range(self) -> Tuple[float, float]:
+        """Minimum and maximum confidence factor."""
+        return float(self.cube["cf_min"].min()), float(self.cube["cf_max"].max())
+
+    def mean_confidence(self) -> float:
+        """Mean confidence factor over all tests."""
+        if not self.total:
+            return float("nan")
+        return float((self.cube["cf_mean"] * self.cube["count"]).sum() / self.total)
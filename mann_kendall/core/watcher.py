@@ -0,0 +1,254 @@
+"""
+Folder watching for continuous ingestion of monitoring data.
+
+This module provides a long-lived watcher that polls a directory for new or
+changed input files and analyzes them through a bounded queue of worker threads.
+Workers share the in-process Mann-Kendall cache, so series whose values did not
+change between versions of a file are not recomputed; the watcher grows the
+cache to hold every series of the files it has seen.
+
+The workers are threads so they can share that cache. The analysis itself is
+CPU-bound Python and numpy code that threads run largely one at a time under the
+GIL, so extra workers mainly overlap file reading and writing with analysis
+rather than analyzing several files in parallel.
+"""
+
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from mann_kendall.core.cache import get_cache_info, reserve_cache_capacity
+from mann_kendall.core.constants import (
+    MAX_FILE_SIZE_BYTES,
+    RESULTS_FILE_SUFFIX,
+    SUPPORTED_FILE_EXTENSIONS,
+    WATCH_CACHE_HEADROOM,
+    WATCH_POLL_INTERVAL,
+    WATCH_QUEUE_SIZE,
+)
+from mann_kendall.core.processor import generate_mann_kendall
+from mann_kendall.data.loader import load_data
+from mann_kendall.data.writer import default_output_file, save_results_atomic
+from mann_kendall.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+FileSignature = Tuple[int, int]  # (mtime_ns, size)
+
+
+class FolderWatcher:
+    """
+    Polls a directory and analyzes new or changed input files.
+
+    A file is queued once its size and modification time are unchanged across two
+    consecutive scans, so files still being copied are not read. Results are written
+    atomically next to each input as ``<name>_mann_kendall_results.<format>``.
+
+    Worker threads share one result cache but analyze largely one at a time under
+    the GIL (see the module docstring).
+
+    Examples:
+        >>> watcher = FolderWatcher("incoming/", output_format="csv", workers=4)
+        >>> watcher.run()  # Blocks until interrupted
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        output_format: str = "xlsx",
+        workers: int = 2,
+        queue_size: int = WATCH_QUEUE_SIZE,
+        interval: float = WATCH_POLL_INTERVAL,
+        max_size: int = MAX_FILE_SIZE_BYTES,
+    ):
+        """
+        Args:
+            directory: Directory to watch (non-recursive)
+            output_format: Output format for result files (default: xlsx)
+            workers: Number of worker threads (default: 2); they overlap I/O with
+                analysis, while the CPU-bound analysis itself is serialized by the GIL
+            queue_size: Maximum number of files waiting for a worker (default: 100)
+            interval: Seconds between directory scans (default: 2.0)
+            max_size: Maximum input file size in bytes (default: 10MB)
+        """
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"Directory not found: {directory}")
+        self.directory = directory
+        self.output_format = output_format
+        self.workers = workers
+        self.interval = interval
+        self.max_size = max_size
+        self.processed = 0
+        self.failed = 0
+
+        self._queue: queue.Queue[Optional[str]] = queue.Queue(maxsize=queue_size)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._seen: Dict[str, FileSignature] = {}  # Signature of the last queued version
+        self._pending: Dict[str, FileSignature] = {}  # Signature observed on the previous scan
+        self._queued = set()
+        self._series: Dict[str, int] = {}  # Estimated series per file, to size the result cache
+
+    def _is_input_file(self, path: Path) -> bool:
+        """Return True for supported input files, skipping hidden, lock and result files."""
+        return (
+            path.is_file()
+            and path.suffix.lower() in SUPPORTED_FILE_EXTENSIONS
+            and not path.name.startswith((".", "~$"))
+            and not path.stem.endswith(RESULTS_FILE_SUFFIX)
+        )
+
+    def _output_file(self, path: str) -> str:
+        return default_output_file(path, self.output_format, os.path.dirname(path))
+
+    def _is_up_to_date(self, path: str) -> bool:
+        """Return True if a result file newer than the input already exists."""
+        output_file = self._output_file(path)
+        return os.path.exists(output_file) and os.path.getmtime(output_file) >= os.path.getmtime(path)
+
+    def scan(self) -> List[str]:
+        """
+        Scan the directory once and queue settled new or changed files.
+
+        Files are skipped (and retried on the next scan) while the queue is full.
+
+        Returns:
+            List of files queued by this scan
+        """
+        queued = []
+        for path in sorted(Path(self.directory).iterdir()):
+            if not self._is_input_file(path):
+                continue
+            name = str(path)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+
+            if self._seen.get(name) == signature:
+                continue
+            if self._pending.get(name) != signature:
+                # Changed since the last scan (or first sighting): wait for it to settle
+                self._pending[name] = signature
+                continue
+            if name not in self._seen and self._is_up_to_date(name):
+                # Already analyzed by an earlier run
+                self._seen[name] = signature
+                continue
+
+            with self._lock:
+                if name in self._queued:
+                    continue
+                try:
+                    self._queue.put_nowait(name)
+                except queue.Full:
+                    logger.warning("Work queue full, deferring %s", name)
+                    break
+                self._queued.add(name)
+            self._seen[name] = signature
+            queued.append(name)
+            logger.info("Queued %s", name)
+
+        return queued
+
+    def process(self, path: str) -> str:
+        """
+        Analyze one input file and atomically write its results next to it.
+
+        Args:
+            path: Path to the input file
+
+        Returns:
+            Path to the result file
+        """
+        start = time.perf_counter()
+        df = load_data(path, max_size=self.max_size)
+        self._reserve_cache(path, df)
+        results, _ = generate_mann_kendall(df, show_progress=False, use_cache=True)
+        output_file = save_results_atomic(results, self._output_file(path), self.output_format)
+
+        cache_info = get_cache_info()
+        logger.info(
+            "Processed %s in %.2f seconds (%d results, cache hits: %d, misses: %d)",
+            path,
+            time.perf_counter() - start,
+            len(results),
+            cache_info.hits,
+            cache_info.misses,
+        )
+        return output_file
+
+    def _reserve_cache(self, path: str, df: pd.DataFrame) -> None:
+        """
+        Grow the result cache to hold every series of the watched files.
+
+        Twice the series count is reserved, so the results of a file's previous version
+        can stay cached while its next version is analyzed without evicting other files.
+        """
+        # Wells are the distinct names in the first row; the first two rows are well and date
+        series = df.iloc[0].nunique() * max(len(df) - 2, 0)
+        with self._lock:
+            self._series[path] = series
+            total = sum(self._series.values())
+        reserve_cache_capacity(WATCH_CACHE_HEADROOM * total)
+
+    def _worker(self) -> None:
+        while True:
+            path = self._queue.get()
+            try:
+                if path is None:
+                    return
+                with self._lock:
+                    self._queued.discard(path)
+                self.process(path)
+                with self._lock:
+                    self.processed += 1
+            except Exception as e:
+                with self._lock:
+                    self.failed += 1
+                logger.error("Failed to process %s: %s", path, e)
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"mk-watch-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Let queued files finish, then stop the worker threads."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def run(self, stop_event: Optional[threading.Event] = None) -> None:
+        """
+        Watch the directory until interrupted or until stop_event is set.
+
+        Args:
+            stop_event: Optional event used to stop the watcher from another thread
+        """
+        stop_event = stop_event or threading.Event()
+        logger.info(
+            "Watching %s every %.1f seconds with %d workers", self.directory, self.interval, self.workers
+        )
+        self.start()
+        try:
+            while not stop_event.is_set():
+                self.scan()
+                stop_event.wait(self.interval)
+        except KeyboardInterrupt:
+            logger.info("Stopping watcher")
+        finally:
+            self.stop()
+            logger.info("Watcher stopped: %d files processed, %d failed", self.processed, self.failed)
@@ -1,19 +1,143 @@
 from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO, Union
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 
 from mann_kendall.core.constants import (
+    CSV_CHUNK_SIZE,
+    CSV_FILE_EXTENSIONS,
+    EXCEL_FILE_EXTENSIONS,
+    FEATHER_FILE_EXTENSIONS,
     MAX_FILE_SIZE_BYTES,
     MIN_POINTS_FOR_RELIABLE_TEST,
     MIN_SAMPLES_PER_COMPONENT,
+    PARQUET_FILE_EXTENSIONS,
+    PROBE_ROWS,
     SUPPORTED_FILE_EXTENSIONS,
 )
 from mann_kendall.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+FileSource = Union[str, bytes, BinaryIO]
+
+FILE_FORMATS = {
+    "excel": EXCEL_FILE_EXTENSIONS,
+    "csv": CSV_FILE_EXTENSIONS,
+    "parquet": PARQUET_FILE_EXTENSIONS,
+    "feather": FEATHER_FILE_EXTENSIONS,
+}
+
+FORMAT_LABELS = {"excel": "Excel", "csv": "CSV", "parquet": "Parquet", "feather": "Feather"}
+
+
+def get_file_format(file_name: str) -> str:
+    """
+    Infers the input format from a file name or path.
+
+    Args:
+        file_name (str): File name or path with extension
+
+    Returns:
+        str: One of "excel", "csv", "parquet" or "feather"
+
+    Raises:
+        ValueError: If the extension is not supported
+
+    Examples:
+        >>> get_file_format("site_a.parquet")
+        'parquet'
+    """
+    suffix = Path(file_name).suffix.lower()
+    for file_format, extensions in FILE_FORMATS.items():
+        if suffix in extensions:
+            return file_format
+    raise ValueError(
+        f"Unsupported file type: {suffix}. "
+        f"Supported formats: {', '.join(SUPPORTED_FILE_EXTENSIONS)}"
+    )
+
+
+def _check_file_size(file_size: int, max_size: int) -> None:
+    """Raises ValueError if file_size exceeds max_size."""
+    if file_size > max_size:
+        raise ValueError(
+            f"File too large: {file_size:,} bytes (max: {max_size:,} bytes / "
+            f"{max_size / (1024 * 1024):.1f} MB)"
+        )
+
+
+def _prepare_source(
+    file_content: FileSource, extensions: Tuple[str, ...], max_size: int, label: str
+) -> Union[str, BinaryIO]:
+    """
+    Validates a path, bytes object or file-like object before it is parsed.
+
+    Paths are checked for existence, extension and size and returned unchanged so
+    readers can open (or memory-map) them directly. Bytes are size-checked and
+    wrapped in a BytesIO.
+    """
+    if isinstance(file_content, str):
+        file_path = Path(file_content)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_content}")
+        if file_path.suffix.lower() not in extensions:
+            raise ValueError(
+                f"Unsupported file type: {file_path.suffix}. "
+                f"Supported formats: {', '.join(extensions)}"
+            )
+        file_size = file_path.stat().st_size
+        _check_file_size(file_size, max_size)
+        logger.info("Loading %s file: %s (Size: %d bytes)", label, file_content, file_size)
+        return file_content
+
+    if isinstance(file_content, bytes):
+        _check_file_size(len(file_content), max_size)
+        logger.info("Loading %s file from bytes (Size: %d bytes)", label, len(file_content))
+        return BytesIO(file_content)
+
+    # Check file-like object size if it has a size attribute
+    if hasattr(file_content, 'size') and file_content.size > max_size:
+        raise ValueError(
+            f"File too large: {file_content.size:,} bytes (max: {max_size:,} bytes)"
+        )
+    return file_content
+
+
+def _load_input(
+    file_content: FileSource,
+    max_size: int,
+    extensions: Tuple[str, ...],
+    label: str,
+    read: Callable[[Union[str, BinaryIO]], Any],
+    validate: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """
+    Shared load pipeline: validate the source, parse it with ``read`` and check the layout.
+
+    All loaders return the same wide layout as ``pd.read_excel(header=None, index_col=0)``:
+    row labels (blank, date label, component names) in the index and one positional
+    column per sample. ``validate`` defaults to validate_input_format.
+    """
+    try:
+        source = _prepare_source(file_content, extensions, max_size, label)
+        df = read(source)
+        (validate or validate_input_format)(df)
+        return df
+    except pd.errors.EmptyDataError:
+        raise pd.errors.EmptyDataError(
+            "The uploaded file is empty. Please provide a file with data."
+        )
+    except pd.errors.ParserError:
+        raise pd.errors.ParserError(
+            f"Unable to parse the file. Please ensure it's a valid {label} file."
+        )
+    except ValueError as e:
+        raise ValueError(f"Invalid file format: {str(e)}")
+    except Exception as e:
+        raise type(e)(f"Error loading {label} file: {str(e)}")
+
 
 # noqa: E501
 def load_excel_data(
@@ -42,57 +166,369 @@ def load_excel_data(
         >>> df = load_excel_data("path/to/file.xlsx")
         >>> df = load_excel_data(file_bytes)
     """
+    return _load_input(
+        file_content,
+        max_size,
+        EXCEL_FILE_EXTENSIONS,
+        "Excel",
+        lambda source: pd.read_excel(source, header=None, index_col=0, engine="openpyxl"),
+    )
+
+
+def load_excel_sheets(
+    file_content: FileSource,
+    sheets: Optional[List[str]] = None,
+    max_size: int = MAX_FILE_SIZE_BYTES,
+    probe: bool = True,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Loads several sheets of an Excel workbook in a single pass.
+
+    Each sheet must follow the same layout as the single-sheet input and is
+    validated on its own. When all sheets are requested, empty sheets (e.g. notes
+    or cover pages) are skipped with a warning. Unless ``probe`` is False, the first
+    rows of every sheet are checked first, so a missing or malformed sheet fails
+    before the whole workbook is parsed.
+
+    Args:
+        file_content: File path, bytes object or file-like object with Excel data
+        sheets: Sheet names to load. None loads every sheet in the workbook.
+        max_size: Maximum allowed file size in bytes (default: 10MB)
+        probe: Whether to run the fast header probe first (default: True)
+
+    Returns:
+        Dict[str, pd.DataFrame]: Sheet name to DataFrame, in workbook order
+
+    Raises:
+        ValueError: If a sheet is missing or has an invalid format
+        FileNotFoundError: If the file doesn't exist (when path is provided)
+
+    Examples:
+        >>> sheets = load_excel_sheets("site.xlsx")
+        >>> sheets = load_excel_sheets("site.xlsx", ["Zone A", "Zone B"])
+    """
+
+    def validate(frames: Dict[str, pd.DataFrame]) -> None:
+        if not frames:
+            raise pd.errors.EmptyDataError("Workbook has no sheets with data")
+        for name, df in frames.items():
+            try:
+                validate_input_format(df)
+            except ValueError as e:
+                raise ValueError(f"Sheet '{name}': {e}")
+
+    def read(source: Union[str, BinaryIO]) -> Dict[str, pd.DataFrame]:
+        if probe:
+            heads = _probe_excel_sheets(source, PROBE_ROWS, sheets)
+            if hasattr(source, "seek"):
+                source.seek(0)
+            validate({name: df for name, df in heads.items() if sheets is not None or not df.empty})
+        frames = pd.read_excel(source, sheet_name=sheets, header=None, index_col=0, engine="openpyxl")
+        if sheets is None:
+            for name in [name for name, df in frames.items() if df.empty]:
+                logger.warning("Skipping empty sheet: %s", name)
+                del frames[name]
+        return frames
+
+    return _load_input(file_content, max_size, EXCEL_FILE_EXTENSIONS, "Excel", read, validate)
+
+
+def load_csv_data(
+    file_content: FileSource,
+    max_size: int = MAX_FILE_SIZE_BYTES,
+    chunk_size: int = CSV_CHUNK_SIZE,
+) -> pd.DataFrame:
+    """
+    Loads data from a CSV file laid out like the Excel input sheet.
+
+    The file is parsed in chunks of ``chunk_size`` rows so the parser never holds
+    more than one chunk of intermediate state. Cells are kept as strings so that
+    "ND" and "<0.01" markers reach the cleaner untouched, exactly as with Excel input.
+
+    Args:
+        file_content: File path, bytes object or file-like object with CSV data
+        max_size: Maximum allowed file size in bytes (default: 10MB)
+        chunk_size: Number of rows parsed per chunk (default: 10,000)
+
+    Returns:
+        pd.DataFrame: DataFrame in the same layout as load_excel_data
+
+    Raises:
+        pd.errors.EmptyDataError: If the file is empty
+        pd.errors.ParserError: If the file cannot be parsed as CSV
+        ValueError: If the file format is invalid or file is too large
+        FileNotFoundError: If the file doesn't exist (when path is provided)
+
+    Examples:
+        >>> df = load_csv_data("lims_export.csv")
+    """
+
+    def read(source: Union[str, BinaryIO]) -> pd.DataFrame:
+        with pd.read_csv(source, header=None, index_col=0, dtype=object, chunksize=chunk_size) as reader:
+            return pd.concat(reader)
+
+    return _load_input(file_content, max_size, CSV_FILE_EXTENSIONS, "CSV", read)
+
+
+def _arrow_table_to_frame(table) -> pd.DataFrame:
+    """
+    Converts an Arrow table holding the raw sheet grid into the loader layout.
+
+    Column names in columnar files are ignored: the first column holds the row
+    labels and the remaining columns are renumbered 1..n, matching header=None.
+    """
+    df = table.to_pandas()
+    df = df.set_index(df.columns[0])
+    df.index.name = 0
+    df.columns = range(1, len(df.columns) + 1)
+    return df
+
+
+def load_parquet_data(
+    file_content: FileSource,
+    max_size: int = MAX_FILE_SIZE_BYTES,
+) -> pd.DataFrame:
+    """
+    Loads data from a Parquet file holding the input sheet grid.
+
+    Paths are memory-mapped and bytes are wrapped without copying, so the only
+    allocation is the final DataFrame conversion.
+
+    Args:
+        file_content: File path, bytes object or file-like object with Parquet data
+        max_size: Maximum allowed file size in bytes (default: 10MB)
+
+    Returns:
+        pd.DataFrame: DataFrame in the same layout as load_excel_data
+
+    Raises:
+        ValueError: If the file format is invalid or file is too large
+        FileNotFoundError: If the file doesn't exist (when path is provided)
+
+    Examples:
+        >>> df = load_parquet_data("lims_export.parquet")
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def read(source: Union[str, BinaryIO]) -> pd.DataFrame:
+        if isinstance(source, BytesIO):
+            source = pa.BufferReader(source.getbuffer())
+        return _arrow_table_to_frame(pq.read_table(source, memory_map=isinstance(source, str)))
+
+    return _load_input(file_content, max_size, PARQUET_FILE_EXTENSIONS, "Parquet", read)
+
+
+def load_feather_data(
+    file_content: FileSource,
+    max_size: int = MAX_FILE_SIZE_BYTES,
+) -> pd.DataFrame:
+    """
+    Loads data from a Feather (Arrow IPC) file holding the input sheet grid.
+
+    Paths are memory-mapped so uncompressed files are read zero-copy; bytes are
+    wrapped in an Arrow buffer without copying.
+
+    Args:
+        file_content: File path, bytes object or file-like object with Feather data
+        max_size: Maximum allowed file size in bytes (default: 10MB)
+
+    Returns:
+        pd.DataFrame: DataFrame in the same layout as load_excel_data
+
+    Raises:
+        ValueError: If the file format is invalid or file is too large
+        FileNotFoundError: If the file doesn't exist (when path is provided)
+
+    Examples:
+        >>> df = load_feather_data("lims_export.feather")
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    def read(source: Union[str, BinaryIO]) -> pd.DataFrame:
+        if isinstance(source, BytesIO):
+            source = pa.BufferReader(source.getbuffer())
+        return _arrow_table_to_frame(feather.read_table(source, memory_map=isinstance(source, str)))
+
+    return _load_input(file_content, max_size, FEATHER_FILE_EXTENSIONS, "Feather", read)
+
+
+def _rows_to_frame(values: List[tuple]) -> pd.DataFrame:
+    """Builds the read_excel(header=None, index_col=0) layout from worksheet row values."""
+    if not values:
+        return pd.DataFrame()
+    df = pd.DataFrame(values).set_index(0)
+    df.columns = range(1, len(df.columns) + 1)
+    return df
+
+
+def _probe_excel(source: Union[str, BinaryIO], rows: int) -> pd.DataFrame:
+    """Reads the first rows of the first sheet with openpyxl's streaming reader."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
     try:
-        # Validate file extension if path is provided
-        if isinstance(file_content, str):
-            file_path = Path(file_content)
-            if not file_path.exists():
-                raise FileNotFoundError(f"File not found: {file_content}")
-            if file_path.suffix.lower() not in SUPPORTED_FILE_EXTENSIONS:
-                raise ValueError(
-                    f"Unsupported file type: {file_path.suffix}. "
-                    f"Supported formats: {', '.join(SUPPORTED_FILE_EXTENSIONS)}"
-                )
-            # Check file size
-            file_size = file_path.stat().st_size
-            if file_size > max_size:
-                raise ValueError(
-                    f"File too large: {file_size:,} bytes (max: {max_size:,} bytes / "
-                    f"{max_size / (1024 * 1024):.1f} MB)"
-                )
-            logger.info("Loading Excel file: %s (Size: %d bytes)", file_content, file_size)
-
-        if isinstance(file_content, bytes):
-            # Check byte content size
-            if len(file_content) > max_size:
-                raise ValueError(
-                    f"File too large: {len(file_content):,} bytes (max: {max_size:,} bytes / "
-                    f"{max_size / (1024 * 1024):.1f} MB)"
-                )
-            logger.info("Loading Excel file from bytes (Size: %d bytes)", len(file_content))
-            file_content = BytesIO(file_content)
-
-        # Check file-like object size if it has a size attribute
-        if hasattr(file_content, 'size') and file_content.size > max_size:
-            raise ValueError(
-                f"File too large: {file_content.size:,} bytes (max: {max_size:,} bytes)"
-            )
+        values = list(workbook.worksheets[0].iter_rows(max_row=rows, values_only=True))
+    finally:
+        workbook.close()
+    if not values:
+        raise pd.errors.EmptyDataError("Input DataFrame is empty")
+    return _rows_to_frame(values)
 
-        df = pd.read_excel(file_content, header=None, index_col=0, engine="openpyxl")
-        validate_input_format(df)
-        return df
-    except pd.errors.EmptyDataError:
-        raise pd.errors.EmptyDataError(
-            "The uploaded file is empty. Please provide a file with data."
-        )
-    except pd.errors.ParserError:
-        raise pd.errors.ParserError(
-            "Unable to parse the file. Please ensure it's a valid Excel file."
-        )
-    except ValueError as e:
-        raise ValueError(f"Invalid file format: {str(e)}")
-    except Exception as e:
-        raise type(e)(f"Error loading Excel file: {str(e)}")
+
+def _probe_excel_sheets(
+    source: Union[str, BinaryIO], rows: int, sheets: Optional[List[str]] = None
+) -> Dict[str, pd.DataFrame]:
+    """Reads the first rows of the given sheets (all if None) in one streaming pass; empty sheets give empty frames."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        names = workbook.sheetnames if sheets is None else sheets
+        missing = [name for name in names if name not in workbook.sheetnames]
+        if missing:
+            raise ValueError(f"Worksheet named '{missing[0]}' not found")
+        values = {name: list(workbook[name].iter_rows(max_row=rows, values_only=True)) for name in names}
+    finally:
+        workbook.close()
+    return {name: _rows_to_frame(sheet_values) for name, sheet_values in values.items()}
+
+
+def _probe_csv(source: Union[str, BinaryIO], rows: int) -> pd.DataFrame:
+    """Parses only the first lines of a CSV file."""
+    return pd.read_csv(source, header=None, index_col=0, dtype=object, nrows=rows)
+
+
+def _probe_parquet(source: Union[str, BinaryIO], rows: int) -> pd.DataFrame:
+    """Decodes only the first batch of a Parquet file."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if isinstance(source, BytesIO):
+        source = pa.BufferReader(source.getbuffer())
+    parquet_file = pq.ParquetFile(source, memory_map=isinstance(source, str))
+    batch = next(parquet_file.iter_batches(batch_size=rows), None)
+    if batch is None:
+        return _arrow_table_to_frame(parquet_file.schema_arrow.empty_table())
+    return _arrow_table_to_frame(pa.Table.from_batches([batch]))
+
+
+def _probe_feather(source: Union[str, BinaryIO], rows: int) -> pd.DataFrame:
+    """Reads only the first record batch of a Feather (Arrow IPC) file."""
+    import pyarrow as pa
+
+    if isinstance(source, str):
+        source = pa.memory_map(source)
+    elif isinstance(source, BytesIO):
+        source = pa.BufferReader(source.getbuffer())
+    reader = pa.ipc.open_file(source)
+    if reader.num_record_batches == 0:
+        return _arrow_table_to_frame(reader.schema.empty_table())
+    return _arrow_table_to_frame(pa.Table.from_batches([reader.get_batch(0).slice(0, rows)]))
+
+
+PROBES = {
+    "excel": _probe_excel,
+    "csv": _probe_csv,
+    "parquet": _probe_parquet,
+    "feather": _probe_feather,
+}
+
+
+def probe_input_format(
+    file_content: FileSource,
+    file_format: Optional[str] = None,
+    max_size: int = MAX_FILE_SIZE_BYTES,
+    rows: int = PROBE_ROWS,
+) -> bool:
+    """
+    Validates the layout of an input file from its first rows only.
+
+    Runs the same structural checks as validate_input_format (dates, well names,
+    component row) on the first ``rows`` rows, read with a streaming reader, so a
+    malformed upload is rejected without parsing the whole file. Those checks only
+    look at the leading rows, so the verdict matches a full parse.
+
+    Args:
+        file_content: File path, bytes object or file-like object
+        file_format: One of "excel", "csv", "parquet" or "feather". Inferred from
+            the extension when a path is given; defaults to "excel" otherwise.
+        max_size: Maximum allowed file size in bytes (default: 10MB)
+        rows: Number of leading rows to read (default: 5)
+
+    Returns:
+        bool: True if valid, raises exception otherwise
+
+    Raises:
+        ValueError: If the file format is invalid or file is too large
+        pd.errors.EmptyDataError: If the file is empty
+
+    Examples:
+        >>> probe_input_format("site.xlsx")
+        True
+    """
+    if file_format is None:
+        file_format = get_file_format(file_content) if isinstance(file_content, str) else "excel"
+    if file_format not in PROBES:
+        raise ValueError(f"Unknown file format: {file_format}. Expected one of: {', '.join(PROBES)}")
+
+    def read(source: Union[str, BinaryIO]) -> pd.DataFrame:
+        try:
+            return PROBES[file_format](source, rows)
+        finally:
+            # Leave caller-owned file objects ready for the full parse
+            if hasattr(source, "seek"):
+                source.seek(0)
+
+    _load_input(file_content, max_size, FILE_FORMATS[file_format], FORMAT_LABELS[file_format], read)
+    return True
+
+
+LOADERS = {
+    "excel": load_excel_data,
+    "csv": load_csv_data,
+    "parquet": load_parquet_data,
+    "feather": load_feather_data,
+}
+
+
+def load_data(
+    file_content: FileSource,
+    file_format: Optional[str] = None,
+    max_size: int = MAX_FILE_SIZE_BYTES,
+    probe: bool = True,
+) -> pd.DataFrame:
+    """
+    Loads input data from any supported file format.
+
+    Unless ``probe`` is False, the layout is first checked with probe_input_format
+    so malformed files fail before the full parse.
+
+    Args:
+        file_content: File path, bytes object or file-like object
+        file_format: One of "excel", "csv", "parquet" or "feather". Inferred from
+            the extension when a path is given; defaults to "excel" otherwise.
+        max_size: Maximum allowed file size in bytes (default: 10MB)
+        probe: Whether to run the fast header probe first (default: True)
+
+    Returns:
+        pd.DataFrame: DataFrame in the same layout as load_excel_data
+
+    Raises:
+        ValueError: If the format is unknown, the file is invalid or too large
+
+    Examples:
+        >>> df = load_data("lims_export.csv")
+        >>> df = load_data(uploaded.getvalue(), file_format="parquet")
+    """
+    if file_format is None:
+        file_format = get_file_format(file_content) if isinstance(file_content, str) else "excel"
+    if file_format not in LOADERS:
+        raise ValueError(f"Unknown file format: {file_format}. Expected one of: {', '.join(LOADERS)}")
+    if probe:
+        probe_input_format(file_content, file_format, max_size)
+    return LOADERS[file_format](file_content, max_size=max_size)
 
 
 def validate_input_format(df: pd.DataFrame) -> bool:
@@ -0,0 +1,584 @@
+"""
+Result writers for the Mann-Kendall package.
+
+This module saves analysis results to the supported output formats, either
+directly or atomically (write to a temporary file, then rename) so readers
+watching the output location never see a partially written file. Excel output
+is streamed through xlsxwriter's constant-memory mode so large workbooks do
+not have to be built in memory, and CSV/NDJSON output can be streamed (and
+gzip or zstd compressed) chunk by chunk from a background writer thread.
+"""
+
+import gzip
+import math
+import numbers
+import os
+import queue
+import re
+import sqlite3
+import stat
+import tempfile
+import threading
+import uuid
+from contextlib import closing, contextmanager
+from datetime import date, datetime
+from typing import IO, Callable, Dict, Iterator, List, Optional, TextIO, Union
+
+import numpy as np
+import pandas as pd
+
+from mann_kendall.core.constants import (
+    CSV_CHUNK_SIZE,
+    EXCEL_CHUNK_ROWS,
+    RESULT_STREAM_QUEUE_SIZE,
+    RESULTS_FILE_SUFFIX,
+    SUPPORTED_COMPRESSIONS,
+    SUPPORTED_OUTPUT_FORMATS,
+)
+from mann_kendall.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Output formats that can be written incrementally (and compressed)
+STREAMING_OUTPUT_FORMATS = ("csv", "ndjson")
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def infer_compression(output_file: str) -> Optional[str]:
+    """Returns the compression implied by a file name suffix (.gz or .zst), or None."""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if output_file.endswith(suffix):
+            return compression
+    return None
+
+
+def default_output_file(
+    input_file: str, output_format: str, output_dir: Optional[str] = None, compression: Optional[str] = None
+) -> str:
+    """
+    Builds the default output path for an input file.
+
+    Args:
+        input_file: Path to the input file
+        output_format: Output format extension
+        output_dir: Optional directory for the output file
+        compression: Optional compression ("gzip" or "zstd"), appended as .gz or .zst
+
+    Returns:
+        str: ``<input name>_mann_kendall_results.<format>``, inside output_dir if given
+
+    Examples:
+        >>> default_output_file("data/site.xlsx", "csv")
+        'site_mann_kendall_results.csv'
+    """
+    base_name = os.path.splitext(os.path.basename(input_file))[0]
+    output_file = f"{base_name}{RESULTS_FILE_SUFFIX}.{output_format}"
+    if compression:
+        output_file += COMPRESSION_SUFFIXES[compression]
+    return os.path.join(output_dir, output_file) if output_dir else output_file
+
+
+def batch_output_files(
+    input_files: List[str], output_format: str, output_dir: str = "", compression: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Builds distinct default output paths for the files of a batch run.
+
+    Inputs with the same name in different directories (a/site.xlsx, b/site.xlsx) would
+    share one default output; in that case every output mirrors its input's directory
+    relative to the inputs' common directory (out/a/..., out/b/...). The parent
+    directories of the outputs are created.
+
+    Args:
+        input_files: Paths of the input files
+        output_format: Output format extension
+        output_dir: Directory for the output files ("" for the current directory)
+        compression: Optional compression ("gzip" or "zstd")
+
+    Returns:
+        Dict[str, str]: Output path of each input file
+
+    Raises:
+        ValueError: If two inputs still map to one output, e.g. site.xlsx and site.csv in one directory
+
+    Examples:
+        >>> batch_output_files(["a/site.xlsx", "b/site.xlsx"], "csv", "out")
+        {'a/site.xlsx': 'out/a/site_mann_kendall_results.csv', 'b/site.xlsx': 'out/b/site_mann_kendall_results.csv'}
+    """
+    outputs = {input_file: default_output_file(input_file, output_format, output_dir, compression) for input_file in input_files}
+    if len(set(outputs.values())) < len(outputs):
+        common = os.path.commonpath([os.path.dirname(os.path.abspath(input_file)) for input_file in input_files])
+        outputs = {
+            input_file: default_output_file(
+                input_file,
+                output_format,
+                os.path.join(output_dir, os.path.relpath(os.path.dirname(os.path.abspath(input_file)), common)),
+                compression,
+            )
+            for input_file in input_files
+        }
+        outputs = {input_file: os.path.normpath(output_file) for input_file, output_file in outputs.items()}
+
+    by_output: Dict[str, List[str]] = {}
+    for input_file, output_file in outputs.items():
+        by_output.setdefault(output_file, []).append(input_file)
+    collisions = [inputs for inputs in by_output.values() if len(inputs) > 1]
+    if collisions:
+        raise ValueError(f"Input files {', '.join(collisions[0])} would be written to the same output file")
+
+    for output_file in outputs.values():
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    return outputs
+
+
+EXCEL_HEADER_FORMAT = {"bold": True, "text_wrap": True, "valign": "top", "fg_color": "#D7E4BC", "border": 1}
+EXCEL_COLUMN_WIDTH = 15
+EXCEL_DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+
+
+def _write_value(worksheet, row: int, col: int, value, date_format) -> None:
+    """Write one cell of an object column, choosing the cell type from the value."""
+    if value is None or value is pd.NaT:
+        return
+    if isinstance(value, (bool, np.bool_)):
+        worksheet.write_boolean(row, col, bool(value))
+    elif isinstance(value, numbers.Real):
+        if math.isfinite(value):
+            worksheet.write_number(row, col, value)
+    elif isinstance(value, (datetime, date)):
+        worksheet.write_datetime(row, col, value, date_format)
+    else:
+        worksheet.write_string(row, col, str(value))
+
+
+def _column_writer(series: pd.Series, worksheet, date_format) -> Callable[[int, int, object], None]:
+    """Pick a cell writer for a column from its dtype, so typed columns skip per-value dispatch."""
+    if pd.api.types.is_bool_dtype(series):
+
+        def write_bool(row, col, value):
+            worksheet.write_boolean(row, col, bool(value))
+
+        return write_bool
+
+    if pd.api.types.is_numeric_dtype(series):
+
+        def write_number(row, col, value):
+            if math.isfinite(value):
+                worksheet.write_number(row, col, value)
+
+        return write_number
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+
+        def write_datetime(row, col, value):
+            if value is not pd.NaT:
+                worksheet.write_datetime(row, col, value, date_format)
+
+        return write_datetime
+
+    return lambda row, col, value: _write_value(worksheet, row, col, value, date_format)
+
+
+def write_excel_streaming(
+    sheets: Dict[str, pd.DataFrame], target: Union[str, IO[bytes]], chunk_rows: int = EXCEL_CHUNK_ROWS
+) -> None:
+    """
+    Writes DataFrames to an Excel workbook in xlsxwriter's constant-memory mode.
+
+    Rows are flushed to disk as they are written, and each DataFrame is converted
+    to Python values one chunk of rows at a time, so peak memory stays flat as the
+    number of cells grows. Numeric, boolean and datetime columns are written with
+    typed cells; object columns are typed per value. Header cells get the bold,
+    shaded header format used by the app's exports.
+
+    Args:
+        sheets: Sheet name to DataFrame, written in order without the index
+            (reset the index first to keep it as a column)
+        target: Output path or binary file object
+        chunk_rows: Rows converted per chunk (default: 5000)
+
+    Examples:
+        >>> write_excel_streaming({"Results": results}, "results.xlsx")
+    """
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(target, {"constant_memory": True})
+    try:
+        header_format = workbook.add_format(EXCEL_HEADER_FORMAT)
+        date_format = workbook.add_format({"num_format": EXCEL_DATETIME_FORMAT})
+
+        for sheet_name, df in sheets.items():
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.set_column("A:Z", EXCEL_COLUMN_WIDTH)
+            worksheet.set_row(0, None, header_format)
+            worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+
+            for start in range(0, len(df), chunk_rows):
+                chunk = df.iloc[start : start + chunk_rows]
+                writers: List[Callable[[int, int, object], None]] = []
+                values: List[list] = []
+                for col in range(chunk.shape[1]):
+                    series = chunk.iloc[:, col]
+                    if isinstance(series.dtype, pd.DatetimeTZDtype):
+                        series = series.dt.tz_localize(None)
+                    writers.append(_column_writer(series, worksheet, date_format))
+                    values.append(series.tolist())
+
+                # constant_memory requires rows to be written strictly in order
+                for offset in range(len(chunk)):
+                    row = start + offset + 1
+                    for col, write in enumerate(writers):
+                        write(row, col, values[col][offset])
+    finally:
+        workbook.close()
+
+
+def open_text_output(output_file: str, compression: Optional[str] = None) -> TextIO:
+    """
+    Opens a text file for writing, optionally compressed.
+
+    Args:
+        output_file: Path to the output file
+        compression: None, "gzip" or "zstd" (requires the ``zstandard`` package)
+
+    Returns:
+        A writable text stream
+
+    Raises:
+        ValueError: If the compression is not supported
+        ImportError: If zstd is requested and ``zstandard`` is not installed
+    """
+    if compression is None:
+        return open(output_file, "w", encoding="utf-8", newline="")
+    if compression == "gzip":
+        return gzip.open(output_file, "wt", encoding="utf-8", newline="")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd compression requires the 'zstandard' package: pip install zstandard")
+        return zstandard.open(output_file, "wt", encoding="utf-8", newline="")
+    raise ValueError(f"Unsupported compression: {compression}. Supported: {', '.join(SUPPORTED_COMPRESSIONS)}")
+
+
+def serialize_chunk(chunk: pd.DataFrame, output_format: str, header: bool = False) -> str:
+    """
+    Serializes a chunk of results as CSV rows or NDJSON lines.
+
+    Args:
+        chunk: Results rows to serialize
+        output_format: "csv" or "ndjson"
+        header: Include the CSV header row
+
+    Returns:
+        str: The serialized rows, newline terminated
+    """
+    if output_format == "csv":
+        return chunk.to_csv(index=False, header=header)
+    if output_format == "ndjson":
+        if chunk.empty:
+            return ""
+        lines = chunk.to_json(orient="records", lines=True, date_format="iso")
+        return lines if lines.endswith("\n") else lines + "\n"
+    raise ValueError(f"Unsupported streaming format: {output_format}")
+
+
+class StreamingResultWriter:
+    """
+    Writes results to CSV or NDJSON chunk by chunk from a background thread.
+
+    Chunks are handed over through a bounded queue, so serialization, compression
+    and disk writes overlap with the computation producing the next chunk, and
+    memory holds at most ``queue_size`` chunks regardless of the number of results.
+
+    Examples:
+        >>> with StreamingResultWriter("results.ndjson.gz", "ndjson", "gzip") as writer:
+        ...     for well_results in iter_mann_kendall(df):
+        ...         writer.write(well_results)
+    """
+
+    def __init__(
+        self,
+        output_file: str,
+        output_format: str,
+        compression: Optional[str] = None,
+        queue_size: int = RESULT_STREAM_QUEUE_SIZE,
+    ):
+        """
+        Args:
+            output_file: Path to the output file
+            output_format: "csv" or "ndjson"
+            compression: None, "gzip" or "zstd"
+            queue_size: Maximum chunks waiting to be written (default: 64)
+        """
+        if output_format not in STREAMING_OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported streaming format: {output_format}")
+        self.output_file = output_file
+        self.output_format = output_format
+        self.rows = 0
+        self._stream = open_text_output(output_file, compression)
+        self._queue: queue.Queue[Optional[pd.DataFrame]] = queue.Queue(maxsize=queue_size)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="mk-result-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        header = True
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            if self._error is not None:
+                continue  # Drain the queue so producers never block after a failure
+            try:
+                self._stream.write(serialize_chunk(chunk, self.output_format, header=header))
+                header = False
+            except BaseException as e:
+                self._error = e
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """Queue a chunk of results; blocks while the queue is full."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(chunk)
+        self.rows += len(chunk)
+
+    def close(self) -> None:
+        """Flush queued chunks, close the file and re-raise any write error."""
+        self._queue.put(None)
+        self._thread.join()
+        self._stream.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "StreamingResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+# Result columns stored as categories in typed formats (parquet, feather, sqlite)
+CATEGORICAL_RESULT_COLUMNS = ("Source File", "Sheet", "Well", "Analise", "Trend")
+
+SQLITE_RESULTS_TABLE = "mann_kendall_results"
+SQLITE_RUNS_TABLE = "mann_kendall_runs"
+SQL_COLUMN_NAMES = {
+    "Analise": "component",
+    "Mann-Kendall Statistic (S)": "statistic",
+    "Sen's Slope": "sens_slope",
+    "Sen's Intercept": "sens_intercept",
+}
+
+
+def typed_results(results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns results with explicit column types for columnar and database outputs.
+
+    Identifier columns (well, component, trend, sheet, source file) become
+    categoricals of strings; all other columns are converted to float where possible.
+
+    Args:
+        results: DataFrame with Mann-Kendall test results
+
+    Returns:
+        pd.DataFrame: A typed copy with a default index
+    """
+    typed = results.reset_index(drop=True)
+    for column in typed.columns:
+        if column in CATEGORICAL_RESULT_COLUMNS:
+            typed[column] = typed[column].astype(str).astype("category")
+        else:
+            converted = pd.to_numeric(typed[column], errors="coerce")
+            if converted.notna().sum() == typed[column].notna().sum():
+                typed[column] = converted.astype("float64")
+    return typed
+
+
+def new_run_id() -> str:
+    """Returns a sortable unique identifier for a results run, e.g. ``20240131T120000-1a2b3c4d``."""
+    return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+def _sql_column(name: str) -> str:
+    """Maps a result column name to a snake_case SQL column name."""
+    if name in SQL_COLUMN_NAMES:
+        return SQL_COLUMN_NAMES[name]
+    return re.sub(r"[^0-9a-z]+", "_", str(name).lower()).strip("_")
+
+
+def save_results_sqlite(results: pd.DataFrame, output_file: str, run_id: Optional[str] = None) -> str:
+    """
+    Appends results to a SQLite database as one run.
+
+    Rows go to the ``mann_kendall_results`` table with a ``run_id`` column, and each
+    run is recorded in ``mann_kendall_runs``. Tables and indexes on well, component
+    and run id are created on first use; columns missing from an existing table are
+    added, so runs with extra result columns can be appended. The whole run is
+    written in one transaction.
+
+    Args:
+        results: DataFrame with Mann-Kendall test results
+        output_file: Path to the SQLite database (created if missing)
+        run_id: Identifier for this run (default: new_run_id())
+
+    Returns:
+        str: The output file path
+    """
+    run_id = run_id or new_run_id()
+    typed = typed_results(results)
+    columns = ["run_id"] + [_sql_column(column) for column in typed.columns]
+    types = ["TEXT"] + [
+        "REAL" if pd.api.types.is_float_dtype(typed[column]) else "TEXT" for column in typed.columns
+    ]
+
+    with closing(sqlite3.connect(output_file)) as conn, conn:
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {SQLITE_RUNS_TABLE} "
+            "(run_id TEXT PRIMARY KEY, created_at TEXT NOT NULL, result_count INTEGER NOT NULL)"
+        )
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({SQLITE_RESULTS_TABLE})")}
+        if not existing:
+            definitions = ", ".join(f'"{column}" {sql_type}' for column, sql_type in zip(columns, types))
+            conn.execute(f"CREATE TABLE {SQLITE_RESULTS_TABLE} ({definitions})")
+        else:
+            for column, sql_type in zip(columns, types):
+                if column not in existing:
+                    conn.execute(f'ALTER TABLE {SQLITE_RESULTS_TABLE} ADD COLUMN "{column}" {sql_type}')
+        for column in ("run_id", "well", "component"):
+            if column in columns:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{SQLITE_RESULTS_TABLE}_{column} "
+                    f'ON {SQLITE_RESULTS_TABLE} ("{column}")'
+                )
+
+        placeholders = ", ".join("?" * len(columns))
+        names = ", ".join(f'"{column}"' for column in columns)
+        rows = zip([run_id] * len(typed), *(typed[column].tolist() for column in typed.columns))
+        conn.executemany(f"INSERT INTO {SQLITE_RESULTS_TABLE} ({names}) VALUES ({placeholders})", rows)
+        conn.execute(
+            f"INSERT INTO {SQLITE_RUNS_TABLE} (run_id, created_at, result_count) VALUES (?, ?, ?)",
+            (run_id, datetime.now().isoformat(timespec="seconds"), len(typed)),
+        )
+
+    logger.info("Appended %d results to %s as run %s", len(typed), output_file, run_id)
+    return output_file
+
+
+def save_results(
+    results: pd.DataFrame,
+    output_file: str,
+    output_format: str,
+    run_id: Optional[str] = None,
+    compression: Optional[str] = None,
+) -> str:
+    """
+    Saves results in the requested format.
+
+    Args:
+        results: DataFrame with Mann-Kendall test results
+        output_file: Path to the output file
+        output_format: One of SUPPORTED_OUTPUT_FORMATS
+        run_id: Run identifier for the sqlite format (default: a new run id)
+        compression: Compression for csv/ndjson (default: inferred from a .gz/.zst suffix)
+
+    Returns:
+        str: The output file path
+
+    Raises:
+        ValueError: If the output format is not supported
+    """
+    logger.info("Saving results to: %s", output_file)
+    if output_format == "xlsx":
+        write_excel_streaming({"Sheet1": results}, output_file)
+    elif output_format in STREAMING_OUTPUT_FORMATS:
+        with StreamingResultWriter(output_file, output_format, compression or infer_compression(output_file)) as writer:
+            # At least one (possibly empty) chunk, so an empty CSV still gets its header
+            for start in range(0, max(len(results), 1), CSV_CHUNK_SIZE):
+                writer.write(results.iloc[start : start + CSV_CHUNK_SIZE])
+    elif output_format == "json":
+        results.to_json(output_file, orient="records", indent=2)
+    elif output_format == "parquet":
+        typed_results(results).to_parquet(output_file, index=False)
+    elif output_format == "feather":
+        typed_results(results).to_feather(output_file)
+    elif output_format == "sqlite":
+        save_results_sqlite(results, output_file, run_id)
+    else:
+        raise ValueError(
+            f"Unsupported output format: {output_format}. Supported formats: {', '.join(SUPPORTED_OUTPUT_FORMATS)}"
+        )
+    return output_file
+
+
+# Process umask, read once at import: reading it means setting it, which is not thread-safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _output_mode(output_file: str) -> int:
+    """Permission bits for output_file: those of the file it replaces, else what open() would give."""
+    try:
+        return stat.S_IMODE(os.stat(output_file).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_output_path(output_file: str, output_format: str) -> Iterator[str]:
+    """
+    Yields a temporary path next to output_file that replaces it once the block succeeds.
+
+    The temporary file is hidden (leading dot) and keeps the format extension so
+    writers that infer the engine still work. mkstemp creates it readable by the owner
+    only, so before the rename it gets the permissions of the file it replaces (or the
+    umask default for a new file). If the block raises, the temporary file is removed
+    and any existing output_file is left untouched.
+
+    Args:
+        output_file: Final path of the output file
+        output_format: Output format extension
+
+    Examples:
+        >>> with atomic_output_path("results.csv", "csv") as tmp_path:
+        ...     results.to_csv(tmp_path)
+    """
+    directory = os.path.dirname(os.path.abspath(output_file))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=f".tmp.{output_format}")
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.chmod(tmp_path, _output_mode(output_file))
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def save_results_atomic(results: pd.DataFrame, output_file: str, output_format: str) -> str:
+    """
+    Saves results through a temporary file in the same directory, then renames it.
+
+    The rename is atomic on the same filesystem, so other processes see either the
+    previous file or the complete new one (see atomic_output_path). SQLite output
+    appends to an existing database inside a transaction instead.
+
+    Args:
+        results: DataFrame with Mann-Kendall test results
+        output_file: Final path of the output file
+        output_format: One of SUPPORTED_OUTPUT_FORMATS
+
+    Returns:
+        str: The output file path
+    """
+    if output_format == "sqlite":
+        # Replacing the file would drop earlier runs; the transaction is already atomic
+        return save_results(results, output_file, output_format)
+
+    with atomic_output_path(output_file, output_format) as tmp_path:
+        save_results(results, tmp_path, output_format, compression=infer_compression(output_file))
+    return output_file
@@ -6,15 +6,37 @@ from typing import Tuple
 
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
-from mann_kendall.core.processor import generate_mann_kendall
+from mann_kendall.core.constants import ANALYSIS_POLL_INTERVAL
+from mann_kendall.core.summary import ResultsSummary
 from mann_kendall.data.cleaner import get_columns_with_incorrect_values
-from mann_kendall.data.loader import check_data_sufficiency, load_excel_data
+from mann_kendall.data.loader import check_data_sufficiency, get_file_format
+from mann_kendall.ui.cache import (
+    analyze_upload,
+    content_hash,
+    get_analysis,
+    get_plot_data,
+    get_result_set,
+    get_summary,
+    get_well_index,
+    hold_analysis,
+    is_analysis_cached,
+    load_upload,
+)
 from mann_kendall.ui.download import create_enhanced_download_section
 from mann_kendall.ui.feedback import create_feedback_section
+from mann_kendall.ui.jobs import CANCELLED, DONE, AnalysisJob, release_analysis, start_analysis
+from mann_kendall.ui.overview import display_site_overview
 from mann_kendall.ui.visualizer import create_trend_plot, display_results_table
 
 
+def get_session_id() -> str:
+    """Return the id of the current Streamlit session, used to pin shared results."""
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "default"
+
+
 def validate_file_format(df: pd.DataFrame) -> Tuple[bool, str]:
     """
     Validate if the uploaded file has the correct format.
@@ -74,9 +96,9 @@ def main() -> None:
         st.caption("Maximum file size: 200MB")
 
         file_upload = st.file_uploader(
-            label="Upload Excel File",
-            type=["xlsx", "xls"],
-            help="Upload your Excel file with time series data",
+            label="Upload Data File",
+            type=["xlsx", "xls", "csv", "parquet", "feather"],
+            help="Upload your Excel, CSV, Parquet or Feather file with time series data",
         )
 
         # Show input format example with better formatting
@@ -118,17 +140,31 @@ def main() -> None:
         create_feedback_section()
 
     # Initialize session state for data persistence
-    if "processed_data" not in st.session_state:
-        st.session_state.processed_data = None
-        st.session_state.results = None
+    # Results live in the shared result store; the session keeps only their content hash
+    if "results_key" not in st.session_state:
+        st.session_state.results_key = None
         st.session_state.last_file_id = None
+        st.session_state.upload_id = None
+        st.session_state.upload_hash = None
+        st.session_state.analysis_job = None
+
+    # Stop a background analysis whose file was removed
+    if not file_upload and st.session_state.analysis_job is not None:
+        release_analysis(st.session_state.analysis_job, get_session_id())
+        st.session_state.analysis_job = None
 
     # Process data when file is uploaded
     if file_upload:
         try:
             # Step 1: Load and validate data
+            # Hash the content once per upload; reruns reuse the hash and the cached parse
+            if st.session_state.upload_id != file_upload.file_id:
+                st.session_state.upload_hash = content_hash(file_upload.getvalue())
+                st.session_state.upload_id = file_upload.file_id
+            file_hash = st.session_state.upload_hash
+
             with st.spinner("📂 Loading your file..."):
-                df = load_excel_data(file_upload.getvalue())
+                df = load_upload(file_upload.getvalue(), get_file_format(file_upload.name), file_hash)
 
             # Step 2: Validate file format
             is_valid, error_msg = validate_file_format(df)
@@ -146,8 +182,8 @@ def main() -> None:
                 st.info(f"ℹ️ **Data Quality Note:** {warning_msg}")
 
             # Step 4: Detect new file and determine if analysis should run
-            # Create unique identifier for the current file
-            current_file_id = f"{file_upload.name}_{file_upload.size}" if file_upload else None
+            # Identify the current file by its content hash
+            current_file_id = file_hash
             is_new_file = (current_file_id != st.session_state.last_file_id) and current_file_id is not None
 
             # Determine if we should run analysis (auto or manual)
@@ -168,54 +204,36 @@ def main() -> None:
                 should_analyze = True
 
             # Step 5: Run analysis if triggered
+            job = st.session_state.analysis_job
+            if job is not None and job.file_hash != file_hash:
+                # A different file was uploaded: stop following the old analysis
+                release_analysis(job, get_session_id())
+                st.session_state.analysis_job = job = None
+
             if should_analyze:
-                # Create progress bar
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-
-                try:
-                    # Step 6: Process the data with progress updates
-                    status_text.text("🔄 Transposing and cleaning data...")
-                    progress_bar.progress(25)
-
-                    results, dataframe = generate_mann_kendall(df)
-                    progress_bar.progress(75)
-
-                    status_text.text("✅ Analysis complete!")
-                    progress_bar.progress(100)
-
-                    # Store results in session state
-                    st.session_state.results = results
-                    st.session_state.processed_data = dataframe
-                    st.session_state.last_file_id = current_file_id
-
-                    # Clear progress indicators
-                    progress_bar.empty()
-                    status_text.empty()
-
-                    # Success message with summary
-                    st.success(
-                        f"""
-                    🎉 **Analysis Complete!**
-                    - Processed **{len(results.Well.unique())} wells**
-                    - Analyzed **{len(results)} well-component combinations**
-                    - Found **{len(results[results.Trend != "no trend"])} significant trends**
-                    """
-                    )
-
-                    # Check for data quality issues
-                    if get_columns_with_incorrect_values(dataframe):
-                        st.warning(
-                            """
-                        ⚠️ **Data Quality Notice:** Some values in your data couldn't be converted to numbers.
-                        These have been handled automatically, but you may want to review your source data for accuracy.
-                        """
-                        )
-
-                except Exception as e:
-                    progress_bar.empty()
-                    status_text.empty()
-                    raise e
+                st.session_state.last_file_id = current_file_id
+                if is_analysis_cached(file_hash):
+                    analyze_upload(file_hash, df)
+                    show_analysis_complete(file_hash)
+                elif job is None or not job.is_running:
+                    # Run in the background (shared with sessions analyzing the same file)
+                    hold_analysis(None, get_session_id(), previous=st.session_state.results_key)
+                    st.session_state.results_key = None
+                    st.session_state.analysis_job = start_analysis(file_hash, df, get_session_id(), job)
+
+            # Step 6: Follow the background analysis of this file
+            job = st.session_state.analysis_job
+            if job is not None:
+                if job.is_running:
+                    display_analysis_progress(job)
+                else:
+                    st.session_state.analysis_job = None
+                    if job.status == DONE:
+                        show_analysis_complete(file_hash)
+                    elif job.status == CANCELLED:
+                        st.warning("⏹️ **Analysis cancelled.** Use the button above to run it again.")
+                    elif job.error is not None:
+                        raise job.error
 
         except pd.errors.EmptyDataError:
             st.error("❌ **Empty File:** The uploaded file contains no data. Please check your file and try again.")
@@ -233,25 +251,27 @@ def main() -> None:
             st.error(f"❌ **Unexpected Error:** {str(e)}")
             st.info("💡 If this persists, please check your data format or contact support.")
 
-    # Display results if they exist in session state
-    if st.session_state.results is not None and st.session_state.processed_data is not None:
+    # Display results if the session holds an analysis
+    analysis = get_analysis(st.session_state.results_key) if st.session_state.results_key else None
+    if analysis is not None:
+        results_key = st.session_state.results_key
         st.divider()
 
         # Add enhanced download section to sidebar
         with st.sidebar:
-            create_enhanced_download_section(st.session_state.results, st.session_state.processed_data)
+            download_fragment(results_key)
 
-        # Create tabs for different views
+        # Create tabs for different views; interactive panels rerun independently as fragments
         tab1, tab2, tab3 = st.tabs(["📈 Visualization", "📋 Results Table", "📊 Summary"])
 
         with tab1:
-            create_trend_plot(st.session_state.results, st.session_state.processed_data)
+            visualization_fragment(results_key)
 
         with tab2:
-            display_results_table(st.session_state.results)
+            results_table_fragment(results_key)
 
         with tab3:
-            display_summary_statistics(st.session_state.results)
+            display_summary_statistics(get_summary(results_key, analysis[0]))
 
     elif not file_upload:
         # Show welcome screen when no file is uploaded
@@ -290,28 +310,119 @@ def main() -> None:
         st.info("👆 **Ready to get started?** Upload your Excel file using the sidebar to begin your trend analysis!")
 
 
-def display_summary_statistics(results: pd.DataFrame) -> None:
-    """Display summary statistics and insights from the analysis."""
+def show_analysis_complete(file_hash: str) -> None:
+    """Pin finished analysis results for the session and report a summary."""
+    hold_analysis(file_hash, get_session_id(), previous=st.session_state.results_key)
+    st.session_state.results_key = file_hash
+    analysis = get_analysis(file_hash)
+    if analysis is None:
+        hold_analysis(None, get_session_id(), previous=file_hash)
+        st.session_state.results_key = None
+        st.warning("⚠️ The results were evicted from memory before they could be shown. Please re-run the analysis.")
+        return
+    results, dataframe = analysis
+    summary = get_summary(file_hash, results)
+
+    # Success message with summary
+    st.success(
+        f"""
+    🎉 **Analysis Complete!**
+    - Processed **{len(summary.wells)} wells**
+    - Analyzed **{summary.total} well-component combinations**
+    - Found **{summary.significant_count()} significant trends**
+    """
+    )
+
+    # Check for data quality issues
+    if get_columns_with_incorrect_values(dataframe):
+        st.warning(
+            """
+        ⚠️ **Data Quality Notice:** Some values in your data couldn't be converted to numbers.
+        These have been handled automatically, but you may want to review your source data for accuracy.
+        """
+        )
+
+
+@st.fragment(run_every=ANALYSIS_POLL_INTERVAL)
+def display_analysis_progress(job: AnalysisJob) -> None:
+    """Poll a running background analysis, showing its progress and partial results."""
+    if not job.is_running:
+        # Rerun the whole app to pick up the outcome
+        st.rerun()
+
+    done, total = job.progress
+    st.progress(done / total if total else 0.0, text=f"🔄 Analyzing wells: {done} of {total}")
+
+    if st.button("⏹️ Cancel Analysis"):
+        # Stop following the job; it is cancelled unless another session follows it
+        release_analysis(job, get_session_id())
+        st.session_state.analysis_job = None
+        st.rerun()
+
+    partial = job.partial_results
+    if partial is not None and not partial.empty:
+        st.caption(
+            f"Partial results: {job.result_count} well-component combinations so far "
+            f"(showing the latest {len(partial)})"
+        )
+        st.dataframe(partial, use_container_width=True, hide_index=True)
+
+
+# Fragments take the results key rather than frames: Streamlit keeps fragment arguments
+# between fragment reruns, and the frames stay in the shared result store.
+
+
+@st.fragment
+def visualization_fragment(results_key: str) -> None:
+    """Site overview and trend plot panel; changing a plot option or clicking the overview reruns only this fragment."""
+    analysis = get_analysis(results_key)
+    if analysis is not None:
+        with st.expander("🗺️ Site Overview: all wells × components", expanded=True):
+            display_site_overview(get_result_set(results_key))
+        create_trend_plot(
+            *analysis,
+            summary=get_summary(results_key),
+            plot_data=get_plot_data(results_key),
+            well_index=get_well_index(results_key),
+        )
+
+
+@st.fragment
+def results_table_fragment(results_key: str) -> None:
+    """Results table panel; changing a filter reruns only this fragment."""
+    result_set = get_result_set(results_key)
+    if result_set is not None:
+        display_results_table(result_set, well_index=get_well_index(results_key))
+
+
+@st.fragment
+def download_fragment(results_key: str) -> None:
+    """Sidebar export section; choosing a format or preparing an export reruns only this fragment."""
+    analysis = get_analysis(results_key)
+    if analysis is not None:
+        create_enhanced_download_section(*analysis, results_key=results_key)
+
+
+def display_summary_statistics(summary: ResultsSummary) -> None:
+    """Display summary statistics and insights from the precomputed results summary."""
     st.subheader("📊 Analysis Summary")
 
     # Overall statistics
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("Total Wells", len(results.Well.unique()))
+        st.metric("Total Wells", len(summary.wells))
     with col2:
-        st.metric("Components", len(results.Analise.unique()))
+        st.metric("Components", len(summary.components))
     with col3:
-        st.metric("Total Tests", len(results))
+        st.metric("Total Tests", summary.total)
     with col4:
-        significant_trends = len(results[results.Trend != "no trend"])
-        st.metric("Significant Trends", significant_trends)
+        st.metric("Significant Trends", summary.significant_count())
 
     # Component analysis
-    if len(results.Analise.unique()) > 1:
+    if len(summary.components) > 1:
         st.subheader("🧪 Component Analysis")
-        component_trends = results.groupby(["Analise", "Trend"]).size().unstack(fill_value=0)
-        st.dataframe(component_trends, use_container_width=True)
+        st.dataframe(summary.trend_table("Analise"), use_container_width=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,397 @@
+"""
+Caching of upload parsing and analysis for the Streamlit app.
+
+Every widget interaction reruns the app script, and several sessions often
+open the same workbook. Parsed uploads and analysis results are kept in a
+process-wide store keyed by a hash of the uploaded bytes, so reruns and
+sessions with the same content share one computation and one in-memory copy.
+Sessions keep only the content hash and pin the results they display; the
+store is bounded by the approximate memory size of its entries and evicts
+unpinned entries least recently used first.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+import pandas as pd
+
+from mann_kendall.core.constants import UPLOAD_CACHE_MAX_BYTES
+from mann_kendall.core.processor import ProgressCallback, generate_mann_kendall
+from mann_kendall.core.result_set import MKResultSet
+from mann_kendall.core.summary import ResultsSummary
+from mann_kendall.data.loader import load_data
+from mann_kendall.ui.plot_data import PlotDataStore
+from mann_kendall.ui.well_selector import WellIndex
+from mann_kendall.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def estimate_nbytes(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value.
+
+    DataFrames are measured with ``memory_usage(deep=True)``, arrays and result sets
+    report ``nbytes``, tuples and lists are summed element-wise, and anything else
+    falls back to ``sys.getsizeof``.
+
+    Args:
+        value: The value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ResultStore:
+    """
+    Thread-safe, content-addressed store bounded by the total estimated size of its values.
+
+    Entries can be held by any number of holders (Streamlit sessions); held entries
+    are never evicted, and unheld entries are evicted least recently used first once
+    the byte budget is exceeded. Concurrent get_or_compute calls for the same key
+    share a single computation.
+    """
+
+    def __init__(self, max_bytes: int, is_holder_alive: Optional[Callable[[Hashable], bool]] = None):
+        """
+        Args:
+            max_bytes: Memory budget; unheld least recently used entries are evicted beyond it
+            is_holder_alive: Optional check used to drop holders that went away without
+                releasing their entries (e.g. closed browser tabs) before evicting
+        """
+        self.max_bytes = max_bytes
+        self.is_holder_alive = is_holder_alive
+        self._entries: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+        self._holders: Dict[Hashable, Set[Hashable]] = {}
+        self._computing: Dict[Hashable, threading.Lock] = {}
+        self._size = 0
+        self._lock = threading.RLock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total estimated size of the stored values in bytes."""
+        return self._size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the stored value for key (marking it recently used), or default."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None) -> None:
+        """
+        Store a value, evicting unheld least recently used entries to stay within budget.
+
+        The value just stored is kept even if it alone exceeds the budget, so its
+        caller can still pin it; it is evicted later once unheld.
+        """
+        nbytes = estimate_nbytes(value) if nbytes is None else nbytes
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes)
+            self._size += nbytes
+            self._evict(keep=key)
+
+    def _evict(self, keep: Optional[Hashable] = None) -> None:
+        if self._size <= self.max_bytes:
+            return
+        if self.is_holder_alive is not None:
+            # Unpin entries held only by sessions that are gone
+            for key, holders in list(self._holders.items()):
+                alive = {holder for holder in holders if self.is_holder_alive(holder)}
+                if alive:
+                    self._holders[key] = alive
+                else:
+                    del self._holders[key]
+        for key in list(self._entries):
+            if self._size <= self.max_bytes:
+                return
+            if key in self._holders or key == keep:
+                continue
+            _, nbytes = self._entries.pop(key)
+            self._size -= nbytes
+            logger.debug("Evicted %s from cache (%d bytes)", key, nbytes)
+        logger.warning("Cache over budget: %d bytes held by active sessions", self._size)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the stored value for key, computing and storing it on a miss.
+
+        If another thread is already computing the same key, wait for its result
+        instead of computing it again.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            key_lock = self._computing.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key, _MISSING)
+            if value is _MISSING:
+                try:
+                    value = compute()
+                    # Store before dropping the key's lock so later callers find the value
+                    self.put(key, value)
+                finally:
+                    with self._lock:
+                        self._computing.pop(key, None)
+        return value
+
+    def acquire(self, key: Hashable, holder: Hashable) -> None:
+        """Pin key for holder so it is not evicted until released."""
+        with self._lock:
+            self._holders.setdefault(key, set()).add(holder)
+
+    def release(self, key: Hashable, holder: Hashable) -> None:
+        """Drop holder's pin on key; the entry becomes evictable once no holder remains."""
+        with self._lock:
+            holders = self._holders.get(key)
+            if holders is not None:
+                holders.discard(holder)
+                if not holders:
+                    del self._holders[key]
+            self._evict()
+
+    def refcount(self, key: Hashable) -> int:
+        """Number of holders pinning key."""
+        with self._lock:
+            return len(self._holders.get(key, ()))
+
+    def clear(self) -> None:
+        """Remove all entries that are not held."""
+        with self._lock:
+            for key in [k for k in self._entries if k not in self._holders]:
+                self._size -= self._entries.pop(key)[1]
+
+
+_MISSING = object()
+
+
+def _is_session_active(session_id: Hashable) -> bool:
+    """Return True if session_id belongs to a connected Streamlit session."""
+    from streamlit import runtime
+
+    return runtime.exists() and runtime.get_instance().is_active_session(session_id)
+
+
+# Process-wide store shared by all reruns and sessions of the app
+_store = ResultStore(UPLOAD_CACHE_MAX_BYTES, is_holder_alive=_is_session_active)
+
+
+def content_hash(data: bytes) -> str:
+    """
+    Hash uploaded file content.
+
+    Args:
+        data: Raw file bytes
+
+    Returns:
+        Hex digest identifying the content
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def load_upload(data: bytes, file_format: str, file_hash: Optional[str] = None) -> pd.DataFrame:
+    """
+    Parse an uploaded file, reusing the parsed DataFrame for content seen before.
+
+    Args:
+        data: Raw file bytes
+        file_format: Input format, as returned by get_file_format
+        file_hash: Precomputed content_hash of data (computed if None)
+
+    Returns:
+        pd.DataFrame: The loaded input data. Shared between reruns; do not modify in place.
+    """
+    file_hash = file_hash or content_hash(data)
+    return _store.get_or_compute(("load", file_hash, file_format), lambda: load_data(data, file_format=file_format))
+
+
+def analyze_upload(
+    file_hash: str,
+    df: pd.DataFrame,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Run the Mann-Kendall analysis, reusing results for content analyzed before.
+
+    Args:
+        file_hash: content_hash of the uploaded bytes df was loaded from
+        df: The loaded input data
+        progress_callback: Passed to generate_mann_kendall on a cache miss
+        cancel_event: Passed to generate_mann_kendall on a cache miss; a cancelled
+            analysis is not cached
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: Results and transposed data, as returned by
+        generate_mann_kendall. Shared between reruns; do not modify in place.
+    """
+    return _store.get_or_compute(
+        ("analysis", file_hash),
+        lambda: generate_mann_kendall(
+            df, show_progress=False, progress_callback=progress_callback, cancel_event=cancel_event
+        ),
+    )
+
+
+def is_analysis_cached(file_hash: str) -> bool:
+    """Return True if results for this content are already cached."""
+    return ("analysis", file_hash) in _store
+
+
+def get_analysis(file_hash: str) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Look up stored analysis results without computing them.
+
+    Args:
+        file_hash: content_hash of the analyzed upload
+
+    Returns:
+        The (results, transposed data) tuple, or None if it is not stored
+    """
+    return _store.get(("analysis", file_hash))
+
+
+def hold_analysis(file_hash: Optional[str], holder: Hashable, previous: Optional[str] = None) -> None:
+    """
+    Pin the analysis of file_hash for a session, releasing its previous analysis.
+
+    Args:
+        file_hash: content_hash of the analysis to pin, or None to only release
+        holder: Session identifier
+        previous: content_hash of the analysis the session held before, if any
+    """
+    if previous is not None and previous != file_hash:
+        _store.release(("analysis", previous), holder)
+    if file_hash is not None:
+        _store.acquire(("analysis", file_hash), holder)
+
+
+def _get_derived(kind: str, key: str, build: Callable[[Tuple[pd.DataFrame, pd.DataFrame]], Any]) -> Any:
+    """Return a structure derived from stored analysis results, building it once per results key."""
+    value = _store.get((kind, key))
+    if value is not None:
+        return value
+    analysis = get_analysis(key)
+    if analysis is None:
+        return None
+    return _store.get_or_compute((kind, key), lambda: build(analysis))
+
+
+def get_summary(key: str, results: Optional[pd.DataFrame] = None) -> Optional[ResultsSummary]:
+    """
+    Return the summary of stored results, computing it once per results key.
+
+    Args:
+        key: Results key (content hash of the upload, or results_hash)
+        results: Results to summarize on a miss; looked up with get_analysis if None
+
+    Returns:
+        The ResultsSummary, or None if the results are not stored
+    """
+    if results is not None:
+        return _store.get_or_compute(("summary", key), lambda: ResultsSummary.from_results(results))
+    return _get_derived("summary", key, lambda analysis: ResultsSummary.from_results(analysis[0]))
+
+
+def get_result_set(key: str) -> Optional[MKResultSet]:
+    """
+    Return the indexed result set of stored results, building it once per results key.
+
+    Args:
+        key: content_hash of the analyzed upload
+
+    Returns:
+        The MKResultSet, or None if the results are not stored
+    """
+    return _get_derived("result_set", key, lambda analysis: MKResultSet.from_frame(analysis[0]))
+
+
+def get_plot_data(key: str) -> Optional[PlotDataStore]:
+    """
+    Return the numeric plot data of stored results, building it once per results key.
+
+    Args:
+        key: content_hash of the analyzed upload
+
+    Returns:
+        The PlotDataStore, or None if the results are not stored
+    """
+    return _get_derived("plot_data", key, lambda analysis: PlotDataStore.from_transposed(analysis[1]))
+
+
+def get_well_index(key: str) -> Optional[WellIndex]:
+    """
+    Return the well search index of stored results, building it once per results key.
+
+    Args:
+        key: content_hash of the analyzed upload
+
+    Returns:
+        The WellIndex, or None if the results are not stored
+    """
+    return _get_derived("well_index", key, lambda analysis: WellIndex(analysis[0]["Well"].unique()))
+
+
+def results_hash(results: pd.DataFrame) -> str:
+    """
+    Hash a results DataFrame by content.
+
+    Args:
+        results: Mann-Kendall results
+
+    Returns:
+        Hex digest identifying the results
+    """
+    row_hashes = pd.util.hash_pandas_object(results, index=False).values
+    return hashlib.blake2b(row_hashes.tobytes() + "|".join(map(str, results.columns)).encode(), digest_size=16).hexdigest()
+
+
+def get_export(key: str, export_format: str, build: Optional[Callable[[], bytes]] = None) -> Optional[bytes]:
+    """
+    Return cached export bytes, building them on a miss when build is given.
+
+    Args:
+        key: Results key (content hash of the upload, or results_hash)
+        export_format: Export format identifier, e.g. "xlsx" or "csv"
+        build: Callable producing the export bytes; if None, only a cache lookup is done
+
+    Returns:
+        The export bytes, or None if not cached and no build was given
+    """
+    if build is None:
+        return _store.get(("export", key, export_format))
+    return _store.get_or_compute(("export", key, export_format), build)
+
+
+def clear_upload_cache() -> None:
+    """Drop all cached uploads and analyses that no session holds."""
+    _store.clear()
+    logger.info("Upload cache cleared")
@@ -7,6 +7,10 @@ from random import randint
 import pandas as pd
 import streamlit as st
 
+from mann_kendall.core.summary import ResultsSummary
+from mann_kendall.data.writer import serialize_chunk, write_excel_streaming
+from mann_kendall.ui.cache import get_export, get_summary, results_hash
+
 
 def to_excel(dataframe: pd.DataFrame) -> bytes:
     """
@@ -101,157 +105,191 @@ def save_to_excel(dataframe: pd.DataFrame, filename: str, output_dir: str = "out
         raise OSError(f"Error saving file: {str(e)}")
 
 
-def create_enhanced_download_section(results: pd.DataFrame, processed_data: pd.DataFrame = None) -> None:
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Export format label -> (format id, file name suffix, mime type, download button label)
+EXPORT_FORMATS = {
+    "Excel (.xlsx)": ("xlsx", ".xlsx", XLSX_MIME, "📊 Download Excel File"),
+    "CSV (.csv)": ("csv", ".csv", "text/csv", "📄 Download CSV File"),
+    "JSON (.json)": ("json", ".json", "application/json", "🔗 Download JSON File"),
+    "NDJSON (.ndjson)": ("ndjson", ".ndjson", "application/x-ndjson", "🔗 Download NDJSON File"),
+    "Summary Report": ("report", "_summary.txt", "text/plain", "📋 Download Summary Report"),
+}
+
+
+def build_export(
+    export_format: str, results: pd.DataFrame, processed_data: pd.DataFrame = None, summary: ResultsSummary = None
+) -> bytes:
+    """
+    Serialize results in one of the download section's export formats.
+
+    Args:
+        export_format: One of "xlsx", "csv", "json", "ndjson" or "report"
+        results: Mann-Kendall test results DataFrame
+        processed_data: Original processed data DataFrame (optional, Excel only)
+        summary: Precomputed summary of the results (computed if None)
+
+    Returns:
+        The export file content as bytes
+    """
+    if export_format == "xlsx":
+        return create_excel_export(results, processed_data, summary)
+    if export_format == "csv":
+        return results.to_csv(index=False).encode("utf-8")
+    if export_format == "json":
+        return create_json_export(results, summary).encode("utf-8")
+    if export_format == "ndjson":
+        return serialize_chunk(results, "ndjson").encode("utf-8")
+    if export_format == "report":
+        return create_summary_report(results, summary).encode("utf-8")
+    raise ValueError(f"Unsupported export format: {export_format}")
+
+
+def _lazy_download_button(
+    prepare_label: str,
+    download_label: str,
+    key: str,
+    export_format: str,
+    results: pd.DataFrame,
+    processed_data: pd.DataFrame,
+    file_name: str,
+    mime: str,
+    help: str = None,
+    **kwargs,
+) -> None:
+    """Show a download button once the export is cached, or a button that builds it on demand."""
+    data = get_export(key, export_format)
+    if data is None and st.button(prepare_label, key=f"prepare_{export_format}_{prepare_label}", help=help):
+        with st.spinner("Preparing export..."):
+            data = get_export(
+                key, export_format, lambda: build_export(export_format, results, processed_data, get_summary(key, results))
+            )
+    if data is not None:
+        st.download_button(label=download_label, data=data, file_name=file_name, mime=mime, **kwargs)
+
+
+def create_enhanced_download_section(
+    results: pd.DataFrame, processed_data: pd.DataFrame = None, results_key: str = None
+) -> None:
     """
     Create an enhanced download section with multiple export options.
 
+    Exports are built only when requested and cached by results key and format,
+    so reruns (and other sessions with the same results) reuse the bytes.
+
     Args:
         results: Mann-Kendall test results DataFrame
         processed_data: Original processed data DataFrame (optional)
+        results_key: Key identifying the results; hashed from results if None
     """
     st.markdown("### 📥 Export Options")
+    key = results_key or results_hash(results)
 
     # Export format selection
-    export_format = st.selectbox("Choose Export Format:", ["Excel (.xlsx)", "CSV (.csv)", "JSON (.json)", "Summary Report"])
+    export_format = st.selectbox("Choose Export Format:", list(EXPORT_FORMATS))
+    format_id, suffix, mime, download_label = EXPORT_FORMATS[export_format]
 
     # Custom filename
     default_name = f"mann_kendall_results_{datetime.now().strftime('%Y%m%d_%H%M')}"
     custom_filename = st.text_input("Filename (without extension):", value=default_name)
 
-    if export_format == "Excel (.xlsx)":
-        excel_data = create_excel_export(results, processed_data)
-        st.download_button(
-            label="📊 Download Excel File",
-            data=excel_data,
-            file_name=f"{custom_filename}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            type="primary",
-        )
-
-    elif export_format == "CSV (.csv)":
-        csv_data = results.to_csv(index=False)
-        st.download_button(
-            label="📄 Download CSV File", data=csv_data, file_name=f"{custom_filename}.csv", mime="text/csv", type="primary"
-        )
-
-    elif export_format == "JSON (.json)":
-        json_data = create_json_export(results)
-        st.download_button(
-            label="🔗 Download JSON File",
-            data=json_data,
-            file_name=f"{custom_filename}.json",
-            mime="application/json",
-            type="primary",
-        )
-
-    elif export_format == "Summary Report":
-        report_data = create_summary_report(results)
-        st.download_button(
-            label="📋 Download Summary Report",
-            data=report_data,
-            file_name=f"{custom_filename}_summary.txt",
-            mime="text/plain",
-            type="primary",
-        )
+    _lazy_download_button(
+        f"⚙️ Prepare {export_format}",
+        download_label,
+        key,
+        format_id,
+        results,
+        processed_data,
+        file_name=f"{custom_filename}{suffix}",
+        mime=mime,
+        type="primary",
+    )
 
     # Quick export buttons
     st.markdown("**Quick Export:**")
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        if st.button("📊 Excel", help="Download as Excel file"):
-            excel_data = create_excel_export(results, processed_data)
-            st.download_button(
-                label="Download Excel",
-                data=excel_data,
-                file_name=f"{default_name}.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            )
+        _lazy_download_button(
+            "📊 Excel", "Download Excel", key, "xlsx", results, processed_data,
+            file_name=f"{default_name}.xlsx", mime=XLSX_MIME, help="Download as Excel file",
+        )
 
     with col2:
-        if st.button("📄 CSV", help="Download as CSV file"):
-            csv_data = results.to_csv(index=False)
-            st.download_button(label="Download CSV", data=csv_data, file_name=f"{default_name}.csv", mime="text/csv")
+        _lazy_download_button(
+            "📄 CSV", "Download CSV", key, "csv", results, processed_data,
+            file_name=f"{default_name}.csv", mime="text/csv", help="Download as CSV file",
+        )
 
     with col3:
-        if st.button("📋 Report", help="Download summary report"):
-            report_data = create_summary_report(results)
-            st.download_button(
-                label="Download Report", data=report_data, file_name=f"{default_name}_summary.txt", mime="text/plain"
-            )
+        _lazy_download_button(
+            "📋 Report", "Download Report", key, "report", results, processed_data,
+            file_name=f"{default_name}_summary.txt", mime="text/plain", help="Download summary report",
+        )
 
 
-def create_excel_export(results: pd.DataFrame, processed_data: pd.DataFrame = None) -> bytes:
+def create_excel_export(
+    results: pd.DataFrame, processed_data: pd.DataFrame = None, summary: ResultsSummary = None
+) -> bytes:
     """
     Create an enhanced Excel export with multiple sheets.
 
     Args:
         results: Mann-Kendall test results
         processed_data: Original processed data (optional)
+        summary: Precomputed summary of the results (computed if None)
 
     Returns:
         Excel file as bytes
     """
     output = BytesIO()
 
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        # Main results sheet
-        results.to_excel(writer, sheet_name="Mann-Kendall Results", index=False)
+    summary = summary or ResultsSummary.from_results(results)
 
+    sheets = {
+        # Main results sheet
+        "Mann-Kendall Results": results,
         # Summary statistics sheet
-        summary_stats = create_summary_statistics(results)
-        summary_stats.to_excel(writer, sheet_name="Summary Statistics", index=False)
-
+        "Summary Statistics": create_summary_statistics(results, summary),
         # Trend summary by well
-        well_summary = results.groupby("Well")["Trend"].value_counts().unstack(fill_value=0)
-        well_summary.to_excel(writer, sheet_name="Trends by Well")
-
+        "Trends by Well": summary.trend_table("Well").reset_index(),
         # Component summary
-        component_summary = results.groupby("Analise")["Trend"].value_counts().unstack(fill_value=0)
-        component_summary.to_excel(writer, sheet_name="Trends by Component")
-
-        # Include processed data if available
-        if processed_data is not None:
-            processed_data.to_excel(writer, sheet_name="Processed Data", index=False)
-
-        # Get workbook and add formatting
-        workbook = writer.book
+        "Trends by Component": summary.trend_table("Analise").reset_index(),
+    }
 
-        # Define formats
-        header_format = workbook.add_format(
-            {"bold": True, "text_wrap": True, "valign": "top", "fg_color": "#D7E4BC", "border": 1}
-        )
+    # Include processed data if available
+    if processed_data is not None:
+        sheets["Processed Data"] = processed_data
 
-        # Format headers for each sheet
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-            worksheet.set_row(0, None, header_format)
-            worksheet.set_column("A:Z", 15)  # Auto-adjust column width
+    # Streamed in constant-memory mode, with the header format applied to every sheet
+    write_excel_streaming(sheets, output)
 
     return output.getvalue()
 
 
-def create_json_export(results: pd.DataFrame) -> str:
+def create_json_export(results: pd.DataFrame, summary: ResultsSummary = None) -> str:
     """
     Create a structured JSON export of the results.
 
     Args:
         results: Mann-Kendall test results
+        summary: Precomputed summary of the results (computed if None)
 
     Returns:
         JSON string
     """
+    summary = summary or ResultsSummary.from_results(results)
     export_data = {
         "metadata": {
             "export_date": datetime.now().isoformat(),
-            "total_tests": len(results),
-            "unique_wells": results["Well"].nunique(),
-            "unique_components": results["Analise"].nunique(),
+            "total_tests": summary.total,
+            "unique_wells": len(summary.wells),
+            "unique_components": len(summary.components),
         },
         "summary": {
-            "trend_distribution": results["Trend"].value_counts().to_dict(),
-            "wells_with_trends": len(results[results["Trend"] != "no trend"]["Well"].unique()),
-            "components_analyzed": results["Analise"].unique().tolist(),
+            "trend_distribution": summary.trend_distribution().to_dict(),
+            "wells_with_trends": len(summary.significant_wells()),
+            "components_analyzed": summary.components,
         },
         "results": results.to_dict("records"),
     }
@@ -259,17 +297,19 @@ def create_json_export(results: pd.DataFrame) -> str:
     return json.dumps(export_data, indent=2, default=str)
 
 
-def create_summary_report(results: pd.DataFrame) -> str:
+def create_summary_report(results: pd.DataFrame, summary: ResultsSummary = None) -> str:
     """
     Create a text-based summary report.
 
     Args:
         results: Mann-Kendall test results
+        summary: Precomputed summary of the results (computed if None)
 
     Returns:
         Summary report as string
     """
     report = StringIO()
+    summary = summary or ResultsSummary.from_results(results)
 
     # Header
     report.write("MANN-KENDALL TREND ANALYSIS SUMMARY REPORT\n")
@@ -277,78 +317,84 @@ def create_summary_report(results: pd.DataFrame) -> str:
 
     # Generation info
     report.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    report.write(f"Total Tests Performed: {len(results)}\n")
-    report.write(f"Unique Wells: {results['Well'].nunique()}\n")
-    report.write(f"Components Analyzed: {results['Analise'].nunique()}\n\n")
+    report.write(f"Total Tests Performed: {summary.total}\n")
+    report.write(f"Unique Wells: {len(summary.wells)}\n")
+    report.write(f"Components Analyzed: {len(summary.components)}\n\n")
 
     # Trend summary
     report.write("TREND DISTRIBUTION\n")
     report.write("-" * 20 + "\n")
-    trend_counts = results["Trend"].value_counts()
-    for trend, count in trend_counts.items():
-        percentage = (count / len(results)) * 100
+    for trend, count in summary.trend_distribution().items():
+        percentage = (count / summary.total) * 100
         report.write(f"{trend.title()}: {count} ({percentage:.1f}%)\n")
 
     report.write("\n")
 
-    # Wells with significant trends
-    significant_wells = results[results["Trend"] != "no trend"]["Well"].unique()
-    report.write(f"WELLS WITH SIGNIFICANT TRENDS ({len(significant_wells)} wells)\n")
-    report.write("-" * 40 + "\n")
+    # Wells with significant trends: one mask and one stable sort, then a line per result
+    significant = results[results["Trend"] != "no trend"]
+    significant = significant.sort_values("Well", kind="stable")
+    lines = (
+        "  - "
+        + significant["Analise"].astype(str)
+        + ": "
+        + significant["Trend"].astype(str)
+        + " (S="
+        + significant["Mann-Kendall Statistic (S)"].map("{:.2f}".format)
+        + ")\n"
+    )
+    well_blocks = lines.groupby(significant["Well"], sort=True, observed=True).agg("".join)
 
-    for well in sorted(significant_wells):
-        well_trends = results[(results["Well"] == well) & (results["Trend"] != "no trend")]
-        report.write(f"\n{well}:\n")
-        for _, row in well_trends.iterrows():
-            report.write(f"  - {row['Analise']}: {row['Trend']} (S={row['Mann-Kendall Statistic (S)']:.2f})\n")
+    report.write(f"WELLS WITH SIGNIFICANT TRENDS ({len(well_blocks)} wells)\n")
+    report.write("-" * 40 + "\n")
+    for well, block in well_blocks.items():
+        report.write(f"\n{well}:\n{block}")
 
     # Component analysis
     report.write("\n\nCOMPONENT ANALYSIS\n")
     report.write("-" * 20 + "\n")
 
-    for component in sorted(results["Analise"].unique()):
-        component_data = results[results["Analise"] == component]
-        trend_dist = component_data["Trend"].value_counts()
+    for component, row in summary.trend_table("Analise").iterrows():
         report.write(f"\n{component}:\n")
-        for trend, count in trend_dist.items():
+        for trend, count in row[row > 0].sort_values(ascending=False, kind="stable").items():
             report.write(f"  - {trend}: {count}\n")
 
     return report.getvalue()
 
 
-def create_summary_statistics(results: pd.DataFrame) -> pd.DataFrame:
+def create_summary_statistics(results: pd.DataFrame, summary: ResultsSummary = None) -> pd.DataFrame:
     """
     Create summary statistics DataFrame for Excel export.
 
     Args:
         results: Mann-Kendall test results
+        summary: Precomputed summary of the results (computed if None)
 
     Returns:
         Summary statistics DataFrame
     """
     summary_data = []
+    summary = summary or ResultsSummary.from_results(results)
 
     # Overall statistics
     summary_data.append(
-        {"Metric": "Total Tests", "Value": len(results), "Description": "Total number of Mann-Kendall tests performed"}
+        {"Metric": "Total Tests", "Value": summary.total, "Description": "Total number of Mann-Kendall tests performed"}
     )
 
     summary_data.append(
-        {"Metric": "Unique Wells", "Value": results["Well"].nunique(), "Description": "Number of unique monitoring wells/points"}
+        {"Metric": "Unique Wells", "Value": len(summary.wells), "Description": "Number of unique monitoring wells/points"}
     )
 
     summary_data.append(
         {
             "Metric": "Components Analyzed",
-            "Value": results["Analise"].nunique(),
+            "Value": len(summary.components),
             "Description": "Number of different components/parameters tested",
         }
     )
 
     # Trend statistics
-    trend_counts = results["Trend"].value_counts()
-    for trend, count in trend_counts.items():
-        percentage = (count / len(results)) * 100
+    for trend, count in summary.trend_distribution().items():
+        percentage = (count / summary.total) * 100
         summary_data.append(
             {
                 "Metric": f"{trend.title()} Trends",
@@ -358,18 +404,20 @@ def create_summary_statistics(results: pd.DataFrame) -> pd.DataFrame:
         )
 
     # Statistical ranges
+    s_min, s_max = summary.statistic_range()
     summary_data.append(
         {
             "Metric": "Mann-Kendall Statistic Range",
-            "Value": f"{results['Mann-Kendall Statistic (S)'].min():.2f} to {results['Mann-Kendall Statistic (S)'].max():.2f}",  # noqa: E501
+            "Value": f"{s_min:.2f} to {s_max:.2f}",
             "Description": "Range of Mann-Kendall S statistics",
         }
     )
 
+    cf_min, cf_max = summary.confidence_range()
     summary_data.append(
         {
             "Metric": "Confidence Factor Range",
-            "Value": f"{results['Confidence Factor'].min():.2f} to {results['Confidence Factor'].max():.2f}",
+            "Value": f"{cf_min:.2f} to {cf_max:.2f}",
             "Description": "Range of confidence factors",
         }
     )
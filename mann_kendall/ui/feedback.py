@@ -1,8 +1,27 @@
+"""
+Feedback form of the Streamlit app.
+
+Submitted feedback is put on a bounded queue and sent by a background thread,
+so a slow or unreachable endpoint never blocks the user's script run. Failed
+sends are retried with exponential backoff. The endpoint is a plain callable,
+so tests and local development can replace Formspree with a stub.
+"""
+
 __author__ = "Gabriel Barbosa Soares"
 
-import requests
+import queue
+import threading
+import time
+from typing import Callable, Dict, Optional
+
 import streamlit as st
 
+from mann_kendall.core.constants import (
+    FEEDBACK_MAX_ATTEMPTS,
+    FEEDBACK_QUEUE_SIZE,
+    FEEDBACK_REQUEST_TIMEOUT,
+    FEEDBACK_RETRY_BACKOFF,
+)
 from mann_kendall.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -10,13 +29,156 @@ logger = get_logger(__name__)
 FORMSPREE_ENDPOINT = "https://formspree.io/f/xeelvjdr"
 EMAIL_PLACEHOLDER = "no-reply@mannkendall.app"
 
+# Sends one feedback payload; raises FeedbackRejected for permanent failures and
+# any other exception for failures worth retrying
+FeedbackEndpoint = Callable[[Dict[str, str]], None]
+
+
+class FeedbackRejected(Exception):
+    """The endpoint refused a payload; sending it again would not help."""
 
-def create_feedback_section() -> None:
+
+def formspree_endpoint(payload: Dict[str, str]) -> None:
+    """
+    Send a feedback payload to Formspree.
+
+    Args:
+        payload: Form fields to send
+
+    Raises:
+        FeedbackRejected: If Formspree rejects the payload (4xx other than 429)
+        RuntimeError: If Formspree fails with a status worth retrying
+        requests.exceptions.RequestException: On network errors and timeouts
+    """
+    # requests is only needed once feedback is sent, so it is not loaded at app start-up
+    import requests
+
+    response = requests.post(
+        FORMSPREE_ENDPOINT, data=payload, headers={"Accept": "application/json"}, timeout=FEEDBACK_REQUEST_TIMEOUT
+    )
+    if response.status_code == 200:
+        return
+
+    logger.error("Formspree returned status %d: %s", response.status_code, response.text)
+    if 400 <= response.status_code < 500 and response.status_code != 429:
+        raise FeedbackRejected(f"status {response.status_code}")
+    raise RuntimeError(f"status {response.status_code}")
+
+
+class FeedbackSender:
+    """
+    Sends feedback from a bounded queue in a background thread, retrying failures.
+
+    Examples:
+        >>> sender = FeedbackSender(endpoint=lambda payload: None)
+        >>> sender.submit({"message": "Great tool!"})
+        True
+        >>> sender.join()  # Wait until the queue is drained
+    """
+
+    def __init__(
+        self,
+        endpoint: FeedbackEndpoint = formspree_endpoint,
+        max_queue_size: int = FEEDBACK_QUEUE_SIZE,
+        max_attempts: int = FEEDBACK_MAX_ATTEMPTS,
+        retry_backoff: float = FEEDBACK_RETRY_BACKOFF,
+    ):
+        """
+        Args:
+            endpoint: Callable sending one payload
+            max_queue_size: Payloads that can wait to be sent; further submissions are refused
+            max_attempts: Attempts per payload before it is dropped
+            retry_backoff: Seconds before the first retry, doubled for each further retry
+        """
+        self.endpoint = endpoint
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.sent = 0
+        self.failed = 0
+
+        self._queue: queue.Queue[Dict[str, str]] = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, payload: Dict[str, str]) -> bool:
+        """
+        Queue a payload for sending without waiting for it to be sent.
+
+        Args:
+            payload: Form fields to send
+
+        Returns:
+            False if the queue is full and the payload was not queued
+        """
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            logger.warning("Feedback queue is full; dropping submission")
+            return False
+        self._ensure_worker()
+        return True
+
+    def join(self) -> None:
+        """Wait until every queued payload has been sent or dropped."""
+        self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="mk-feedback-sender", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            payload = self._queue.get()
+            try:
+                self._send(payload)
+            finally:
+                self._queue.task_done()
+
+    def _send(self, payload: Dict[str, str]) -> None:
+        delay = self.retry_backoff
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                self.endpoint(payload)
+                self.sent += 1
+                return
+            except FeedbackRejected as e:
+                logger.error("Feedback was rejected: %s", e)
+                break
+            except Exception as e:
+                logger.warning("Sending feedback failed (attempt %d of %d): %s", attempt, self.max_attempts, e)
+                if attempt < self.max_attempts:
+                    time.sleep(delay)
+                    delay *= 2
+        self.failed += 1
+
+
+# Sender shared by all sessions of the app process
+_sender: Optional[FeedbackSender] = None
+_sender_lock = threading.Lock()
+
+
+def get_feedback_sender() -> FeedbackSender:
+    """Return the process-wide feedback sender, creating it on first use."""
+    global _sender
+    with _sender_lock:
+        if _sender is None:
+            _sender = FeedbackSender()
+        return _sender
+
+
+def create_feedback_section(sender: Optional[FeedbackSender] = None) -> None:
     """
     Render feedback form in sidebar using Formspree integration.
 
     Allows users to send feedback directly to the project maintainer via email.
     The form includes optional name/email fields and a required message field.
+    Submitting queues the feedback and returns immediately; it is sent in the background.
+
+    Args:
+        sender (FeedbackSender, optional): Sender of the submitted feedback. The process-wide
+            Formspree sender if None.
     """
     with st.expander("💬 Send Feedback"):
         st.markdown("Help us improve! Share your thoughts, report bugs, or request features.")
@@ -57,26 +219,10 @@ def create_feedback_section() -> None:
                         "_subject": f"MKA Feedback: {category}",  # Custom email subject
                     }
 
-                    try:
-                        response = requests.post(
-                            FORMSPREE_ENDPOINT, data=payload, headers={"Accept": "application/json"}, timeout=10
-                        )
-
-                        if response.status_code == 200:
-                            st.success("✅ Thank you! Your feedback has been sent successfully.")
-                            st.balloons()
-                        else:
-                            logger.error(
-                                "Formspree returned status %d: %s",
-                                response.status_code,
-                                response.text,
-                            )
-                            st.error("❌ Failed to send feedback. Please try again or contact us directly.")
-                    except requests.exceptions.Timeout:
-                        st.error("❌ Request timed out. Please check your connection and try again.")
-                    except requests.exceptions.RequestException as e:
-                        st.error(f"❌ Network error: {str(e)}")
-                    except Exception as e:
-                        st.error(f"❌ Unexpected error: {str(e)}")
+                    if (sender or get_feedback_sender()).submit(payload):
+                        st.success("✅ Thank you! Your feedback is on its way.")
+                        st.balloons()
+                    else:
+                        st.error("❌ Too much feedback is waiting to be sent. Please try again in a few minutes.")
 
         st.caption("🔒 Your feedback is sent securely via Formspree. We respect your privacy.")
@@ -0,0 +1,186 @@
+"""
+Background analysis jobs for the Streamlit app.
+
+An analysis runs in a worker thread so the script run that started it can
+finish and the UI stays responsive. The job records per-well progress, the number of
+results computed so far and a bounded preview of the latest ones, which the app
+polls to display incremental progress and partial results. Jobs are shared process-wide by content hash, so sessions
+uploading the same file follow one analysis; a job is cancelled once every
+session following it has moved on to a different file.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional, Set, Tuple
+
+import pandas as pd
+
+from mann_kendall.core.constants import ANALYSIS_PREVIEW_ROWS
+from mann_kendall.core.processor import AnalysisCancelled
+from mann_kendall.ui.cache import analyze_upload
+from mann_kendall.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Job states
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+
+class AnalysisJob:
+    """
+    A Mann-Kendall analysis of one upload running in a background thread.
+
+    Examples:
+        >>> job = AnalysisJob(file_hash, df)
+        >>> job.start()
+        >>> job.progress
+        (12, 40)
+        >>> job.cancel()
+    """
+
+    def __init__(self, file_hash: str, df: pd.DataFrame):
+        """
+        Args:
+            file_hash: content_hash of the upload df was loaded from
+            df: The loaded input data
+        """
+        self.file_hash = file_hash
+        self.status = RUNNING
+        self.error: Optional[BaseException] = None
+        self.result: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None
+        self.watchers: Set[Hashable] = set()  # Sessions following this job
+
+        self._df = df
+        self._done = 0
+        self._total = 0
+        self._started = False  # Set by the first progress update
+        self._result_count = 0
+        self._recent: Deque[pd.DataFrame] = deque()  # Latest per-well results, about ANALYSIS_PREVIEW_ROWS rows
+        self._recent_rows = 0
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"mk-analysis-{file_hash[:8]}", daemon=True)
+
+    @property
+    def is_running(self) -> bool:
+        return self.status == RUNNING
+
+    @property
+    def progress(self) -> Tuple[int, int]:
+        """Wells analyzed so far and the total number of wells to analyze."""
+        with self._lock:
+            return self._done, self._total
+
+    @property
+    def result_count(self) -> int:
+        """Number of results computed so far."""
+        with self._lock:
+            return self._result_count
+
+    @property
+    def partial_results(self) -> Optional[pd.DataFrame]:
+        """The latest ANALYSIS_PREVIEW_ROWS results computed so far, or None before the first update."""
+        with self._lock:
+            if not self._started:
+                return None
+            recent = list(self._recent)
+        if not recent:
+            return pd.DataFrame()
+        return pd.concat(recent, ignore_index=True).tail(ANALYSIS_PREVIEW_ROWS).reset_index(drop=True)
+
+    def start(self) -> "AnalysisJob":
+        """Start the analysis thread."""
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Ask the analysis to stop before its next well."""
+        self._cancel_event.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the analysis thread to finish."""
+        self._thread.join(timeout)
+
+    def _on_progress(self, done: int, total: int, well_results: pd.DataFrame) -> None:
+        with self._lock:
+            self._done, self._total, self._started = done, total, True
+            if well_results.empty:
+                return
+            self._result_count += len(well_results)
+            self._recent.append(well_results)
+            self._recent_rows += len(well_results)
+            # Keep only the wells needed to show the latest ANALYSIS_PREVIEW_ROWS rows
+            while self._recent_rows - len(self._recent[0]) >= ANALYSIS_PREVIEW_ROWS:
+                self._recent_rows -= len(self._recent.popleft())
+
+    def _run(self) -> None:
+        try:
+            self.result = analyze_upload(
+                self.file_hash, self._df, progress_callback=self._on_progress, cancel_event=self._cancel_event
+            )
+            self.status = DONE
+        except AnalysisCancelled:
+            self.status = CANCELLED
+        except Exception as e:
+            logger.error("Background analysis failed: %s", e)
+            self.error = e
+            self.status = FAILED
+        finally:
+            self._df = None
+            with _jobs_lock:
+                if _jobs.get(self.file_hash) is self:
+                    del _jobs[self.file_hash]
+
+
+# Running jobs by content hash, shared by all sessions
+_jobs: Dict[str, AnalysisJob] = {}
+_jobs_lock = threading.Lock()
+
+
+def release_analysis(job: AnalysisJob, watcher: Hashable) -> None:
+    """
+    Stop following a job, cancelling it if no other session follows it.
+
+    Args:
+        job: The job to release
+        watcher: Session identifier
+    """
+    with _jobs_lock:
+        job.watchers.discard(watcher)
+        if job.is_running and not job.watchers:
+            logger.info("Cancelling analysis of %s", job.file_hash)
+            job.cancel()
+            if _jobs.get(job.file_hash) is job:
+                del _jobs[job.file_hash]
+
+
+def start_analysis(
+    file_hash: str, df: pd.DataFrame, watcher: Hashable, previous: Optional[AnalysisJob] = None
+) -> AnalysisJob:
+    """
+    Start (or join) the background analysis of an upload.
+
+    If another session is already analyzing the same content, its job is shared
+    instead of starting a second computation.
+
+    Args:
+        file_hash: content_hash of the upload df was loaded from
+        df: The loaded input data
+        watcher: Session identifier
+        previous: The session's current job, if any; it is released
+
+    Returns:
+        The job analyzing file_hash
+    """
+    if previous is not None and previous.file_hash != file_hash:
+        release_analysis(previous, watcher)
+    with _jobs_lock:
+        job = _jobs.get(file_hash)
+        if job is None or not job.is_running:
+            job = AnalysisJob(file_hash, df).start()
+            _jobs[file_hash] = job
+        job.watchers.add(watcher)
+    return job
@@ -0,0 +1,136 @@
+"""
+Whole-site trend overview.
+
+Renders every well × component result as one heatmap built from a compact
+integer matrix of trend scores, so a site with thousands of wells can be seen
+at a glance without drawing per-well traces. Clicking a cell opens that well
+and component in the detailed trend plot.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import streamlit as st
+
+from mann_kendall.core.result_set import MKResultSet
+
+MISSING_SCORE = np.iinfo(np.int8).min  # Marks well/component pairs without a result
+
+# Trend score -> label, from decreasing (-2) to increasing (2)
+TREND_SCORE_LABELS = {
+    -2: "decreasing",
+    -1: "probably decreasing",
+    0: "no trend / stable",
+    1: "probably increasing",
+    2: "increasing",
+}
+
+# Discrete colours matching the results table: red for decreasing, green for increasing
+TREND_SCORE_COLORSCALE = [
+    [0.0, "#c0392b"], [0.2, "#c0392b"],
+    [0.2, "#f1948a"], [0.4, "#f1948a"],
+    [0.4, "#d1ecf1"], [0.6, "#d1ecf1"],
+    [0.6, "#82e0aa"], [0.8, "#82e0aa"],
+    [0.8, "#1e8449"], [1.0, "#1e8449"],
+]
+
+# Session state keys of the detailed trend plot widgets, set when a cell is clicked
+TREND_PLOT_MODE_KEY = "trend_plot_mode"
+TREND_PLOT_WELLS_KEY = "trend_plot_wells"
+TREND_PLOT_COMPONENT_KEY = "trend_plot_component"
+OVERVIEW_CHART_KEY = "site_overview"
+
+
+def trend_score(trend: str) -> int:
+    """
+    Converts a trend classification to a signed score.
+
+    Args:
+        trend (str): Trend classification, e.g. "probably increasing" or "seasonal decreasing".
+
+    Returns:
+        int: 2 or -2 for (seasonal) increasing or decreasing, 1 or -1 for probable trends, 0 otherwise.
+    """
+    sign = 1 if "increasing" in trend else -1 if "decreasing" in trend else 0
+    return sign if "probably" in trend else 2 * sign
+
+
+def trend_matrix(result_set: MKResultSet) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Builds the well × component matrices of trend scores and confidence factors.
+
+    Args:
+        result_set (MKResultSet): Indexed results.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: int8 trend scores (MISSING_SCORE where there is no
+        result) and float32 confidence factors (NaN where there is no result), with one
+        row per well and one column per component in the result set's order.
+    """
+    shape = (len(result_set.wells), len(result_set.components))
+    wells, components = result_set.columns["Well"], result_set.columns["Analise"]
+    scores_by_code = np.array([trend_score(trend) for trend in result_set.trends], dtype=np.int8)
+
+    scores = np.full(shape, MISSING_SCORE, dtype=np.int8)
+    scores[wells, components] = scores_by_code[result_set.columns["Trend"]]
+    confidence = np.full(shape, np.nan, dtype=np.float32)
+    confidence[wells, components] = result_set.columns["Confidence Factor"]
+    return scores, confidence
+
+
+def _open_selected_cell() -> None:
+    """Point the detailed trend plot at the clicked heatmap cell."""
+    points = st.session_state[OVERVIEW_CHART_KEY].selection.points
+    if points:
+        st.session_state[TREND_PLOT_MODE_KEY] = "Manual Selection"
+        st.session_state[TREND_PLOT_WELLS_KEY] = [points[0]["y"]]
+        st.session_state[TREND_PLOT_COMPONENT_KEY] = points[0]["x"]
+
+
+def display_site_overview(result_set: MKResultSet) -> None:
+    """
+    Displays the whole-site heatmap of trends; clicking a cell opens it in the trend plot.
+
+    Args:
+        result_set (MKResultSet): Indexed results.
+    """
+    if len(result_set) == 0:
+        return
+
+    # Plotly is only needed once results are shown, so it is not loaded at app start-up
+    import plotly.graph_objects as go
+
+    scores, confidence = trend_matrix(result_set)
+    z = np.where(scores == MISSING_SCORE, np.nan, scores.astype(np.float32))
+
+    fig = go.Figure(
+        go.Heatmap(
+            z=z,
+            x=list(result_set.components),
+            y=list(result_set.wells),
+            customdata=confidence,
+            zmin=-2.5,
+            zmax=2.5,
+            colorscale=TREND_SCORE_COLORSCALE,
+            xgap=1,
+            ygap=1 if len(result_set.wells) <= 100 else 0,
+            colorbar=dict(tickvals=list(TREND_SCORE_LABELS), ticktext=list(TREND_SCORE_LABELS.values())),
+            hovertemplate=(
+                "Well: %{y}<br>Component: %{x}<br>Trend score: %{z}<br>Confidence Factor: %{customdata:.2f}<extra></extra>"
+            ),
+        )
+    )
+    fig.update_layout(
+        height=min(max(300, 14 * len(result_set.wells)), 900),
+        yaxis=dict(autorange="reversed", showticklabels=len(result_set.wells) <= 100),
+        xaxis=dict(side="top"),
+        margin=dict(t=80, b=20),
+    )
+
+    st.caption(
+        f"{len(result_set.wells)} wells × {len(result_set.components)} components. "
+        "Click a cell to open it in the trend plot below."
+    )
+    st.plotly_chart(
+        fig, use_container_width=True, key=OVERVIEW_CHART_KEY, on_select=_open_selected_cell, selection_mode="points"
+    )
@@ -0,0 +1,187 @@
+"""
+Numeric time-series store for the trend plots.
+
+The transposed input keeps values as strings and markers ("ND", "<0.5"), so
+plotting straight from it means filtering the whole frame, sorting it by date
+and converting values on every rerun. PlotDataStore converts the data once per
+analysis into a float matrix with rows grouped by well and sorted by date;
+plotting a selection then only gathers the rows of the selected wells. Long
+series are downsampled with LTTB before they are sent to the browser.
+"""
+
+from typing import Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mann_kendall.data.cleaner import string_to_float
+
+
+def _to_float(column: pd.Series) -> np.ndarray:
+    """Convert a column like the analysis does, parsing only values that are not plain numbers."""
+    values = pd.to_numeric(column, errors="coerce")
+    unparsed = values.isna() & column.notna()
+    if unparsed.any():
+        values[unparsed] = column[unparsed].map(string_to_float)
+    return values.to_numpy(dtype=float)
+
+
+class PlotDataStore:
+    """
+    Float values of every (well, component) series, grouped by well and sorted by date.
+
+    Examples:
+        >>> store = PlotDataStore.from_transposed(df_transposed)
+        >>> dates, values = store.series("MW-01", "Benzene")
+        >>> store.frame(["MW-01", "MW-02"], "Benzene")  # well, Date, Benzene columns
+    """
+
+    def __init__(self, wells: pd.Index, components: pd.Index, bounds: np.ndarray, dates: np.ndarray, values: np.ndarray):
+        """
+        Args:
+            wells: Well names; rows of well i are bounds[i]:bounds[i + 1]
+            components: Component names, one per column of values
+            bounds: Row offsets of each well, of length len(wells) + 1
+            dates: Date of each row
+            values: Float matrix with one row per sample and one column per component
+        """
+        self.wells = wells
+        self.components = components
+        self.bounds = bounds
+        self.dates = dates
+        self.values = values
+
+    @classmethod
+    def from_transposed(cls, df_transposed: pd.DataFrame) -> "PlotDataStore":
+        """
+        Build the store from the transposed data returned by generate_mann_kendall.
+
+        Args:
+            df_transposed: Transposed data with "well" and "Date" columns followed by components
+
+        Returns:
+            PlotDataStore
+        """
+        codes, wells = pd.factorize(df_transposed["well"])
+        order = pd.DataFrame({"code": codes, "Date": df_transposed["Date"].to_numpy()}).sort_values(
+            ["code", "Date"], kind="stable"
+        ).index.to_numpy()
+        data = df_transposed.iloc[order]
+
+        components = df_transposed.columns[2:]
+        values = np.empty((len(data), len(components)))
+        for j in range(len(components)):
+            values[:, j] = _to_float(data.iloc[:, j + 2])
+        bounds = np.searchsorted(codes[order], np.arange(len(wells) + 1))
+        return cls(wells, components, bounds, data["Date"].to_numpy(), values)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the arrays."""
+        return self.values.nbytes + self.dates.nbytes + self.bounds.nbytes
+
+    def series(self, well: str, component: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Dates and values of one series, sorted by date, without missing values.
+
+        Args:
+            well: Well name
+            component: Component name
+
+        Returns:
+            Tuple of (dates, values) arrays, empty if the well or component is unknown
+        """
+        i = self.wells.get_indexer([well])[0]
+        j = self.components.get_indexer([component])[0]
+        if i < 0 or j < 0:
+            return self.dates[:0], np.empty(0)
+        start, end = self.bounds[i], self.bounds[i + 1]
+        values = self.values[start:end, j]
+        present = ~np.isnan(values)
+        return self.dates[start:end][present], values[present]
+
+    def frame(self, wells: Iterable[str], component: str) -> pd.DataFrame:
+        """
+        Gather the series of several wells for plotting.
+
+        Args:
+            wells: Well names
+            component: Component name
+
+        Returns:
+            pd.DataFrame with well, Date and component columns, grouped by well and sorted by date
+        """
+        names, dates, values = [], [], []
+        for well in wells:
+            well_dates, well_values = self.series(well, component)
+            names.append(np.full(len(well_values), well, dtype=object))
+            dates.append(well_dates)
+            values.append(well_values)
+        if not values:
+            return pd.DataFrame(columns=["well", "Date", component])
+        return pd.DataFrame({"well": np.concatenate(names), "Date": np.concatenate(dates), component: np.concatenate(values)})
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points that keep the visual shape of a series (Largest-Triangle-Three-Buckets).
+
+    The first and last points are kept; every bucket in between contributes the point
+    forming the largest triangle with the previously selected point and the mean of
+    the next bucket, so peaks and troughs survive downsampling.
+
+    Args:
+        x: Sorted x coordinates as numbers
+        y: Values
+        n_out: Number of points to keep
+
+    Returns:
+        Indices of the selected points in ascending order
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)  # n_out - 2 buckets between the end points
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_frame(df: pd.DataFrame, y: str, max_points: int) -> pd.DataFrame:
+    """
+    Downsample each well's series of a plot frame to at most max_points with LTTB.
+
+    Args:
+        df: Frame with well, Date and y columns, grouped by well and sorted by date
+        y: Column holding the plotted values
+        max_points: Maximum points per well
+
+    Returns:
+        The frame itself if no series is longer than max_points, else the selected rows
+    """
+    counts = df.groupby("well", sort=False).size()
+    if counts.empty or counts.max() <= max_points:
+        return df
+
+    dates = df["Date"]
+    x = dates.to_numpy(dtype="datetime64[ns]").view(np.int64) if pd.api.types.is_datetime64_any_dtype(dates) else None
+    keep = []
+    for positions in df.groupby("well", sort=False).indices.values():
+        if len(positions) <= max_points:
+            keep.append(positions)
+            continue
+        series_x = x[positions] if x is not None else np.arange(len(positions))
+        keep.append(positions[lttb_indices(series_x, df[y].to_numpy()[positions], max_points)])
+    return df.iloc[np.sort(np.concatenate(keep))]
@@ -1,10 +1,51 @@
-from typing import List
+from typing import List, Union
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 
+from mann_kendall.core.constants import PLOT_MAX_POINTS_PER_SERIES, PLOT_WEBGL_THRESHOLD, RESULTS_PAGE_SIZE
+from mann_kendall.core.result_set import MKResultSet
+from mann_kendall.core.summary import ResultsSummary
+from mann_kendall.ui.overview import TREND_PLOT_COMPONENT_KEY, TREND_PLOT_MODE_KEY, TREND_PLOT_WELLS_KEY
+from mann_kendall.ui.plot_data import PlotDataStore, downsample_frame
+from mann_kendall.ui.well_selector import WellIndex, well_selector
+
+# Number formats of the results table, applied by the browser instead of a pandas Styler
+SENS_SLOPE_COLUMN = "Sen's Slope"
+SENS_INTERCEPT_COLUMN = "Sen's Intercept"
+
+RESULTS_COLUMN_CONFIG = {
+    "Trend": st.column_config.TextColumn("Trend", help="📈 increasing, 📉 decreasing, ➡️ no trend"),
+    "Mann-Kendall Statistic (S)": st.column_config.NumberColumn(format="%.2f"),
+    "Coefficient of Variation": st.column_config.NumberColumn(format="%.4f"),
+    "Confidence Factor": st.column_config.NumberColumn(format="%.2f"),
+    SENS_SLOPE_COLUMN: st.column_config.NumberColumn(format="%.4g"),
+    SENS_INTERCEPT_COLUMN: st.column_config.NumberColumn(format="%.4g"),
+}
+
+
+def trend_symbol(trend: str) -> str:
+    """
+    Returns the symbol used to mark a trend in plots and tables.
+
+    Args:
+        trend (str): Trend classification, e.g. "probably increasing".
+
+    Returns:
+        str: "📈" for increasing, "📉" for decreasing and "➡️" otherwise.
+    """
+    if "increasing" in trend:
+        return "📈"
+    if "decreasing" in trend:
+        return "📉"
+    return "➡️"
+
+
+def _trend_display_labels(result_set: MKResultSet) -> np.ndarray:
+    """Trend labels prefixed with their symbol, indexed by trend code."""
+    return np.array([f"{trend_symbol(trend)} {trend}" for trend in result_set.trends], dtype=object)
+
 
 def filter_well_component(df_transposed: pd.DataFrame, desired_wells: list, desired_component: str) -> pd.DataFrame:
     """
@@ -37,7 +78,11 @@ def get_desired_component(results: pd.DataFrame, desired_wells: List[str]) -> st
         str: Desired component selected by the user.
     """
     results_filter_by_well = results[results.Well.isin(desired_wells)]
-    desired_component = st.selectbox("Select Component", results_filter_by_well.Analise.unique())
+    options = results_filter_by_well.Analise.unique()
+    if st.session_state.get(TREND_PLOT_COMPONENT_KEY) not in options:
+        # A component opened from the site overview may not apply to a new well selection
+        st.session_state.pop(TREND_PLOT_COMPONENT_KEY, None)
+    desired_component = st.selectbox("Select Component", options, key=TREND_PLOT_COMPONENT_KEY)
     return desired_component
 
 
@@ -52,13 +97,62 @@ def choose_log_scale() -> bool:
     return log_scale == "Log"
 
 
-def create_trend_plot(results: pd.DataFrame, dataframe: pd.DataFrame) -> None:
+def add_sens_slope_lines(
+    fig, df_filtered: pd.DataFrame, component_results: pd.DataFrame, component: str, log_scale: bool
+) -> None:
+    """
+    Adds the Sen's slope trend line of each plotted well to a figure.
+
+    The slope and intercept come from the analysis results, per sample: the fitted
+    value of the i-th sample of a well is intercept + slope * i. Lines are drawn at
+    the sample dates and thinned to PLOT_MAX_POINTS_PER_SERIES points.
+
+    Args:
+        fig: Plotly figure to add the lines to.
+        df_filtered (pd.DataFrame): Full-resolution plotted data with well, Date and component
+            columns, each well's samples sorted by date.
+        component_results (pd.DataFrame): Results of the plotted component, indexed by well.
+        component (str): Plotted component.
+        log_scale (bool): Whether the y-axis shows log10 of the values.
+    """
+    for well, dates in df_filtered.groupby("well", sort=False)["Date"]:
+        if well not in component_results.index:
+            continue
+        slope = component_results.at[well, SENS_SLOPE_COLUMN]
+        intercept = component_results.at[well, SENS_INTERCEPT_COLUMN]
+        if pd.isna(slope) or pd.isna(intercept):
+            continue
+
+        positions = np.unique(np.linspace(0, len(dates) - 1, min(len(dates), PLOT_MAX_POINTS_PER_SERIES)).astype(int))
+        fitted = intercept + slope * positions
+        if log_scale:
+            fitted = np.log10(np.where(fitted > 0, fitted, np.nan))
+        fig.add_scatter(
+            x=dates.to_numpy()[positions],
+            y=fitted,
+            mode="lines",
+            line=dict(dash="dash", width=1.5),
+            name=f"{well} Sen's slope ({slope:+.4g}/sample)",
+        )
+
+
+def create_trend_plot(
+    results: pd.DataFrame,
+    dataframe: pd.DataFrame,
+    summary: ResultsSummary = None,
+    plot_data: PlotDataStore = None,
+    well_index: WellIndex = None,
+) -> None:
     """
     Creates and displays an interactive plot of selected wells and components.
 
     Args:
         results (pd.DataFrame): Results of the Mann Kendall test.
         dataframe (pd.DataFrame): DataFrame containing the data.
+        summary (ResultsSummary, optional): Precomputed summary of the results. Computed if None.
+        plot_data (PlotDataStore, optional): Precomputed numeric series of dataframe. If None,
+            the selection is filtered and converted from dataframe.
+        well_index (WellIndex, optional): Precomputed search index of the result wells. Built if None.
     """
     st.subheader("📈 Interactive Trend Visualization")
 
@@ -66,26 +160,33 @@ def create_trend_plot(results: pd.DataFrame, dataframe: pd.DataFrame) -> None:
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        # Add quick selection options
-        all_wells = results.Well.unique()
+        # Add quick selection options; wells are searched on the server instead of listed in full
+        well_index = well_index or WellIndex(results.Well.unique())
+        summary = summary or ResultsSummary.from_results(results)
 
-        selection_type = st.radio("Selection Method:", ["Manual Selection", "Wells with Trends", "All Wells"], horizontal=True)
+        selection_type = st.radio(
+            "Selection Method:", ["Manual Selection", "Wells with Trends", "All Wells"], horizontal=True, key=TREND_PLOT_MODE_KEY
+        )
 
         if selection_type == "Manual Selection":
-            desired_wells = st.multiselect("Select Wells to Plot", all_wells, help="Choose specific wells to visualize")
+            desired_wells = well_selector(
+                "Select Wells to Plot", well_index, key=TREND_PLOT_WELLS_KEY, help="Choose specific wells to visualize"
+            )
         elif selection_type == "Wells with Trends":
-            trending_wells = results[results.Trend != "no trend"].Well.unique()
-            desired_wells = st.multiselect(
+            trending_wells = summary.significant_wells()
+            desired_wells = well_selector(
                 "Wells with Significant Trends",
-                trending_wells,
-                default=trending_wells[:5] if len(trending_wells) > 0 else [],
+                WellIndex(trending_wells),
+                key="trend_plot_trending_wells",
+                default=trending_wells[:5],
                 help="Pre-filtered to wells with detected trends",
             )
         else:  # All Wells
-            desired_wells = st.multiselect(
+            desired_wells = well_selector(
                 "All Wells",
-                all_wells,
-                default=all_wells[:3] if len(all_wells) > 0 else [],
+                well_index,
+                key="trend_plot_all_wells",
+                default=well_index.wells[:3],
                 help="All available wells (limited to first 3 by default for performance)",
             )
 
@@ -93,8 +194,7 @@ def create_trend_plot(results: pd.DataFrame, dataframe: pd.DataFrame) -> None:
         if len(desired_wells) > 0:
             # Show trend information for selected wells
             st.write("**Trend Summary:**")
-            selected_results = results[results.Well.isin(desired_wells)]
-            trend_summary = selected_results.Trend.value_counts()
+            trend_summary = summary.trend_distribution(wells=desired_wells)
 
             for trend, count in trend_summary.items():
                 if "increasing" in trend:
@@ -109,7 +209,7 @@ def create_trend_plot(results: pd.DataFrame, dataframe: pd.DataFrame) -> None:
         desired_component = get_desired_component(results, desired_wells)
 
         # Visualization options
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4 = st.columns(4)
 
         with col1:
             log_scale = choose_log_scale()
@@ -120,9 +220,14 @@ def create_trend_plot(results: pd.DataFrame, dataframe: pd.DataFrame) -> None:
         with col3:
             smooth_lines = st.checkbox("Smooth Lines", value=False)
 
+        with col4:
+            show_sens_lines = st.checkbox("Show Sen's Slope Lines", value=True, help="Trend lines fitted during the analysis")
+
         # Filter and prepare data
-        df_filtered = filter_well_component(dataframe, desired_wells, desired_component)
-        df_filtered = df_filtered.dropna()
+        if plot_data is not None:
+            df_filtered = plot_data.frame(desired_wells, desired_component)
+        else:
+            df_filtered = filter_well_component(dataframe, desired_wells, desired_component).dropna()
 
         if df_filtered.empty:
             st.warning("⚠️ No data available for the selected wells and component combination.")
@@ -162,11 +267,26 @@ def create_trend_plot(results: pd.DataFrame, dataframe: pd.DataFrame) -> None:
             plot_component = desired_component
             y_title = desired_component
 
-        # Create the plot with enhanced styling
-        if smooth_lines:
+        # Downsample long series and switch to WebGL traces for large plots
+        total_points = len(df_plot)
+        df_plot = downsample_frame(df_plot, plot_component, PLOT_MAX_POINTS_PER_SERIES)
+        use_webgl = len(df_plot) > PLOT_WEBGL_THRESHOLD
+        if len(df_plot) < total_points:
+            st.caption(
+                f"Showing {len(df_plot):,} of {total_points:,} points; "
+                "long series are downsampled preserving their shape."
+            )
+
+        # Create the plot with enhanced styling; Plotly Express is imported on first use to keep app start-up fast
+        import plotly.express as px
+
+        if smooth_lines and not use_webgl:
             fig = px.line(df_plot, x="Date", y=plot_component, color="well", title=title, line_shape="spline", log_y=False)
         else:
-            fig = px.line(df_plot, x="Date", y=plot_component, color="well", title=title, log_y=False)
+            fig = px.line(
+                df_plot, x="Date", y=plot_component, color="well", title=title, log_y=False,
+                render_mode="webgl" if use_webgl else "auto",
+            )
 
         # Add scatter points if requested
         if show_points:
@@ -181,26 +301,25 @@ def create_trend_plot(results: pd.DataFrame, dataframe: pd.DataFrame) -> None:
             height=500,
         )
 
+        # Trend rows of the plotted component, looked up once for all wells
+        component_results = results[results.Analise == desired_component].drop_duplicates("Well").set_index("Well")
+
+        # Overlay the Sen's slope lines stored with the results
+        if show_sens_lines and SENS_SLOPE_COLUMN in component_results.columns:
+            add_sens_slope_lines(fig, df_filtered, component_results, desired_component, log_scale)
+
         # Add trend annotations for each well
-        for well in desired_wells:
-            well_trend_data = results[(results.Well == well) & (results.Analise == desired_component)]
-            if not well_trend_data.empty:
-                trend = well_trend_data.iloc[0]["Trend"]
+        for position, well in enumerate(desired_wells):
+            if well in component_results.index:
+                trend = component_results.at[well, "Trend"]
                 if trend != "no trend":
                     # Add subtle trend indicator
-                    if "increasing" in trend:
-                        trend_symbol = "📈"
-                    elif "decreasing" in trend:
-                        trend_symbol = "📉"
-                    else:
-                        trend_symbol = "➡️"
-
                     fig.add_annotation(
-                        text=f"{well}: {trend_symbol}",
+                        text=f"{well}: {trend_symbol(trend)}",
                         xref="paper",
                         yref="paper",
                         x=0.02,
-                        y=0.98 - (list(desired_wells).index(well) * 0.05),
+                        y=0.98 - (position * 0.05),
                         showarrow=False,
                         font=dict(size=10),
                         bgcolor="rgba(255,255,255,0.8)",
@@ -220,31 +339,38 @@ def create_trend_plot(results: pd.DataFrame, dataframe: pd.DataFrame) -> None:
         st.info("👆 Please select one or more wells to create visualizations.")
 
 
-def display_results_table(results: pd.DataFrame) -> None:
+def display_results_table(results: Union[pd.DataFrame, MKResultSet], well_index: WellIndex = None) -> None:
     """
     Displays the results table with enhanced filtering and sorting options.
 
     Args:
-        results (pd.DataFrame): Results of the Mann Kendall test.
+        results (Union[pd.DataFrame, MKResultSet]): Results of the Mann Kendall test. Pass a
+            prebuilt MKResultSet to reuse its indexes across reruns.
+        well_index (WellIndex, optional): Precomputed search index of the result wells. Built if None.
     """
+    result_set = results if isinstance(results, MKResultSet) else MKResultSet.from_frame(results)
+
     st.subheader("📋 Detailed Results Table")
 
     # Enhanced filtering options
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        well_filter = st.multiselect(
-            "🏭 Filter by Wells", options=sorted(results.Well.unique()), default=[], help="Select specific wells to view"
+        well_filter = well_selector(
+            "🏭 Filter by Wells",
+            well_index or WellIndex(result_set.wells),
+            key="results_table_wells",
+            help="Select specific wells to view",
         )
 
     with col2:
         trend_filter = st.multiselect(
-            "📈 Filter by Trend", options=results.Trend.unique(), default=[], help="Filter by trend type"
+            "📈 Filter by Trend", options=list(result_set.trends), default=[], help="Filter by trend type"
         )
 
     with col3:
         component_filter = st.multiselect(
-            "🧪 Filter by Component", options=sorted(results.Analise.unique()), default=[], help="Select specific components"
+            "🧪 Filter by Component", options=list(result_set.components), default=[], help="Select specific components"
         )
 
     # Additional filtering options
@@ -252,8 +378,9 @@ def display_results_table(results: pd.DataFrame) -> None:
 
     with col1:
         # Confidence factor threshold
-        min_conf = float(results["Confidence Factor"].min())
-        max_conf = float(results["Confidence Factor"].max())
+        confidence = result_set.columns["Confidence Factor"]
+        min_conf = float(confidence.min()) if len(confidence) else 0.0
+        max_conf = float(confidence.max()) if len(confidence) else 0.0
 
         # Only show slider if there's a range of values
         if max_conf > min_conf:
@@ -274,81 +401,77 @@ def display_results_table(results: pd.DataFrame) -> None:
         # Show only significant trends option
         only_significant = st.checkbox("Show Only Significant Trends", help="Hide results with 'no trend'")
 
-    # Apply filters
-    filtered_results = results.copy()
-
-    if well_filter:
-        filtered_results = filtered_results[filtered_results.Well.isin(well_filter)]
-    if trend_filter:
-        filtered_results = filtered_results[filtered_results.Trend.isin(trend_filter)]
-    if component_filter:
-        filtered_results = filtered_results[filtered_results.Analise.isin(component_filter)]
-    if only_significant:
-        filtered_results = filtered_results[filtered_results.Trend != "no trend"]
-
-    filtered_results = filtered_results[filtered_results["Confidence Factor"] >= min_confidence]
+    # Apply filters on the indexed result set; only the selected rows are materialized
+    rows = result_set.filter(
+        wells=well_filter,
+        components=component_filter,
+        trends=trend_filter,
+        min_confidence=min_confidence,
+        significant_only=only_significant,
+    )
 
     # Display summary of filtered results
-    if len(filtered_results) != len(results):
-        st.info(f"📊 Showing {len(filtered_results)} of {len(results)} results after filtering")
+    if len(rows) != len(result_set):
+        st.info(f"📊 Showing {len(rows)} of {len(result_set)} results after filtering")
 
     # Sorting options
     col1, col2 = st.columns(2)
 
     with col1:
         sort_column = st.selectbox(
-            "Sort by:", options=["Well", "Analise", "Trend", "Mann-Kendall Statistic (S)", "Confidence Factor"], index=0
+            "Sort by:",
+            options=[
+                column
+                for column in ["Well", "Analise", "Trend", "Mann-Kendall Statistic (S)", "Confidence Factor", SENS_SLOPE_COLUMN]
+                if column in result_set.columns
+            ],
+            index=0,
         )
 
     with col2:
         sort_ascending = st.selectbox("Sort order:", ["Ascending", "Descending"]) == "Ascending"
 
-    # Apply sorting
-    if not filtered_results.empty:
-        filtered_results = filtered_results.sort_values(by=sort_column, ascending=sort_ascending).reset_index(drop=True)
-
-        # Style the dataframe for better readability
-        def style_trends(val):
-            if "increasing" in val:
-                return "background-color: #d4edda; color: #155724"
-            elif "decreasing" in val:
-                return "background-color: #f8d7da; color: #721c24"
-            else:
-                return "background-color: #d1ecf1; color: #0c5460"
-
-        # Display the styled results
-        styled_df = filtered_results.style.map(style_trends, subset=["Trend"]).format(
-            {"Mann-Kendall Statistic (S)": "{:.2f}", "Coefficient of Variation": "{:.4f}", "Confidence Factor": "{:.2f}"}
-        )
+    # Apply sorting; only the visible page is converted to a DataFrame and sent to the browser
+    rows = result_set.sort(sort_column, ascending=sort_ascending, rows=rows)
+    if len(rows) > 0:
+        n_pages = -(-len(rows) // RESULTS_PAGE_SIZE)
+        page = 1
+        if n_pages > 1:
+            page = st.number_input(
+                f"Page (of {n_pages}, {RESULTS_PAGE_SIZE} rows per page)", min_value=1, max_value=n_pages, value=1, step=1
+            )
+        page_rows = rows[(page - 1) * RESULTS_PAGE_SIZE : page * RESULTS_PAGE_SIZE]
+        page_results = result_set.to_frame(page_rows)
+        page_results["Trend"] = _trend_display_labels(result_set)[result_set.columns["Trend"][page_rows]]
 
-        st.dataframe(styled_df, use_container_width=True, height=400)
+        st.dataframe(page_results, use_container_width=True, hide_index=True, column_config=RESULTS_COLUMN_CONFIG)
 
         # Export options for filtered data
         if st.button("📥 Download Filtered Results", type="secondary"):
-            csv = filtered_results.to_csv(index=False)
+            csv = result_set.to_frame(rows).to_csv(index=False)
             st.download_button(label="Download as CSV", data=csv, file_name="mann_kendall_filtered_results.csv", mime="text/csv")
 
     else:
         st.warning("⚠️ No results match the current filter criteria. Try adjusting your filters.")
 
     # Quick statistics for filtered results
-    if not filtered_results.empty:
+    if len(rows) > 0:
         with st.expander("📊 Quick Statistics for Filtered Results"):
             col1, col2, col3, col4 = st.columns(4)
 
             with col1:
-                st.metric("Total Results", len(filtered_results))
+                st.metric("Total Results", len(rows))
             with col2:
-                st.metric("Unique Wells", filtered_results.Well.nunique())
+                st.metric("Unique Wells", result_set.nunique("Well", rows))
             with col3:
-                st.metric("Unique Components", filtered_results.Analise.nunique())
-            with col4:
-                significant_count = len(filtered_results[filtered_results.Trend != "no trend"])
-                st.metric("Significant Trends", significant_count)
+                st.metric("Unique Components", result_set.nunique("Analise", rows))
 
             # Trend distribution for filtered results
-            trend_dist = filtered_results.Trend.value_counts()
+            trend_dist = result_set.trend_counts(rows)
+            with col4:
+                st.metric("Significant Trends", int(trend_dist.drop("no trend", errors="ignore").sum()))
+
             st.write("**Trend Distribution:**")
             for trend, count in trend_dist.items():
-                percentage = (count / len(filtered_results)) * 100
+                percentage = (count / len(rows)) * 100
                 st.write(f"- {trend.title()}: {count} ({percentage:.1f}%)")
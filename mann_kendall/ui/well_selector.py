@@ -0,0 +1,129 @@
+"""
+Searchable well selector for sites with many wells.
+
+Passing every well of a large site to ``st.multiselect`` sends thousands of
+options to the browser on each rerun. The selector here searches a sorted
+well index on the server and only offers the matching candidates (plus the
+wells already selected) to the widget.
+"""
+
+import sys
+from typing import Hashable, Iterable, List, Optional
+
+import numpy as np
+import streamlit as st
+
+from mann_kendall.core.constants import WELL_SEARCH_LIMIT
+
+
+class WellIndex:
+    """
+    Case-insensitive prefix and substring search over well names.
+
+    Examples:
+        >>> index = WellIndex(["MW-01", "MW-02", "PZ-10"])
+        >>> index.search("mw")
+        ['MW-01', 'MW-02']
+        >>> index.search("10")
+        ['PZ-10']
+    """
+
+    def __init__(self, wells: Iterable[Hashable]):
+        """
+        Args:
+            wells: Well names as they appear in the results, e.g. str or numeric headers
+                (duplicates are ignored); only the search keys are converted to text
+        """
+        names = list(dict.fromkeys(wells))
+        try:
+            names.sort()
+        except TypeError:
+            names.sort(key=str)  # Mixed types
+        keys = np.array([str(name).lower() for name in names], dtype=object)
+        order = np.argsort(keys, kind="stable")
+        self.wells = names  # Sorted by name
+        self._names = np.empty(len(names), dtype=object)
+        self._names[:] = names
+        self._names = self._names[order]  # Sorted by lowercase name
+        self._keys = keys[order]
+        self._members = set(self.wells)
+
+    def __len__(self) -> int:
+        return len(self.wells)
+
+    def __contains__(self, well: Hashable) -> bool:
+        return well in self._members
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the names, search keys and arrays."""
+        strings = sum(sys.getsizeof(name) + sys.getsizeof(key) for name, key in zip(self._names, self._keys))
+        return strings + self._names.nbytes + self._keys.nbytes
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Hashable]:
+        """
+        Find wells whose name starts with or contains the query.
+
+        Prefix matches come first, in name order, followed by other substring matches.
+
+        Args:
+            query: Text to search for; an empty query matches every well
+            limit: Maximum number of wells to return (all matches if None)
+
+        Returns:
+            Matching well names, as given to the index
+        """
+        query = query.strip().lower()
+        if not query:
+            return self.wells[:limit]
+
+        # Prefix matches are a contiguous range of the sorted keys
+        start = np.searchsorted(self._keys, query, side="left")
+        end = np.searchsorted(self._keys, query + "\uffff", side="left")
+        matches = list(self._names[start:end])
+        if limit is None or len(matches) < limit:
+            others = np.concatenate([self._keys[:start], self._keys[end:]])
+            names = np.concatenate([self._names[:start], self._names[end:]])
+            contains = np.fromiter((query in key for key in others), dtype=bool, count=len(others))
+            matches.extend(names[contains])
+        return matches[:limit]
+
+
+def well_selector(
+    label: str,
+    index: WellIndex,
+    key: str,
+    default: Optional[List[Hashable]] = None,
+    help: Optional[str] = None,
+) -> List[Hashable]:
+    """
+    Multiselect of wells whose options are narrowed by a server-side search box.
+
+    Only the first WELL_SEARCH_LIMIT matches and the wells already selected are sent
+    to the browser.
+
+    Args:
+        label: Label of the multiselect
+        index: Index of the wells to choose from
+        key: Widget key; the search box uses f"{key}_search"
+        default: Wells selected when the widget is first shown
+        help: Tooltip of the multiselect
+
+    Returns:
+        Selected wells
+    """
+    if key not in st.session_state and default:
+        st.session_state[key] = list(default)
+    selected = [well for well in st.session_state.get(key, []) if well in index]
+    if key in st.session_state:
+        # The widget's options change with the search, which resets a multiselect; carry the
+        # selection over explicitly (dropping wells of a previous analysis)
+        st.session_state[key] = selected
+
+    query = st.text_input(f"🔍 Search {label.lower()}", key=f"{key}_search", placeholder="Type part of a well name")
+    selected_set = set(selected)
+    candidates = [well for well in index.search(query, limit=WELL_SEARCH_LIMIT + len(selected) + 1) if well not in selected_set]
+    if len(candidates) > WELL_SEARCH_LIMIT:
+        st.caption(f"Showing the first {WELL_SEARCH_LIMIT} matching wells; type to narrow the list.")
+
+    return st.multiselect(label, selected + candidates[:WELL_SEARCH_LIMIT], key=key, help=help)
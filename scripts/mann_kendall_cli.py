@@ -3,49 +3,134 @@
 """
 Command line interface for Mann Kendall Automated.
 
-Allows processing Excel files via command line and saving results.
+Allows processing Excel, CSV, Parquet and Feather files via command line and saving results.
 Supports batch processing, verbose output, and various export formats.
 """
 
 import argparse
+import glob
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+import pandas as pd
+
 # Add the parent directory to Python path so we can import the package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from mann_kendall.core.processor import generate_mann_kendall
-from mann_kendall.data.loader import load_excel_data
-from mann_kendall.utils.logging_config import setup_logging
-
-
-def parse_args():
+from mann_kendall.core.constants import (
+    MAX_FILE_SIZE_BYTES,
+    SUPPORTED_COMPRESSIONS,
+    SUPPORTED_FILE_EXTENSIONS,
+    SUPPORTED_OUTPUT_FORMATS,
+    WATCH_POLL_INTERVAL,
+    WATCH_QUEUE_SIZE,
+)
+from mann_kendall.core.pipeline import run_pipeline
+from mann_kendall.core.processor import (
+    RESULT_COLUMNS,
+    generate_mann_kendall,
+    generate_mann_kendall_by_sheet,
+    iter_mann_kendall,
+)
+from mann_kendall.core.summary import ResultsSummary
+from mann_kendall.core.watcher import FolderWatcher
+from mann_kendall.data.loader import load_data, load_excel_sheets
+from mann_kendall.data.writer import (
+    COMPRESSION_SUFFIXES,
+    STREAMING_OUTPUT_FORMATS,
+    StreamingResultWriter,
+    atomic_output_path,
+    batch_output_files,
+    default_output_file,
+    new_run_id,
+    save_results,
+)
+from mann_kendall.utils.logging_config import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+
+def parse_args(argv=None):
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
         description="Mann Kendall Automated - Trend Analysis CLI",
         epilog="Examples:\n"
         "  %(prog)s data.xlsx\n"
         "  %(prog)s data.xlsx -o results.xlsx --verbose\n"
-        "  %(prog)s data.xlsx --format csv --log-level DEBUG\n",
+        "  %(prog)s data.xlsx --format csv --log-level DEBUG\n"
+        "  %(prog)s lims_export.parquet --max-file-size 4096\n"
+        "  %(prog)s site.xlsx --sheets all --jobs 4\n"
+        "  %(prog)s sites/ 'archive/**/*.xlsx' --jobs 8 --output-dir results/\n"
+        "  %(prog)s sites/ --merge -o all_sites.csv --format csv\n"
+        "  %(prog)s sites/ --pipeline --jobs 8 --output-dir results/\n"
+        "  %(prog)s sites/ --merge -o results.sqlite --format sqlite --run-id 2024-Q1\n"
+        "  %(prog)s data.xlsx --format ndjson --compress gzip\n"
+        "  %(prog)s watch incoming/ --format csv --jobs 4\n",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
-        "input_file",
-        help="Path to input Excel file (.xlsx or .xls)",
+        "input_files",
+        nargs="+",
+        metavar="input_file",
+        help=f"Input files, glob patterns or directories ({', '.join(SUPPORTED_FILE_EXTENSIONS)})",
     )
     parser.add_argument(
         "-o",
         "--output",
-        help="Path to output file (default: <input>_mann_kendall_results.<format>)",
+        help="Path to output file (default: <input>_mann_kendall_results.<format>, "
+        "or mann_kendall_results.<format> with --merge)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="Directory for per-file outputs (default: current directory); same-named inputs "
+        "from different directories get mirrored subdirectories",
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Merge the results of all input files into one output with a 'Source File' column",
     )
     parser.add_argument(
         "--format",
-        choices=["xlsx", "csv", "json"],
+        choices=SUPPORTED_OUTPUT_FORMATS,
         default="xlsx",
         help="Output format (default: xlsx)",
     )
+    parser.add_argument(
+        "--compress",
+        choices=SUPPORTED_COMPRESSIONS,
+        help="Compress csv/ndjson output (zstd requires the zstandard package)",
+    )
+    parser.add_argument(
+        "--run-id",
+        help="Run identifier stored with sqlite results (default: timestamp plus random suffix)",
+    )
+    parser.add_argument(
+        "--max-file-size",
+        type=float,
+        default=MAX_FILE_SIZE_BYTES / (1024 * 1024),
+        help="Maximum input file size in MB (default: %(default).0f)",
+    )
+    parser.add_argument(
+        "--sheets",
+        help="Excel sheets to analyze: 'all' or a comma-separated list of names (default: first sheet)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes for concurrent analysis (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Process files through an asyncio pipeline that overlaps reading, parsing, analysis and writing",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -68,7 +153,233 @@ def parse_args():
         help="Print summary statistics after processing",
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def parse_watch_args(argv):
+    """Parse command line arguments of the watch subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="mann-kendall watch",
+        description="Watch a directory and analyze new or changed input files as they arrive. "
+        "Results are written next to each input as <input>_mann_kendall_results.<format>.",
+    )
+    parser.add_argument("directory", help="Directory to watch")
+    parser.add_argument(
+        "--format",
+        choices=SUPPORTED_OUTPUT_FORMATS,
+        default="xlsx",
+        help="Output format (default: xlsx)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=2,
+        help="Number of worker threads (default: 2). Threads share the result cache; the CPU-bound "
+        "analysis runs largely one file at a time under the GIL, so extra workers mainly overlap I/O",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=WATCH_QUEUE_SIZE,
+        help="Maximum number of files waiting for a worker (default: %(default)d)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=WATCH_POLL_INTERVAL,
+        help="Seconds between directory scans (default: %(default).1f)",
+    )
+    parser.add_argument(
+        "--max-file-size",
+        type=float,
+        default=MAX_FILE_SIZE_BYTES / (1024 * 1024),
+        help="Maximum input file size in MB (default: %(default).0f)",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="INFO",
+        help="Logging level (default: INFO)",
+    )
+    parser.add_argument(
+        "--log-file",
+        help="Path to log file (optional, logs to console if not specified)",
+    )
+
+    return parser.parse_args(argv)
+
+
+def watch_main(argv):
+    """Run the long-lived watch mode."""
+    args = parse_watch_args(argv)
+    logger = setup_logging(level=args.log_level, log_file=args.log_file)
+
+    try:
+        watcher = FolderWatcher(
+            args.directory,
+            output_format=args.format,
+            workers=args.jobs,
+            queue_size=args.queue_size,
+            interval=args.interval,
+            max_size=int(args.max_file_size * 1024 * 1024),
+        )
+    except FileNotFoundError as e:
+        logger.error("%s", e)
+        sys.exit(f"Error: {e}")
+
+    watcher.run()
+
+
+def _is_lock_file(path):
+    """Return True for temporary lock files Excel creates next to open workbooks."""
+    return path.name.startswith("~$")
+
+
+def expand_input_paths(patterns):
+    """
+    Expand input arguments into a list of files.
+
+    Directories contribute their supported files (non-recursive), glob patterns are
+    expanded (``**`` matches recursively) and plain paths are kept as given.
+    Duplicates are dropped while preserving order.
+
+    Args:
+        patterns: Paths, glob patterns or directories from the command line
+
+    Returns:
+        List of input file paths
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(
+                str(path)
+                for path in Path(pattern).iterdir()
+                if path.is_file() and path.suffix.lower() in SUPPORTED_FILE_EXTENSIONS and not _is_lock_file(path)
+            )
+        elif glob.has_magic(pattern):
+            matches = sorted(
+                path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path) and not _is_lock_file(Path(path))
+            )
+        else:
+            matches = [pattern]
+
+        for path in matches:
+            if path not in paths:
+                paths.append(path)
+
+    return paths
+
+
+def analyze_file(input_file, sheets=None, max_size=MAX_FILE_SIZE_BYTES, jobs=None, verbose=False, show_progress=True):
+    """
+    Load one input file and run the Mann-Kendall analysis on it.
+
+    Args:
+        input_file: Path to the input file
+        sheets: Value of --sheets ('all' or comma-separated names), or None for the first sheet
+        max_size: Maximum input file size in bytes
+        jobs: Worker processes used for multi-sheet analysis
+        verbose: Print loading details
+        show_progress: Print the terminal progress bar
+
+    Returns:
+        DataFrame with Mann-Kendall test results
+    """
+    if sheets:
+        # Load the requested sheets in one pass and analyze them concurrently
+        sheet_names = None if sheets == "all" else [name.strip() for name in sheets.split(",")]
+        logger.info("Loading sheets from Excel file...")
+        frames = load_excel_sheets(input_file, sheet_names, max_size=max_size)
+        logger.info("Loaded %d sheets", len(frames))
+
+        if verbose:
+            print(f"Loaded {len(frames)} sheets: {', '.join(map(str, frames))}")
+
+        logger.info("Running Mann-Kendall analysis...")
+        results, _ = generate_mann_kendall_by_sheet(frames, max_workers=jobs, show_progress=show_progress)
+    else:
+        # Load data
+        logger.info("Loading data from input file...")
+        df = load_data(input_file, max_size=max_size)
+        logger.info("Data loaded successfully: %d rows, %d columns", len(df), len(df.columns))
+
+        if verbose:
+            print(f"Loaded {len(df)} rows with {len(df.columns)} wells")
+
+        # Process data
+        logger.info("Running Mann-Kendall analysis...")
+        results, _ = generate_mann_kendall(df, show_progress=show_progress)
+
+    logger.info("Analysis complete: %d results generated", len(results))
+    return results
+
+
+def stream_file_results(input_file, output_file, output_format, max_size=MAX_FILE_SIZE_BYTES, compression=None):
+    """
+    Analyze one input file, writing each well's results as soon as they are computed.
+
+    Results are never accumulated: a background writer serializes (and compresses)
+    them while the next wells are analyzed. They are streamed into a temporary file
+    that replaces output_file only once the analysis succeeds, so a failed run never
+    leaves a truncated output or overwrites an earlier one.
+
+    Args:
+        input_file: Path to the input file
+        output_file: Path to the output file
+        output_format: "csv" or "ndjson"
+        max_size: Maximum input file size in bytes
+        compression: Optional "gzip" or "zstd"
+
+    Returns:
+        Number of results written
+    """
+    logger.info("Loading data from input file...")
+    df = load_data(input_file, max_size=max_size)
+
+    logger.info("Streaming Mann-Kendall results to %s", output_file)
+    with atomic_output_path(output_file, output_format) as tmp_path:
+        with StreamingResultWriter(tmp_path, output_format, compression) as writer:
+            for well_results in iter_mann_kendall(df, show_progress=True):
+                writer.write(well_results)
+            if writer.rows == 0:
+                # Like save_results, an empty CSV still gets its header
+                writer.write(pd.DataFrame(columns=RESULT_COLUMNS))
+    return writer.rows
+
+
+def process_batch_file(input_file, sheets, max_size, output_format, output_file, run_id=None, compression=None):
+    """
+    Analyze one file of a batch run and time it.
+
+    Runs inside a worker process. Failures are captured in the returned record so
+    one bad file does not abort the batch.
+
+    Args:
+        input_file: Path to the input file
+        sheets: Value of --sheets
+        max_size: Maximum input file size in bytes
+        output_format: Output format extension
+        output_file: Path of the per-file output (from batch_output_files), or None to skip writing (merge mode)
+        run_id: Run identifier for sqlite output
+        compression: Compression for csv/ndjson output
+
+    Returns:
+        Dict with file, results, output, seconds and error
+    """
+    start = time.perf_counter()
+    record = {"file": input_file, "results": None, "output": None, "seconds": 0.0, "error": None}
+    try:
+        # Sheets are analyzed sequentially here: files already run in parallel
+        record["results"] = analyze_file(input_file, sheets, max_size, jobs=1, show_progress=False)
+        if output_file is not None:
+            record["output"] = save_results(record["results"], output_file, output_format, run_id=run_id, compression=compression)
+    except Exception as e:
+        logger.error("Failed to process %s: %s", input_file, e)
+        record["error"] = str(e)
+    record["seconds"] = time.perf_counter() - start
+    return record
 
 
 def print_summary(results):
@@ -78,33 +389,165 @@ def print_summary(results):
     Args:
         results: DataFrame with Mann-Kendall test results
     """
+    summary = ResultsSummary.from_results(results)
+
     print("\n" + "=" * 60)
     print("MANN-KENDALL ANALYSIS SUMMARY")
     print("=" * 60)
 
-    total_analyses = len(results)
-    unique_wells = len(results["Well"].unique())
-    unique_components = len(results["Analise"].unique())
+    total_analyses = summary.total
 
     print(f"Total analyses performed: {total_analyses}")
-    print(f"Unique wells: {unique_wells}")
-    print(f"Unique components: {unique_components}")
+    print(f"Unique wells: {len(summary.wells)}")
+    print(f"Unique components: {len(summary.components)}")
 
     print("\nTrend Distribution:")
-    trend_counts = results["Trend"].value_counts()
-    for trend, count in trend_counts.items():
+    for trend, count in summary.trend_distribution().items():
         percentage = (count / total_analyses) * 100
         print(f"  {trend:25s}: {count:4d} ({percentage:5.1f}%)")
 
-    if "Confidence Factor" in results.columns:
-        avg_cf = results["Confidence Factor"].mean()
-        print(f"\nAverage Confidence Factor: {avg_cf:.3f}")
+    print(f"\nAverage Confidence Factor: {summary.mean_confidence():.3f}")
 
     print("=" * 60 + "\n")
 
 
+def print_timing_table(records, wall_time):
+    """
+    Print per-file status and timing of a batch run.
+
+    Args:
+        records: Records returned by process_batch_file, in input order
+        wall_time: Elapsed wall-clock time of the whole batch in seconds
+    """
+    print("\n" + "=" * 80)
+    print("BATCH TIMING")
+    print("=" * 80)
+    print(f"{'File':46s} {'Status':8s} {'Results':>10s} {'Seconds':>10s}")
+    print("-" * 80)
+
+    # Paths relative to the inputs' common directory tell same-named files in different directories apart
+    common = os.path.commonpath([os.path.dirname(os.path.abspath(record["file"])) for record in records]) if records else ""
+    for record in records:
+        name = os.path.relpath(os.path.abspath(record["file"]), common)
+        name = name if len(name) <= 46 else "..." + name[-43:]
+        status = "failed" if record["error"] else "ok"
+        count = len(record["results"]) if record["results"] is not None else 0
+        print(f"{name:46s} {status:8s} {count:10d} {record['seconds']:10.2f}")
+
+    failed = sum(1 for record in records if record["error"])
+    cpu_time = sum(record["seconds"] for record in records)
+    print("-" * 80)
+    print(
+        f"{len(records)} files ({len(records) - failed} ok, {failed} failed) in {wall_time:.2f}s wall time, "
+        f"{cpu_time:.2f}s summed per-file time"
+    )
+    print("=" * 80)
+
+
+def run_batch(input_files, args, max_size):
+    """
+    Process many input files concurrently in a worker pool, or through the asyncio pipeline with --pipeline.
+
+    Args:
+        input_files: Expanded list of input files
+        args: Parsed command line arguments
+        max_size: Maximum input file size in bytes
+
+    Returns:
+        Number of files that failed
+    """
+    start = time.perf_counter()
+    output_dir = None if args.merge else (args.output_dir or "")
+    output_files = {}
+    if output_dir is not None:
+        # Resolve every output before starting so no two workers write to the same file
+        try:
+            output_files = batch_output_files(input_files, args.format, output_dir, args.compress)
+        except ValueError as e:
+            sys.exit(f"Error: {e}")
+
+    worker = partial(
+        process_batch_file,
+        sheets=args.sheets,
+        max_size=max_size,
+        output_format=args.format,
+        run_id=args.run_id,
+        compression=args.compress,
+    )
+
+    logger.info("Processing %d files with %s workers", len(input_files), args.jobs or os.cpu_count())
+    records = {}
+    if args.pipeline:
+
+        def on_complete(record):
+            records[record["file"]] = record
+            if args.verbose:
+                _print_batch_progress(record, len(records), len(input_files))
+
+        run_pipeline(
+            input_files,
+            args.format,
+            output_dir,
+            max_size,
+            jobs=args.jobs,
+            on_complete=on_complete,
+            run_id=args.run_id,
+            compression=args.compress,
+        )
+    elif args.jobs == 1:
+        for input_file in input_files:
+            records[input_file] = worker(input_file, output_file=output_files.get(input_file))
+            if args.verbose:
+                _print_batch_progress(records[input_file], len(records), len(input_files))
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [
+                executor.submit(worker, input_file, output_file=output_files.get(input_file)) for input_file in input_files
+            ]
+            for future in as_completed(futures):
+                record = future.result()
+                records[record["file"]] = record
+                if args.verbose:
+                    _print_batch_progress(record, len(records), len(input_files))
+
+    ordered = [records[input_file] for input_file in input_files]
+    succeeded = [record for record in ordered if not record["error"]]
+
+    if args.merge and succeeded:
+        merged = pd.concat(
+            [record["results"].assign(**{"Source File": record["file"]}) for record in succeeded],
+            ignore_index=True,
+        )
+        merged = merged[["Source File"] + [column for column in merged.columns if column != "Source File"]]
+        output_file = args.output or f"mann_kendall_results.{args.format}" + COMPRESSION_SUFFIXES.get(args.compress, "")
+        save_results(merged, output_file, args.format, run_id=args.run_id, compression=args.compress)
+        print(output_file)
+    elif not args.verbose:
+        for record in succeeded:
+            print(record["output"])
+
+    print_timing_table(ordered, time.perf_counter() - start)
+    if succeeded:
+        print_summary(pd.concat([record["results"] for record in succeeded], ignore_index=True))
+
+    return len(ordered) - len(succeeded)
+
+
+def _print_batch_progress(record, done, total):
+    """Print one line per finished file in verbose batch mode."""
+    if record["error"]:
+        print(f"[{done}/{total}] ✗ {record['file']}: {record['error']}")
+    else:
+        target = f" -> {record['output']}" if record["output"] else ""
+        print(f"[{done}/{total}] ✓ {record['file']}{target} ({record['seconds']:.2f}s)")
+
+
 def main():
     """Main CLI function."""
+    if len(sys.argv) > 1 and sys.argv[1] == "watch":
+        watch_main(sys.argv[2:])
+        return
+
     args = parse_args()
 
     # Setup logging
@@ -114,48 +557,69 @@ def main():
     )
 
     start_time = datetime.now()
+    max_size = int(args.max_file_size * 1024 * 1024)
+    if args.compress and args.format not in STREAMING_OUTPUT_FORMATS:
+        sys.exit(f"Error: --compress is only supported with {' and '.join(STREAMING_OUTPUT_FORMATS)} output.")
+
+    # One run id for every file of this invocation
+    args.run_id = args.run_id or new_run_id()
+
+    input_files = expand_input_paths(args.input_files)
+    if not input_files:
+        logger.error("No input files matched: %s", " ".join(args.input_files))
+        sys.exit("Error: No input files matched the given paths or patterns.")
+
+    if len(input_files) > 1 or args.merge or args.pipeline:
+        if args.output and not args.merge:
+            sys.exit("Error: --output can only be used with a single input file or with --merge.")
+        if args.pipeline and args.sheets:
+            sys.exit("Error: --pipeline does not support --sheets.")
+
+        missing = [input_file for input_file in input_files if not os.path.exists(input_file)]
+        if missing:
+            logger.error("Input files not found: %s", ", ".join(missing))
+            sys.exit(f"Error: Input file '{missing[0]}' not found.")
+
+        logger.info("Starting Mann-Kendall batch analysis of %d files", len(input_files))
+        failed = run_batch(input_files, args, max_size)
+        if failed:
+            sys.exit(f"Error: {failed} of {len(input_files)} files failed.")
+        return
+
+    input_file = input_files[0]
 
     # Validate input file
-    if not os.path.exists(args.input_file):
-        logger.error("Input file not found: %s", args.input_file)
-        sys.exit(f"Error: Input file '{args.input_file}' not found.")
+    if not os.path.exists(input_file):
+        logger.error("Input file not found: %s", input_file)
+        sys.exit(f"Error: Input file '{input_file}' not found.")
 
     logger.info("Starting Mann-Kendall analysis")
-    logger.info("Input file: %s", args.input_file)
+    logger.info("Input file: %s", input_file)
 
     if args.verbose:
-        print(f"Processing file: {args.input_file}")
+        print(f"Processing file: {input_file}")
         print(f"Log level: {args.log_level}")
         print(f"Output format: {args.format}")
 
     try:
-        # Load data
-        logger.info("Loading data from Excel file...")
-        df = load_excel_data(args.input_file)
-        logger.info("Data loaded successfully: %d rows, %d columns", len(df), len(df.columns))
-
-        if args.verbose:
-            print(f"Loaded {len(df)} rows with {len(df.columns)} wells")
-
-        # Process data
-        logger.info("Running Mann-Kendall analysis...")
-        results, df_transposed = generate_mann_kendall(df)
-        logger.info("Analysis complete: %d results generated", len(results))
-
         # Determine output file path
         output_file = args.output
         if not output_file:
-            base_name = os.path.splitext(os.path.basename(args.input_file))[0]
-            output_file = f"{base_name}_mann_kendall_results.{args.format}"
+            if args.output_dir:
+                os.makedirs(args.output_dir, exist_ok=True)
+            output_file = default_output_file(input_file, args.format, args.output_dir, args.compress)
+
+        if args.format in STREAMING_OUTPUT_FORMATS and not (args.sheets or args.summary or args.verbose):
+            # Nothing needs the full result set: write results as they are computed
+            count = stream_file_results(input_file, output_file, args.format, max_size, args.compress)
+            logger.info("Wrote %d results in %.2f seconds", count, (datetime.now() - start_time).total_seconds())
+            print(output_file)
+            return
+
+        results = analyze_file(input_file, args.sheets, max_size, jobs=args.jobs, verbose=args.verbose)
 
         # Save results based on format
-        logger.info("Saving results to: %s", output_file)
-        if args.format == "xlsx":
-            results.to_excel(output_file, index=False)
-        elif args.format == "csv":
-            results.to_csv(output_file, index=False)
-        elif args.format == "json":
-            results.to_json(output_file, orient="records", indent=2)
+        save_results(results, output_file, args.format, run_id=args.run_id, compression=args.compress)
 
         elapsed_time = (datetime.now() - start_time).total_seconds()
         logger.info("Processing completed in %.2f seconds", elapsed_time)
@@ -184,4 +648,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
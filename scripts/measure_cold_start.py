@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+"""
+Cold-start measurement for the Streamlit app.
+
+Every measurement runs in a fresh Python process so nothing is already imported,
+like a newly started container. Two timings are reported:
+
+- import: time to import the app module, the part of start-up the app controls
+- first render: time for a fresh process to import and run app.py once
+  (as Streamlit does when the first browser session connects)
+
+With --max-seconds the script exits with status 1 when the median first render
+is slower than the budget, so it can guard start-up time in CI.
+
+Example:
+    python scripts/measure_cold_start.py --runs 5 --max-seconds 3
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).parent.parent
+APP_MODULE = "mann_kendall.ui.app"
+APP_SCRIPT = ROOT / "app.py"
+
+# Modules that should only be loaded once the panel needing them renders (streamlit's
+# plotly theme imports plotly itself, so modules streamlit loads on its own are not reported)
+DEFERRED_MODULES = ("plotly", "plotly.express", "requests", "scipy.stats", "xlsxwriter")
+
+IMPORT_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [name for name in {deferred!r} if name in sys.modules]
+print(elapsed)
+print(",".join(loaded))
+"""
+
+STREAMLIT_SNIPPET = """
+import sys
+import streamlit
+print(",".join(name for name in {deferred!r} if name in sys.modules))
+"""
+
+RENDER_SNIPPET = """
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({script!r}, default_timeout=60).run()
+elapsed = time.perf_counter() - start
+if app.exception:
+    raise SystemExit("app raised: " + str(app.exception[0].message))
+print(elapsed)
+"""
+
+
+def run_snippet(code: str) -> List[str]:
+    """Runs code in a fresh interpreter from the repository root and returns its output lines."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=False
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or result.stdout.strip())
+    return result.stdout.strip().splitlines()
+
+
+def measure_import(module: str = APP_MODULE) -> tuple:
+    """
+    Imports a module in a fresh process.
+
+    Returns:
+        tuple: (seconds, deferred modules that were loaded anyway, other than by streamlit)
+    """
+    lines = run_snippet(IMPORT_SNIPPET.format(module=module, deferred=DEFERRED_MODULES))
+    loaded = set(lines[1].split(",")) if len(lines) > 1 and lines[1] else set()
+    streamlit_lines = run_snippet(STREAMLIT_SNIPPET.format(deferred=DEFERRED_MODULES))
+    if streamlit_lines:
+        loaded -= set(streamlit_lines[0].split(","))
+    return float(lines[0]), sorted(loaded)
+
+
+def measure_first_render(script: Path = APP_SCRIPT) -> float:
+    """Imports and runs the app script once in a fresh process and returns the seconds taken."""
+    return float(run_snippet(RENDER_SNIPPET.format(script=str(script)))[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure cold-start time of the Streamlit app")
+    parser.add_argument("--runs", type=int, default=3, help="Number of fresh processes per measurement")
+    parser.add_argument("--max-seconds", type=float, help="Fail if the median first render is slower than this")
+    args = parser.parse_args()
+
+    import_times, render_times, loaded = [], [], set()
+    for _ in range(args.runs):
+        seconds, deferred = measure_import()
+        import_times.append(seconds)
+        loaded.update(deferred)
+        render_times.append(measure_first_render())
+
+    import_median = statistics.median(import_times)
+    render_median = statistics.median(render_times)
+    print(f"import {APP_MODULE}: median {import_median:.3f}s, max {max(import_times):.3f}s")
+    print(f"first render of {APP_SCRIPT.name}: median {render_median:.3f}s, max {max(render_times):.3f}s")
+    if loaded:
+        print(f"warning: loaded at start-up although deferred: {', '.join(sorted(loaded))}")
+
+    if args.max_seconds is not None and render_median > args.max_seconds:
+        print(f"first render exceeds the {args.max_seconds:.3f}s budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
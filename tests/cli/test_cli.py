@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+"""Tests for the command line interface."""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from mann_kendall.core.processor import RESULT_COLUMNS
+from scripts import mann_kendall_cli
+from scripts.mann_kendall_cli import analyze_file, expand_input_paths, process_batch_file, stream_file_results
+
+# Get the path to the test files
+TEST_FILES_DIR = Path(__file__).parent.parent / "files"
+
+
+def test_expand_input_paths(tmp_path):
+    """Test expansion of directories, glob patterns and plain paths."""
+    for name in ["a.xlsx", "b.csv", "~$a.xlsx", "notes.txt"]:
+        (tmp_path / name).write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.xlsx").write_text("")
+
+    assert expand_input_paths([str(tmp_path)]) == [str(tmp_path / "a.xlsx"), str(tmp_path / "b.csv")]
+    assert expand_input_paths([str(tmp_path / "**" / "*.xlsx")]) == [
+        str(tmp_path / "a.xlsx"),
+        str(tmp_path / "sub" / "c.xlsx"),
+    ]
+    # Duplicates are dropped while preserving order
+    assert expand_input_paths([str(tmp_path / "b.csv"), str(tmp_path)]) == [
+        str(tmp_path / "b.csv"),
+        str(tmp_path / "a.xlsx"),
+    ]
+
+
+def test_process_batch_file(tmp_path):
+    """Test that a batch worker writes per-file output and captures failures."""
+    input_file = str(tmp_path / "site.xlsx")
+    shutil.copy(TEST_FILES_DIR / "example_input.xlsx", input_file)
+
+    output_file = str(tmp_path / "site_mann_kendall_results.csv")
+    record = process_batch_file(input_file, None, 10 * 1024 * 1024, "csv", output_file)
+    assert record["error"] is None
+    assert record["output"] == output_file
+    assert not record["results"].empty
+    assert Path(record["output"]).exists()
+
+    record = process_batch_file(str(tmp_path / "missing.xlsx"), None, 10 * 1024 * 1024, "csv", output_file)
+    assert record["error"] is not None
+    assert record["results"] is None
+
+
+def test_stream_file_results_keeps_previous_output_on_failure(tmp_path):
+    """A failed streaming run leaves the earlier output untouched and no temporary files."""
+    output_file = tmp_path / "site_mann_kendall_results.csv"
+    output_file.write_text("previous results\n")
+
+    with pytest.raises(Exception):
+        stream_file_results(str(TEST_FILES_DIR / "example_input_with_string.xlsx"), str(output_file), "csv")
+
+    assert output_file.read_text() == "previous results\n"
+    assert [path.name for path in tmp_path.iterdir()] == [output_file.name]
+
+
+def test_stream_file_results_writes_header_without_results(tmp_path, monkeypatch):
+    """An analysis without results still produces a CSV with the header row."""
+    monkeypatch.setattr(mann_kendall_cli, "iter_mann_kendall", lambda df, show_progress=True: iter(()))
+    output_file = tmp_path / "site_mann_kendall_results.csv"
+
+    assert stream_file_results(str(TEST_FILES_DIR / "example_input.xlsx"), str(output_file), "csv") == 0
+    assert output_file.read_text().strip() == ",".join(RESULT_COLUMNS)
+
+
+def test_analyze_file_rejects_bad_sheet_before_full_parse(tmp_path, monkeypatch):
+    """Missing or malformed requested sheets fail on the probe, before the workbook is parsed."""
+    raw = pd.read_excel(TEST_FILES_DIR / "example_input.xlsx", header=None)
+    input_file = str(tmp_path / "multi.xlsx")
+    with pd.ExcelWriter(input_file) as writer:
+        raw.to_excel(writer, sheet_name="Zone A", header=False, index=False)
+        pd.DataFrame({"date": ["2020-01-01", "2021-01-01"]}).to_excel(writer, sheet_name="Bad", header=False, index=False)
+
+    def full_parse(*args, **kwargs):
+        raise AssertionError("workbook parsed before the probe failed")
+
+    monkeypatch.setattr(pd, "read_excel", full_parse)
+    with pytest.raises(ValueError, match="Sheet 'Bad'"):
+        analyze_file(input_file, sheets="Zone A, Bad", show_progress=False)
+    with pytest.raises(ValueError, match="'Missing' not found"):
+        analyze_file(input_file, sheets="Zone A,Missing", show_progress=False)
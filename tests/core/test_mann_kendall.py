@@ -65,4 +65,35 @@ def test_mk_test_probably_decreasing():
     noise = np.random.normal(0, 1, 5)
     x = base + noise
     result = mk_test(x)
-    assert result.trend in ["probably decreasing", "decreasing", "no trend"]  # Depends on noise
\ No newline at end of file
+    assert result.trend in ["probably decreasing", "decreasing", "no trend"]  # Depends on noise
+
+def test_mk_test_sens_line():
+    """Sen's slope and intercept recover a linear series despite an outlier."""
+    x = 2.0 + 3.0 * np.arange(10)
+    x[4] = 100.0
+    result = mk_test(x)
+    assert result.slope == 3.0
+    assert result.intercept == 2.0
+
+
+def test_mk_test_sens_line_constant_series():
+    """A constant series gets a flat line at its value, not at zero."""
+    result = mk_test(np.full(6, 5.0))
+    assert result.slope == 0.0
+    assert result.intercept == 5.0
+
+
+def test_mk_test_sens_line_short_series():
+    """Series with fewer than 4 points still report Sen's line."""
+    two = mk_test(np.array([1.0, 3.0]))
+    assert (two.slope, two.intercept) == (2.0, 1.0)
+
+    three = mk_test(np.array([4.0, 6.0, 8.0]))
+    assert (three.slope, three.intercept) == (2.0, 4.0)
+
+
+def test_mk_test_sens_line_seasonal():
+    """The seasonal test reports the within-season slope, ignoring the seasonal swing."""
+    x = 10.0 + 0.5 * np.arange(48) + np.tile([0.0, 5.0, -5.0, 2.0], 12)
+    result = mk_test(x, seasonal=True, period=4)
+    assert result.slope == 0.5
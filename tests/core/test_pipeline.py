@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+"""Tests for pipeline.py module."""
+
+import shutil
+from pathlib import Path
+
+from mann_kendall.core.pipeline import run_pipeline
+
+# Get the path to the test files
+TEST_FILES_DIR = Path(__file__).parent.parent / "files"
+
+
+def test_run_pipeline(tmp_path):
+    """Test that files flow through all stages and failures are recorded per file."""
+    inputs = []
+    for name in ["a.xlsx", "b.xlsx"]:
+        shutil.copy(TEST_FILES_DIR / "example_input.xlsx", tmp_path / name)
+        inputs.append(str(tmp_path / name))
+    (tmp_path / "bad.csv").write_text("Site,W1,W1\nSampled,x,y\nNitrate,1,2\n")
+    inputs.append(str(tmp_path / "bad.csv"))
+
+    completed = []
+    records = run_pipeline(inputs, output_format="csv", output_dir=str(tmp_path), jobs=2, on_complete=completed.append)
+
+    assert [record["file"] for record in records] == inputs
+    assert len(completed) == 3
+    for record in records[:2]:
+        assert record["error"] is None
+        assert not record["results"].empty
+        assert Path(record["output"]).exists()
+    assert records[2]["error"] is not None
+    assert records[2]["results"] is None
+    assert set(records[0]) == {"file", "results", "output", "seconds", "error"}
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+"""Tests for processor.py module."""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from mann_kendall.core.processor import generate_mann_kendall, generate_mann_kendall_by_sheet, iter_mann_kendall
+from mann_kendall.data.loader import load_excel_data
+
+# Get the path to the test files
+TEST_FILES_DIR = Path(__file__).parent.parent / "files"
+
+
+@pytest.fixture
+def example_input():
+    """Load the example input workbook."""
+    return load_excel_data(os.path.join(TEST_FILES_DIR, "example_input.xlsx"))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_generate_mann_kendall_by_sheet(example_input, max_workers):
+    """Test that per-sheet results are tagged with the sheet name and combined in order."""
+    expected, _ = generate_mann_kendall(example_input)
+
+    results, transposed = generate_mann_kendall_by_sheet(
+        {"Zone A": example_input, "Zone B": example_input}, max_workers=max_workers
+    )
+
+    assert list(results.columns) == ["Sheet"] + list(expected.columns)
+    assert results["Sheet"].unique().tolist() == ["Zone A", "Zone B"]
+    assert len(results) == 2 * len(expected)
+    zone_b = results[results["Sheet"] == "Zone B"].drop(columns="Sheet").reset_index(drop=True)
+    pd.testing.assert_frame_equal(zone_b, expected)
+    assert set(transposed) == {"Zone A", "Zone B"}
+
+
+def test_generate_mann_kendall_by_sheet_pool_progress(example_input, capfd):
+    """Pooled sheets report progress from the parent only, one bar of finished sheets."""
+    generate_mann_kendall_by_sheet({"Zone A": example_input, "Zone B": example_input}, max_workers=2)
+
+    out = capfd.readouterr().out
+    assert "Processing wells:" not in out
+    assert "Processing sheets:" in out
+
+
+def test_iter_mann_kendall_matches_generate(example_input):
+    """Per-well streamed results concatenate to the batch results."""
+    expected, _ = generate_mann_kendall(example_input, show_progress=False)
+
+    streamed = pd.concat(list(iter_mann_kendall(example_input)), ignore_index=True)
+
+    pd.testing.assert_frame_equal(streamed, expected, check_dtype=False)
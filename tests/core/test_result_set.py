@@ -0,0 +1,67 @@
+"""Tests for result_set.py module."""
+
+import numpy as np
+import pandas as pd
+
+from mann_kendall.core.result_set import MKResultSet
+
+
+def _results():
+    return pd.DataFrame(
+        {
+            "Well": ["W2", "W1", "W1", "W2", "W3"],
+            "Analise": ["Nitrate", "Nitrate", "Chloride", "Chloride", "Nitrate"],
+            "Trend": ["increasing", "no trend", "decreasing", "increasing", "no trend"],
+            "Mann-Kendall Statistic (S)": [12.0, 1.0, -9.5, 8.0, 3.0],
+            "Coefficient of Variation": [0.2, 0.3, 0.4, 0.5, 0.6],
+            "Confidence Factor": [0.99, 0.5, 0.97, 0.96, 0.7],
+        }
+    )
+
+
+def test_round_trip():
+    """to_frame restores the original DataFrame."""
+    results = _results()
+    result_set = MKResultSet.from_frame(results)
+
+    assert len(result_set) == 5
+    assert list(result_set.wells) == ["W1", "W2", "W3"]
+    pd.testing.assert_frame_equal(result_set.to_frame(), results)
+
+
+def test_filter_matches_pandas():
+    """Indexed filters select the same rows as boolean masks on the DataFrame."""
+    results = _results()
+    result_set = MKResultSet.from_frame(results)
+
+    rows = result_set.filter(wells=["W1", "W2", "missing"], components=["Nitrate"], min_confidence=0.6)
+    expected = results[results.Well.isin(["W1", "W2"]) & (results.Analise == "Nitrate") & (results["Confidence Factor"] >= 0.6)]
+    assert rows.tolist() == expected.index.tolist()
+    assert result_set.filter(significant_only=True).tolist() == [0, 2, 3]
+    assert result_set.filter(trends=["decreasing"]).tolist() == [2]
+    assert result_set.rows_for_well("W2").tolist() == [0, 3]
+
+
+def test_sort_and_top_k():
+    """Sorting matches a stable pandas sort; top_k returns the k best rows in order."""
+    results = _results()
+    result_set = MKResultSet.from_frame(results)
+
+    for column in ["Well", "Trend", "Mann-Kendall Statistic (S)"]:
+        for ascending in (True, False):
+            expected = results.sort_values(column, ascending=ascending, kind="stable").index.tolist()
+            assert result_set.sort(column, ascending=ascending).tolist() == expected
+
+    assert result_set.top_k("Mann-Kendall Statistic (S)", 2).tolist() == [0, 3]
+    rows = result_set.filter(components=["Nitrate"])
+    assert result_set.top_k("Confidence Factor", 1, ascending=True, rows=rows).tolist() == [1]
+    assert len(result_set.top_k("Confidence Factor", 0)) == 0
+
+
+def test_trend_counts():
+    """Trend counts of a selection match value_counts."""
+    result_set = MKResultSet.from_frame(_results())
+
+    assert result_set.trend_counts().to_dict() == {"increasing": 2, "no trend": 2, "decreasing": 1}
+    assert result_set.trend_counts(np.array([0, 4])).to_dict() == {"increasing": 1, "no trend": 1}
+    assert result_set.nunique("Well", np.array([0, 3])) == 1
@@ -0,0 +1,50 @@
+"""Tests for summary.py module."""
+
+import pandas as pd
+import pytest
+
+from mann_kendall.core.summary import ResultsSummary
+
+
+def _results():
+    return pd.DataFrame(
+        {
+            "Well": ["W2", "W1", "W1", "W2"],
+            "Analise": ["Nitrate", "Nitrate", "Chloride", "Chloride"],
+            "Trend": ["increasing", "no trend", "decreasing", "increasing"],
+            "Mann-Kendall Statistic (S)": [12.0, 1.0, -9.5, 8.0],
+            "Coefficient of Variation": [0.2, 0.3, 0.4, 0.5],
+            "Confidence Factor": [0.99, 0.5, 0.97, 0.96],
+        }
+    )
+
+
+def test_cube_counts_and_ranges():
+    """Duplicate results fall into one cell with their count and statistic range."""
+    results = pd.concat([_results(), _results().assign(**{"Mann-Kendall Statistic (S)": [14.0, 1.0, -9.5, 8.0]})])
+    summary = ResultsSummary.from_results(results)
+
+    assert len(summary.cube) == 4
+    assert summary.total == 8
+    cell = summary.cube.set_index(["Well", "Analise"]).loc[("W2", "Nitrate")]
+    assert (cell["count"], cell["s_min"], cell["s_max"], cell["s_mean"]) == (2, 12.0, 14.0, 13.0)
+
+
+def test_summary_views():
+    """Views derived from the cube match direct computations on the results."""
+    results = _results()
+    summary = ResultsSummary.from_results(results)
+
+    assert summary.wells == ["W1", "W2"]
+    assert summary.components == ["Chloride", "Nitrate"]
+    assert summary.trend_distribution().to_dict() == results["Trend"].value_counts().to_dict()
+    assert summary.trend_distribution(wells=["W1"]).to_dict() == {"decreasing": 1, "no trend": 1}
+    assert summary.significant_count() == 3
+    assert summary.significant_wells() == ["W1", "W2"]
+    assert summary.statistic_range() == (-9.5, 12.0)
+    assert summary.mean_confidence() == pytest.approx(results["Confidence Factor"].mean())
+    pd.testing.assert_frame_equal(
+        summary.trend_table("Analise"),
+        results.groupby(["Analise", "Trend"]).size().unstack(fill_value=0),
+        check_names=False,
+    )
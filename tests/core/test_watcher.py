@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+"""Tests for watcher.py module."""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from mann_kendall.core import cache as cache_module
+from mann_kendall.core.cache import clear_cache, get_cache_info
+from mann_kendall.core.watcher import FolderWatcher
+
+# Get the path to the test files
+TEST_FILES_DIR = Path(__file__).parent.parent / "files"
+
+
+def test_scan_waits_for_file_to_settle(tmp_path):
+    """Test that a file is queued only after it is unchanged across two scans."""
+    shutil.copy(TEST_FILES_DIR / "example_input.xlsx", tmp_path / "site.xlsx")
+    (tmp_path / "other_mann_kendall_results.csv").write_text("")  # Ignored: a result file
+    watcher = FolderWatcher(str(tmp_path), output_format="csv")
+
+    assert watcher.scan() == []
+    assert watcher.scan() == [str(tmp_path / "site.xlsx")]
+    assert watcher.scan() == []
+
+
+def test_watcher_processes_files_and_reuses_cache(tmp_path):
+    """Test that results are written next to the input and unchanged series hit the cache."""
+    input_file = tmp_path / "site.xlsx"
+    shutil.copy(TEST_FILES_DIR / "example_input.xlsx", input_file)
+    watcher = FolderWatcher(str(tmp_path), output_format="csv")
+    clear_cache()
+
+    output_file = watcher.process(str(input_file))
+    assert output_file == str(tmp_path / "site_mann_kendall_results.csv")
+    results = pd.read_csv(output_file)
+    assert not results.empty
+    assert [path.name for path in tmp_path.iterdir() if path.name.startswith(".")] == []
+
+    misses = get_cache_info().misses
+    watcher.process(str(input_file))
+    assert get_cache_info().misses == misses
+
+
+def test_watcher_sizes_cache_to_watched_files(tmp_path, monkeypatch):
+    """The result cache grows to hold every series of a watched file without dropping results."""
+    monkeypatch.setattr(cache_module, "_cache", cache_module._ResultCache(4))
+    input_file = tmp_path / "site.xlsx"
+    shutil.copy(TEST_FILES_DIR / "example_input.xlsx", input_file)
+    watcher = FolderWatcher(str(tmp_path), output_format="csv")
+
+    watcher.process(str(input_file))
+    info = get_cache_info()
+    assert info.maxsize >= 2 * info.currsize > 0
+
+    misses = info.misses
+    watcher.process(str(input_file))
+    assert get_cache_info().misses == misses
@@ -8,7 +8,15 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from mann_kendall.data.loader import load_excel_data, validate_input_format
+from mann_kendall.data.loader import (
+    get_file_format,
+    load_csv_data,
+    load_data,
+    load_excel_data,
+    load_excel_sheets,
+    probe_input_format,
+    validate_input_format,
+)
 
 # Get the path to the test files
 TEST_FILES_DIR = Path(__file__).parent.parent / "files"
@@ -50,4 +58,106 @@ def test_validate_input_format_too_few_columns():
     }, index=["2020-01-01", "Component"])
     
     with pytest.raises(ValueError):
-        validate_input_format(df)
\ No newline at end of file
+        validate_input_format(df)
+
+def _write_grid(tmp_path):
+    """Write a small input grid (wells row, dates row, component rows) as CSV, Parquet and Feather."""
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    grid = pd.DataFrame(
+        [
+            [None, "Well1", "Well1", "Well1", "Well1", "Well1"],
+            ["Date", "2020-01-01", "2020-02-01", "2020-03-01", "2020-04-01", "2020-05-01"],
+            ["Nitrate", "1.0", "2.0", "3.0", "ND", "<5"],
+        ]
+    )
+    grid.to_csv(tmp_path / "input.csv", header=False, index=False)
+    table = pa.Table.from_pandas(grid.rename(columns=str), preserve_index=False)
+    pq.write_table(table, tmp_path / "input.parquet")
+    feather.write_feather(table, tmp_path / "input.feather")
+    return grid
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet", "feather"])
+def test_load_data_columnar_formats_match_excel_layout(tmp_path, extension):
+    """Test that CSV, Parquet and Feather inputs load into the Excel loader layout."""
+    _write_grid(tmp_path)
+    file_path = str(tmp_path / f"input.{extension}")
+
+    df = load_data(file_path)
+
+    assert df.shape == (3, 5)
+    assert list(df.columns) == [1, 2, 3, 4, 5]
+    assert pd.isna(df.index[0])
+    assert df.index[2] == "Nitrate"
+    assert df.iloc[2].tolist() == ["1.0", "2.0", "3.0", "ND", "<5"]
+
+    # Bytes input (as used by the Streamlit uploader) requires an explicit format
+    with open(file_path, "rb") as f:
+        df_bytes = load_data(f.read(), file_format=get_file_format(file_path))
+    pd.testing.assert_frame_equal(df, df_bytes)
+
+
+def test_load_csv_data_chunked(tmp_path):
+    """Test that chunked CSV parsing yields the same frame as a single chunk."""
+    _write_grid(tmp_path)
+    file_path = str(tmp_path / "input.csv")
+
+    pd.testing.assert_frame_equal(load_csv_data(file_path, chunk_size=1), load_csv_data(file_path))
+
+
+def test_get_file_format():
+    """Test input format detection from file extensions."""
+    assert get_file_format("site.xlsx") == "excel"
+    assert get_file_format("site.CSV") == "csv"
+    assert get_file_format("site.parquet") == "parquet"
+    assert get_file_format("site.arrow") == "feather"
+    with pytest.raises(ValueError):
+        get_file_format("site.txt")
+
+
+def test_load_excel_sheets(tmp_path):
+    """Test loading all or selected sheets of a workbook."""
+    raw = pd.read_excel(os.path.join(TEST_FILES_DIR, "example_input.xlsx"), header=None)
+    file_path = str(tmp_path / "multi.xlsx")
+    with pd.ExcelWriter(file_path) as writer:
+        raw.to_excel(writer, sheet_name="Zone A", header=False, index=False)
+        raw.to_excel(writer, sheet_name="Zone B", header=False, index=False)
+
+    sheets = load_excel_sheets(file_path)
+    assert list(sheets) == ["Zone A", "Zone B"]
+    pd.testing.assert_frame_equal(sheets["Zone B"], load_excel_data(file_path))
+
+    assert list(load_excel_sheets(file_path, ["Zone B"])) == ["Zone B"]
+    with pytest.raises(ValueError):
+        load_excel_sheets(file_path, ["Missing"])
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet", "feather"])
+def test_probe_input_format_valid(tmp_path, extension):
+    """Test that the header probe accepts well-formed inputs."""
+    _write_grid(tmp_path)
+    assert probe_input_format(str(tmp_path / f"input.{extension}"))
+
+
+def test_probe_input_format_excel():
+    """Test the header probe on an Excel workbook and rewinds file objects."""
+    file_path = os.path.join(TEST_FILES_DIR, "example_input.xlsx")
+    assert probe_input_format(file_path)
+
+    with open(file_path, "rb") as f:
+        assert probe_input_format(f)
+        assert f.tell() == 0
+
+
+def test_probe_input_format_rejects_bad_dates(tmp_path):
+    """Test that the header probe rejects a file without a date row before a full parse."""
+    file_path = tmp_path / "bad.csv"
+    file_path.write_text("Site,W1,W1\nSampled,x,y\nNitrate,1,2\n")
+
+    with pytest.raises(ValueError, match="valid dates"):
+        probe_input_format(str(file_path))
+    with pytest.raises(ValueError, match="valid dates"):
+        load_data(str(file_path))
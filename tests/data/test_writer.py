@@ -0,0 +1,157 @@
+"""Tests for writer.py module."""
+
+import gzip
+import json
+import os
+import sqlite3
+import stat
+from io import BytesIO
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+from mann_kendall.data.writer import (
+    EXCEL_HEADER_FORMAT,
+    StreamingResultWriter,
+    batch_output_files,
+    infer_compression,
+    save_results,
+    save_results_atomic,
+    write_excel_streaming,
+)
+
+
+def test_write_excel_streaming_round_trip():
+    """Typed and object columns survive the streaming writer across chunks."""
+    df = pd.DataFrame(
+        {
+            "well": ["W1", "W2", "W3"],
+            "Date": pd.to_datetime(["2020-01-01", "2020-02-01", None]),
+            "Value": [1.5, np.nan, 3.0],
+            "Mixed": ["ND", 2.0, None],
+        }
+    )
+    output = BytesIO()
+    write_excel_streaming({"Data": df, "Empty": pd.DataFrame(columns=["A"])}, output, chunk_rows=2)
+
+    output.seek(0)
+    workbook = openpyxl.load_workbook(output)
+    assert workbook.sheetnames == ["Data", "Empty"]
+    rows = list(workbook["Data"].iter_rows(values_only=True))
+    assert rows[0] == ("well", "Date", "Value", "Mixed")
+    assert rows[1][:3] == ("W1", pd.Timestamp("2020-01-01").to_pydatetime(), 1.5)
+    assert rows[1][3] == "ND"
+    assert rows[2][2] is None and rows[2][3] == 2.0
+    assert rows[3][1] is None and rows[3][3] is None
+
+    header = workbook["Data"]["A1"]
+    assert header.font.bold
+    assert header.fill.fgColor.rgb.endswith(EXCEL_HEADER_FORMAT["fg_color"].lstrip("#"))
+
+
+def test_save_results_xlsx(tmp_path):
+    """Excel results are written through the streaming writer and read back intact."""
+    results = pd.DataFrame({"Well": ["W1"], "Trend": ["increasing"], "Confidence Factor": [0.97]})
+    output_file = save_results(results, str(tmp_path / "results.xlsx"), "xlsx")
+
+    pd.testing.assert_frame_equal(pd.read_excel(output_file), results)
+
+
+def _results():
+    return pd.DataFrame(
+        {
+            "Well": ["W1", "W2"],
+            "Analise": ["Nitrate", "Nitrate"],
+            "Trend": ["increasing", "no trend"],
+            "Mann-Kendall Statistic (S)": [10, -2],
+            "Coefficient of Variation": [0.5, 0.7],
+            "Confidence Factor": [0.99, 0.6],
+        }
+    )
+
+
+def test_save_results_parquet_keeps_types(tmp_path):
+    """Parquet output stores identifiers as categories and statistics as floats."""
+    output_file = save_results(_results(), str(tmp_path / "results.parquet"), "parquet")
+    loaded = pd.read_parquet(output_file)
+
+    assert isinstance(loaded["Trend"].dtype, pd.CategoricalDtype)
+    assert loaded["Mann-Kendall Statistic (S)"].dtype == np.float64
+    assert loaded["Well"].tolist() == ["W1", "W2"]
+
+
+def test_save_results_sqlite_appends_runs(tmp_path):
+    """Each SQLite save appends a run with its id, and the lookup indexes exist."""
+    output_file = str(tmp_path / "results.sqlite")
+    save_results(_results(), output_file, "sqlite", run_id="run-1")
+    save_results(_results().assign(Sheet="Zone A"), output_file, "sqlite", run_id="run-2")
+
+    with sqlite3.connect(output_file) as conn:
+        counts = dict(conn.execute("SELECT run_id, COUNT(*) FROM mann_kendall_results GROUP BY run_id"))
+        runs = [row[0] for row in conn.execute("SELECT run_id FROM mann_kendall_runs ORDER BY run_id")]
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        sheets = [row[0] for row in conn.execute("SELECT sheet FROM mann_kendall_results ORDER BY rowid")]
+        statistic = conn.execute("SELECT statistic FROM mann_kendall_results WHERE well = 'W1'").fetchone()[0]
+
+    assert counts == {"run-1": 2, "run-2": 2}
+    assert runs == ["run-1", "run-2"]
+    assert {"idx_mann_kendall_results_well", "idx_mann_kendall_results_component"} <= indexes
+    assert sheets == [None, None, "Zone A", "Zone A"]
+    assert statistic == 10.0
+
+
+def test_streaming_result_writer_gzip_ndjson(tmp_path):
+    """Chunks written to a compressed NDJSON stream read back as one record per line."""
+    output_file = str(tmp_path / "results.ndjson.gz")
+    with StreamingResultWriter(output_file, "ndjson", infer_compression(output_file), queue_size=1) as writer:
+        for _, row in _results().iterrows():
+            writer.write(row.to_frame().T)
+
+    assert writer.rows == 2
+    with gzip.open(output_file, "rt", encoding="utf-8") as stream:
+        records = [json.loads(line) for line in stream]
+    assert [record["Well"] for record in records] == ["W1", "W2"]
+    assert records[0]["Confidence Factor"] == 0.99
+
+
+def test_save_results_csv_writes_header_once(tmp_path):
+    """CSV results streamed in chunks have a single header row."""
+    results = pd.concat([_results()] * 3, ignore_index=True)
+    output_file = save_results(results, str(tmp_path / "results.csv"), "csv")
+
+    pd.testing.assert_frame_equal(pd.read_csv(output_file), results, check_dtype=False)
+
+
+def test_save_results_atomic_file_mode(tmp_path):
+    """Atomic writes give new files the umask default mode and keep the mode of replaced files."""
+    plain_file = tmp_path / "plain.csv"
+    plain_file.write_text("")
+    output_file = save_results_atomic(_results(), str(tmp_path / "results.csv"), "csv")
+    assert stat.S_IMODE(os.stat(output_file).st_mode) == stat.S_IMODE(plain_file.stat().st_mode)
+
+    os.chmod(output_file, 0o640)
+    save_results_atomic(_results(), output_file, "csv")
+    assert stat.S_IMODE(os.stat(output_file).st_mode) == 0o640
+
+
+def test_batch_output_files_mirror_directories_on_name_clash(tmp_path):
+    """Same-named inputs in different directories get outputs in mirrored directories."""
+    inputs = [str(tmp_path / "a" / "site.xlsx"), str(tmp_path / "b" / "site.xlsx")]
+    out = str(tmp_path / "out")
+
+    outputs = batch_output_files(inputs, "csv", out)
+    assert outputs == {
+        inputs[0]: str(tmp_path / "out" / "a" / "site_mann_kendall_results.csv"),
+        inputs[1]: str(tmp_path / "out" / "b" / "site_mann_kendall_results.csv"),
+    }
+    assert (tmp_path / "out" / "a").is_dir()
+
+    # Distinct names keep the flat layout
+    assert batch_output_files([inputs[0], str(tmp_path / "b" / "other.xlsx")], "csv", out)[inputs[0]] == str(
+        tmp_path / "out" / "site_mann_kendall_results.csv"
+    )
+
+    with pytest.raises(ValueError, match="same output file"):
+        batch_output_files([inputs[0], str(tmp_path / "a" / "site.csv")], "csv", out)
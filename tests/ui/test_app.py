@@ -0,0 +1,20 @@
+"""Tests for app.py module."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.parent
+
+
+def test_app_import_defers_heavy_modules():
+    """Plotting, HTTP and statistics libraries are loaded only when a panel needs them."""
+    # Streamlit's plotly theme loads plotly itself, so only modules the app adds count
+    code = (
+        "import sys, streamlit; loaded = set(sys.modules); import mann_kendall.ui.app; "
+        "print([m for m in ('plotly', 'plotly.express', 'requests', 'scipy.stats', 'xlsxwriter') "
+        "if m in sys.modules and m not in loaded])"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
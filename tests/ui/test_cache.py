@@ -0,0 +1,125 @@
+"""Tests for cache.py module."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from mann_kendall.ui import cache
+from mann_kendall.ui.cache import ResultStore, analyze_upload, content_hash, load_upload
+
+EXAMPLE_FILE = Path(__file__).parent.parent / "files" / "example_input.xlsx"
+
+
+def test_result_store_evicts_least_recently_used():
+    """Entries beyond the byte budget are evicted oldest first."""
+    store = ResultStore(max_bytes=100)
+    store.put("a", "A", nbytes=40)
+    store.put("b", "B", nbytes=40)
+    store.get("a")  # "b" becomes least recently used
+    store.put("c", "C", nbytes=40)
+
+    assert "a" in store and "c" in store
+    assert "b" not in store
+    assert store.size == 80
+
+
+def test_result_store_keeps_held_entries():
+    """Held entries survive eviction until every holder releases them."""
+    store = ResultStore(max_bytes=100)
+    store.put("a", "A", nbytes=60)
+    store.acquire("a", "session-1")
+    store.acquire("a", "session-2")
+    store.put("b", "B", nbytes=60)
+
+    assert "a" in store and "b" in store
+    assert store.refcount("a") == 2
+
+    store.release("a", "session-1")
+    assert "a" in store
+    assert "b" not in store  # The only unheld entry, evicted to get back within budget
+
+    store.release("a", "session-2")
+    store.put("c", "C", nbytes=60)
+    assert "a" not in store
+
+
+def test_result_store_drops_holders_that_are_gone():
+    """Pins of inactive holders are ignored when evicting."""
+    store = ResultStore(max_bytes=100, is_holder_alive=lambda holder: holder != "closed")
+    store.put("a", "A", nbytes=60)
+    store.acquire("a", "closed")
+    store.put("b", "B", nbytes=60)
+
+    assert "a" not in store
+    assert store.refcount("a") == 0
+
+
+def test_result_store_computes_once_for_concurrent_callers():
+    """Concurrent misses on the same key share one computation."""
+    store = ResultStore(max_bytes=1000)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    threads = [threading.Thread(target=store.get_or_compute, args=("k", compute)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert store.get("k") == "value"
+
+
+def test_load_and_analyze_upload_are_memoized():
+    """Repeated calls with the same content reuse the cached parse and analysis."""
+    cache.clear_upload_cache()
+    data = EXAMPLE_FILE.read_bytes()
+    file_hash = content_hash(data)
+
+    df = load_upload(data, "excel", file_hash)
+    with patch("mann_kendall.ui.cache.load_data") as mock_load:
+        assert load_upload(data, "excel", file_hash) is df
+        mock_load.assert_not_called()
+
+    results, transposed = analyze_upload(file_hash, df)
+    with patch("mann_kendall.ui.cache.generate_mann_kendall") as mock_generate:
+        assert analyze_upload(file_hash, df)[0] is results
+        mock_generate.assert_not_called()
+
+    assert isinstance(results, pd.DataFrame) and not results.empty
+    cache.clear_upload_cache()
+
+
+def test_get_export_builds_once_per_key_and_format():
+    """Exports are built on the first request and served from the cache afterwards."""
+    cache.clear_upload_cache()
+    calls = []
+
+    def build():
+        calls.append(1)
+        return b"data"
+
+    assert cache.get_export("results", "csv") is None
+    assert cache.get_export("results", "csv", build) == b"data"
+    assert cache.get_export("results", "csv", build) == b"data"
+    assert cache.get_export("results", "csv") == b"data"
+    assert len(calls) == 1
+    assert cache.get_export("results", "xlsx") is None
+    cache.clear_upload_cache()
+
+
+def test_results_hash_depends_on_content():
+    """Equal results hash equally; any changed value changes the hash."""
+    results = pd.DataFrame({"Well": ["W1", "W2"], "Trend": ["no trend", "increasing"]})
+    assert cache.results_hash(results) == cache.results_hash(results.copy())
+
+    changed = results.copy()
+    changed.loc[1, "Trend"] = "decreasing"
+    assert cache.results_hash(changed) != cache.results_hash(results)
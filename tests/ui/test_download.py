@@ -0,0 +1,40 @@
+"""Tests for download.py module."""
+
+import pandas as pd
+
+from mann_kendall.ui.download import create_summary_report, create_summary_statistics
+
+
+def _results():
+    return pd.DataFrame(
+        {
+            "Well": ["W2", "W1", "W1", "W2"],
+            "Analise": ["Nitrate", "Nitrate", "Chloride", "Chloride"],
+            "Trend": ["increasing", "no trend", "decreasing", "increasing"],
+            "Mann-Kendall Statistic (S)": [12.0, 1.0, -9.5, 8.0],
+            "Coefficient of Variation": [0.2, 0.3, 0.4, 0.5],
+            "Confidence Factor": [0.99, 0.5, 0.97, 0.96],
+        }
+    )
+
+
+def test_create_summary_report_sections():
+    """Significant wells list their trending components; components list trend counts."""
+    report = create_summary_report(_results())
+
+    assert "Increasing: 2 (50.0%)" in report
+    assert "WELLS WITH SIGNIFICANT TRENDS (2 wells)" in report
+    assert "\nW1:\n  - Chloride: decreasing (S=-9.50)\n" in report
+    assert "\nW2:\n  - Nitrate: increasing (S=12.00)\n  - Chloride: increasing (S=8.00)\n" in report
+    assert report.index("\nW1:") < report.index("\nW2:")
+    assert "\nNitrate:\n  - increasing: 1\n  - no trend: 1\n" in report
+
+
+def test_create_summary_statistics():
+    """Summary statistics report counts and ranges."""
+    summary = create_summary_statistics(_results()).set_index("Metric")["Value"]
+
+    assert summary["Total Tests"] == 4
+    assert summary["Unique Wells"] == 2
+    assert summary["Increasing Trends"] == "2 (50.0%)"
+    assert summary["Mann-Kendall Statistic Range"] == "-9.50 to 12.00"
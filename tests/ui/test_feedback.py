@@ -1,41 +1,117 @@
 """Tests for feedback.py module."""
 
 import logging
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
-from mann_kendall.ui.feedback import EMAIL_PLACEHOLDER, create_feedback_section
+import pytest
 
+from mann_kendall.ui.feedback import (
+    EMAIL_PLACEHOLDER,
+    FeedbackRejected,
+    FeedbackSender,
+    create_feedback_section,
+    formspree_endpoint,
+)
 
-@patch("mann_kendall.ui.feedback.requests.post")
-@patch("mann_kendall.ui.feedback.st")
-def test_empty_email_uses_placeholder(mock_st, mock_post):
-    """Ensure placeholder email is sent when user leaves email blank."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_post.return_value = mock_response
 
-    # Set up streamlit mocks for form context
+def _mock_form(mock_st, name="", email="", message="Test feedback message"):
+    """Set up streamlit mocks for a submitted feedback form."""
     mock_st.expander.return_value.__enter__ = MagicMock()
     mock_st.expander.return_value.__exit__ = MagicMock(return_value=False)
     mock_form = MagicMock()
     mock_st.form.return_value.__enter__ = MagicMock(return_value=mock_form)
     mock_st.form.return_value.__exit__ = MagicMock(return_value=False)
 
-    mock_st.text_input.side_effect = ["", ""]
+    mock_st.text_input.side_effect = [name, email]
     mock_st.selectbox.return_value = "General Feedback"
-    mock_st.text_area.return_value = "Test feedback message"
+    mock_st.text_area.return_value = message
     mock_st.form_submit_button.return_value = True
 
-    create_feedback_section()
 
-    assert mock_post.called, "Form submission should trigger Formspree request"
-    _, kwargs = mock_post.call_args
-    assert kwargs["data"]["email"] == EMAIL_PLACEHOLDER
+@patch("mann_kendall.ui.feedback.st")
+def test_empty_email_uses_placeholder(mock_st):
+    """Ensure placeholder email is sent when user leaves email blank."""
+    payloads = []
+    sender = FeedbackSender(endpoint=payloads.append)
+    _mock_form(mock_st)
+
+    create_feedback_section(sender=sender)
+    sender.join()
+
+    assert len(payloads) == 1, "Form submission should send the feedback"
+    assert payloads[0]["email"] == EMAIL_PLACEHOLDER
+    assert mock_st.success.called
+
+
+@patch("mann_kendall.ui.feedback.st")
+def test_submit_does_not_wait_for_endpoint(mock_st):
+    """A slow endpoint does not block the script run that submits feedback."""
+    release = threading.Event()
+    sender = FeedbackSender(endpoint=lambda payload: release.wait(5))
+    _mock_form(mock_st)
+
+    start = time.perf_counter()
+    create_feedback_section(sender=sender)
+    elapsed = time.perf_counter() - start
+    release.set()
+    sender.join()
+
+    assert elapsed < 1
+    assert sender.sent == 1
+
+
+def test_failed_send_is_retried():
+    """Transient failures are retried until the endpoint accepts the payload."""
+    attempts = []
+
+    def flaky_endpoint(payload):
+        attempts.append(payload)
+        if len(attempts) < 3:
+            raise ConnectionError("unreachable")
+
+    sender = FeedbackSender(endpoint=flaky_endpoint, max_attempts=4, retry_backoff=0)
+    sender.submit({"message": "hello"})
+    sender.join()
+
+    assert len(attempts) == 3
+    assert (sender.sent, sender.failed) == (1, 0)
+
+
+def test_rejected_send_is_not_retried():
+    """Payloads the endpoint rejects are dropped without retrying."""
+    endpoint = MagicMock(side_effect=FeedbackRejected("status 422"))
+    sender = FeedbackSender(endpoint=endpoint, max_attempts=4, retry_backoff=0)
+    sender.submit({"message": "hello"})
+    sender.join()
+
+    assert endpoint.call_count == 1
+    assert (sender.sent, sender.failed) == (0, 1)
 
 
-@patch("mann_kendall.ui.feedback.requests.post")
 @patch("mann_kendall.ui.feedback.st")
-def test_non_200_response_logs_error(mock_st, mock_post, caplog):
+def test_full_queue_refuses_submission(mock_st):
+    """The user is told when the bounded queue cannot take more feedback."""
+    release = threading.Event()
+    sender = FeedbackSender(endpoint=lambda payload: release.wait(5), max_queue_size=1)
+    sender.submit({"message": "first"})  # Taken by the worker
+    while sender._queue.qsize():
+        time.sleep(0.01)
+    assert sender.submit({"message": "second"})  # Waits in the queue
+    _mock_form(mock_st)
+
+    create_feedback_section(sender=sender)
+    release.set()
+    sender.join()
+
+    assert sender.sent == 2
+    error_calls = [str(call) for call in mock_st.error.call_args_list]
+    assert any("Too much feedback" in call for call in error_calls)
+
+
+@patch("requests.post")
+def test_non_200_response_logs_error(mock_post, caplog):
     """Test that non-200 Formspree response logs status code and body."""
     # Set up mock response with non-200 status
     mock_response = MagicMock()
@@ -43,20 +119,9 @@ def test_non_200_response_logs_error(mock_st, mock_post, caplog):
     mock_response.text = '{"error": "invalid email"}'
     mock_post.return_value = mock_response
 
-    # Set up streamlit mocks for form context
-    mock_st.expander.return_value.__enter__ = MagicMock()
-    mock_st.expander.return_value.__exit__ = MagicMock(return_value=False)
-    mock_form = MagicMock()
-    mock_st.form.return_value.__enter__ = MagicMock(return_value=mock_form)
-    mock_st.form.return_value.__exit__ = MagicMock(return_value=False)
-
-    mock_st.text_input.side_effect = ["Test User", "test@example.com"]
-    mock_st.selectbox.return_value = "General Feedback"
-    mock_st.text_area.return_value = "Test feedback message"
-    mock_st.form_submit_button.return_value = True
-
     with caplog.at_level(logging.ERROR, logger="mann_kendall"):
-        create_feedback_section()
+        with pytest.raises(FeedbackRejected) as excinfo:
+            formspree_endpoint({"message": "Test feedback message"})
 
     # Verify that error details were logged
     assert any("422" in record.message for record in caplog.records), (
@@ -65,12 +130,13 @@ def test_non_200_response_logs_error(mock_st, mock_post, caplog):
     assert any("invalid email" in record.message for record in caplog.records), (
         "Expected response body to be logged"
     )
+    assert "invalid email" not in str(excinfo.value)
 
-    # Verify user-facing error does NOT expose status code or technical details
-    error_calls = [str(call) for call in mock_st.error.call_args_list]
-    assert any("Failed to send feedback" in call for call in error_calls), (
-        "Expected generic error message shown to user"
-    )
-    assert all("422" not in call for call in error_calls), (
-        "Status code should NOT appear in user-facing error message"
-    )
+
+@patch("requests.post")
+def test_server_error_is_retryable(mock_post):
+    """Formspree server errors raise a retryable error rather than FeedbackRejected."""
+    mock_post.return_value = MagicMock(status_code=503, text="unavailable")
+
+    with pytest.raises(RuntimeError):
+        formspree_endpoint({"message": "Test feedback message"})
@@ -0,0 +1,63 @@
+"""Tests for jobs.py module."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from mann_kendall.core.constants import ANALYSIS_PREVIEW_ROWS
+from mann_kendall.ui import cache
+from mann_kendall.ui.cache import content_hash, is_analysis_cached, load_upload
+from mann_kendall.ui.jobs import CANCELLED, DONE, AnalysisJob, release_analysis, start_analysis
+
+EXAMPLE_FILE = Path(__file__).parent.parent / "files" / "example_input.xlsx"
+
+
+def _load_example():
+    data = EXAMPLE_FILE.read_bytes()
+    file_hash = content_hash(data)
+    return file_hash, load_upload(data, "excel", file_hash)
+
+
+def test_analysis_job_reports_progress_and_caches_results():
+    """A finished job exposes its results, final progress and caches the analysis."""
+    cache.clear_upload_cache()
+    file_hash, df = _load_example()
+
+    job = start_analysis(file_hash, df, "session-1")
+    job.join(timeout=60)
+
+    assert job.status == DONE
+    done, total = job.progress
+    assert done == total > 0
+    results, _ = job.result
+    assert job.result_count == len(results)
+    # The preview holds only the latest results
+    assert job.partial_results.equals(results.tail(ANALYSIS_PREVIEW_ROWS).reset_index(drop=True))
+    assert is_analysis_cached(file_hash)
+    cache.clear_upload_cache()
+
+
+def test_cancelled_job_is_not_cached():
+    """A job cancelled before finishing leaves nothing in the cache."""
+    cache.clear_upload_cache()
+    file_hash, df = _load_example()
+
+    job = AnalysisJob(file_hash, df)
+    job.cancel()  # Cancelled before its first well
+    job.start()
+    job.join(timeout=60)
+
+    assert job.status == CANCELLED
+    assert not is_analysis_cached(file_hash)
+
+
+def test_release_analysis_cancels_only_when_unwatched():
+    """A shared job keeps running until its last watcher releases it."""
+    job = AnalysisJob("hash", pd.DataFrame())
+    job.watchers.update({"session-1", "session-2"})
+
+    release_analysis(job, "session-1")
+    assert not job._cancel_event.is_set()
+
+    release_analysis(job, "session-2")
+    assert job._cancel_event.is_set()
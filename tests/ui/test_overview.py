@@ -0,0 +1,37 @@
+"""Tests for overview.py module."""
+
+import numpy as np
+import pandas as pd
+
+from mann_kendall.core.result_set import MKResultSet
+from mann_kendall.ui.overview import MISSING_SCORE, trend_matrix, trend_score
+
+
+def test_trend_score():
+    """Scores are signed by direction and halved for probable trends."""
+    assert trend_score("increasing") == 2
+    assert trend_score("probably decreasing") == -1
+    assert trend_score("seasonal decreasing") == -2
+    assert trend_score("no trend") == trend_score("stable") == 0
+
+
+def test_trend_matrix():
+    """Each result fills its (well, component) cell; other cells are marked missing."""
+    results = pd.DataFrame(
+        {
+            "Well": ["W2", "W1", "W1"],
+            "Analise": ["Nitrate", "Nitrate", "Chloride"],
+            "Trend": ["increasing", "no trend", "probably decreasing"],
+            "Mann-Kendall Statistic (S)": [12.0, 1.0, -9.5],
+            "Coefficient of Variation": [0.2, 0.3, 0.4],
+            "Confidence Factor": [0.99, 0.5, 0.93],
+        }
+    )
+
+    scores, confidence = trend_matrix(MKResultSet.from_frame(results))
+
+    # Rows W1, W2; columns Chloride, Nitrate
+    assert scores.dtype == np.int8
+    assert scores.tolist() == [[-1, 0], [MISSING_SCORE, 2]]
+    assert np.isnan(confidence[1, 0])
+    assert confidence[1, 1] == np.float32(0.99)
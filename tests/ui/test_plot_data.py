@@ -0,0 +1,72 @@
+"""Tests for plot_data.py module."""
+
+import numpy as np
+import pandas as pd
+
+from mann_kendall.ui.plot_data import PlotDataStore, downsample_frame, lttb_indices
+from mann_kendall.ui.visualizer import filter_well_component
+
+
+def _transposed():
+    return pd.DataFrame(
+        {
+            "well": ["W2", "W1", "W2", "W1", "W2"],
+            "Date": pd.to_datetime(["2021-03-01", "2021-02-01", "2021-01-01", "2021-01-01", "2021-02-01"]),
+            "Nitrate": ["3.0", "<0.5", 1.0, np.nan, "2"],
+            "Chloride": [10.0, 11.0, 12.0, 13.0, 14.0],
+        }
+    )
+
+
+def test_series_sorted_and_converted():
+    """Series are sorted by date, parsed like the analysis and skip missing values."""
+    store = PlotDataStore.from_transposed(_transposed())
+
+    dates, values = store.series("W2", "Nitrate")
+    assert values.tolist() == [1.0, 2.0, 3.0]
+    assert list(dates) == sorted(dates)
+    assert store.series("W1", "Nitrate")[1].tolist() == [0.5]
+    assert len(store.series("missing", "Nitrate")[1]) == 0
+
+
+def test_frame_matches_filter_well_component():
+    """Gathering a selection gives the same points as filtering the transposed frame."""
+    df = _transposed()
+    df["Nitrate"] = df["Nitrate"].replace("<0.5", 0.5)
+    store = PlotDataStore.from_transposed(df)
+
+    gathered = store.frame(["W1", "W2"], "Chloride")
+    filtered = filter_well_component(df, ["W1", "W2"], "Chloride")
+    expected = filtered.sort_values(["well", "Date"], kind="stable").reset_index(drop=True)
+    pd.testing.assert_frame_equal(gathered, expected, check_dtype=False)
+
+
+def test_lttb_keeps_end_points_and_peaks():
+    """Downsampling keeps the first and last points and isolated extremes."""
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[437] = 50.0
+    y[702] = -20.0
+
+    selected = lttb_indices(x, y, 50)
+    assert len(selected) == 50
+    assert selected[0] == 0 and selected[-1] == 999
+    assert {437, 702} <= set(selected.tolist())
+    assert np.all(np.diff(selected) > 0)
+
+
+def test_downsample_frame_per_well():
+    """Only series longer than the limit are reduced; grouping and order are preserved."""
+    dates = pd.date_range("2000-01-01", periods=300, freq="D")
+    df = pd.DataFrame(
+        {
+            "well": ["W1"] * 300 + ["W2"] * 10,
+            "Date": list(dates) + list(dates[:10]),
+            "Nitrate": np.sin(np.arange(310) / 10.0),
+        }
+    )
+
+    reduced = downsample_frame(df, "Nitrate", 100)
+    assert reduced.groupby("well").size().to_dict() == {"W1": 100, "W2": 10}
+    assert reduced.index.is_monotonic_increasing
+    assert downsample_frame(df, "Nitrate", 300) is df
@@ -3,11 +3,14 @@
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import plotly.graph_objects as go
 
 from mann_kendall.ui.visualizer import (
+    add_sens_slope_lines,
     choose_log_scale,
     create_trend_plot,
     filter_well_component,
+    trend_symbol,
 )
 
 
@@ -137,3 +140,31 @@ def test_create_trend_plot_linear_scale(
 
     # Verify title contains linear scale
     assert "linear scale" in kwargs["title"]
+
+
+def test_trend_symbol():
+    """Probable trends share the symbol of their direction."""
+    assert trend_symbol("increasing") == trend_symbol("probably increasing") == "📈"
+    assert trend_symbol("probably decreasing") == "📉"
+    assert trend_symbol("no trend") == "➡️"
+
+
+def test_add_sens_slope_lines():
+    """Each plotted well with results gets its stored trend line at its sample dates."""
+    df_filtered = pd.DataFrame(
+        {
+            "well": ["Well1"] * 3 + ["Well2"] * 2,
+            "Date": pd.to_datetime(["2020-01-01", "2020-02-01", "2020-03-01", "2020-01-01", "2020-02-01"]),
+            "Component1": [1.0, 3.0, 5.0, 7.0, 8.0],
+        }
+    )
+    component_results = pd.DataFrame(
+        {"Trend": ["increasing"], "Sen's Slope": [2.0], "Sen's Intercept": [1.0]}, index=pd.Index(["Well1"], name="Well")
+    )
+    fig = go.Figure()
+
+    add_sens_slope_lines(fig, df_filtered, component_results, "Component1", log_scale=False)
+
+    assert len(fig.data) == 1
+    assert list(fig.data[0].y) == [1.0, 3.0, 5.0]
+    assert len(fig.data[0].x) == 3
@@ -0,0 +1,31 @@
+"""Tests for well_selector.py module."""
+
+from mann_kendall.ui.well_selector import WellIndex
+
+
+def test_search_prefix_then_substring():
+    """Prefix matches come first (case-insensitive), then other wells containing the query."""
+    index = WellIndex(["pz-mw1", "MW-02", "MW-01", "PZ-10", "MW-01"])
+
+    assert len(index) == 4
+    assert index.search("mw") == ["MW-01", "MW-02", "pz-mw1"]
+    assert index.search("10") == ["PZ-10"]
+    assert index.search("xyz") == []
+
+
+def test_search_limit_and_empty_query():
+    """An empty query lists wells in order; limit caps the number of matches."""
+    index = WellIndex([f"MW-{i:03d}" for i in range(500)])
+
+    assert index.search("", limit=3) == ["MW-000", "MW-001", "MW-002"]
+    assert index.search("mw-1", limit=5) == ["MW-100", "MW-101", "MW-102", "MW-103", "MW-104"]
+    assert "MW-499" in index and "MW-500" not in index
+
+
+def test_numeric_well_names_keep_their_type():
+    """Numeric well headers are searched as text but returned as the original values."""
+    index = WellIndex([101, 12, 1010, 101])
+
+    assert index.wells == [12, 101, 1010]
+    assert 101 in index and "101" not in index
+    assert index.search("101") == [101, 1010]